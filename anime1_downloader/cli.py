@@ -1,22 +1,36 @@
 # edited from: https://github.com/SodaWithoutSparkles/anime1.me-dl
 import argparse
+import asyncio
 import concurrent.futures
 import json
 import logging
 import os
+import re
+import signal
+import threading
+import time
 from pathlib import Path
+from urllib.parse import unquote, urljoin
 
 import requests
 from bs4 import BeautifulSoup
 
 from logger_setup import get_logger
+from utils.history_store import HistoryStore, HistoryWriter
 
 from .config import AnimeDownloaderConfig
-from .history import append_to_history, create_history_entry, load_history
+from .history import create_history_entry, open_history
+from .http_client import PooledHTTPClient
+from .journal import JobJournal, token_expiry
+from .resolver import resolve_all
+from .scheduler import DownloadScheduler, parse_rate
 
 # Setup project-wide logger
 logger = get_logger(__name__, "anime1_downloader")
 
+# Page number in WordPress listing URLs: /page/2/ or ?paged=2
+_PAGE_RE = re.compile(r"(/page/|[?&]paged=)(\d+)")
+
 
 class Anime1Downloader:
     """A class to download videos from anime1.me."""
@@ -25,7 +39,18 @@ class Anime1Downloader:
         """Initialize the downloader with command-line arguments."""
         self.args = args
         self.downloaded_titles: set[str] = set()
+        self._titles_lock = threading.Lock()  # download threads add to downloaded_titles
+        self.journal: JobJournal | None = None
         self.history_path = Path(args.history) if args.history else None
+        self.history: HistoryStore | None = None
+        self.history_writer: HistoryWriter | None = None
+        # Only page fetches and API calls go through the pool; yt-dlp has its own
+        self.http = PooledHTTPClient(pool_size=max(args.resolve_jobs, args.crawl_jobs))
+        self.scheduler = DownloadScheduler(
+            max_fragments=args.max_fragments,
+            max_rate=args.max_rate,
+            slots=args.max_concurrent_downloads,
+        )
 
     def _merge_lists(self, list1, list2):
         """
@@ -34,6 +59,33 @@ class Anime1Downloader:
         """
         return list(map(lambda x, y: (x, y), list1, list2))
 
+    def _check_cloudflare_args(self) -> bool:
+        """Check that User-Agent and cf_clearance are given together (or not at all)."""
+        if self.args.user_agent and self.args.cloudflare:
+            return True
+        if self.args.user_agent or self.args.cloudflare:
+            logger.error("Cloudflare detection requires both User-Agent and cf_clearance")
+            logger.error("Using only one may not bypass detection")
+            return False
+        logger.warning("User-Agent and cf_clearance are missing, Cloudflare may block the request")
+        return True
+
+    def _fetch_page(self, url):
+        """
+        Fetches an anime1.me page with the Cloudflare User-Agent and cookie,
+        returning its HTML, or None if Cloudflare blocked the request.
+        """
+        headers = {"User-Agent": self.args.user_agent} if self.args.user_agent else {}
+        cookies = {"cf_clearance": self.args.cloudflare} if self.args.cloudflare else {}
+
+        with self.http.session() as session:
+            resp = session.get(url, headers=headers, cookies=cookies)
+
+        if resp.status_code == 403:
+            logger.error("Fatal: Blocked by Cloudflare")
+            return None
+        return resp.text
+
     def _extract_api_path(self):
         """
         Extracts video titles and corresponding API request data (data-apireq)
@@ -42,28 +94,14 @@ class Anime1Downloader:
         video_class = "video-js"
         title_class = "entry-title"
 
-        headers = {"User-Agent": self.args.user_agent} if self.args.user_agent else {}
-        cookies = {"cf_clearance": self.args.cloudflare} if self.args.cloudflare else {}
-
-        session = requests.Session()
-
-        if self.args.user_agent and self.args.cloudflare:
-            resp = session.get(self.args.url, headers=headers, cookies=cookies)
-        elif self.args.user_agent or self.args.cloudflare:
-            logger.error("Cloudflare detection requires both User-Agent and cf_clearance")
-            logger.error("Using only one may not bypass detection")
+        if not self._check_cloudflare_args():
             return None
-        else:
-            logger.warning(
-                "User-Agent and cf_clearance are missing, Cloudflare may block the request"
-            )
-            resp = session.get(self.args.url)
 
-        if resp.status_code == 403:
-            logger.error("Fatal: Blocked by Cloudflare")
+        html = self._fetch_page(self.args.url)
+        if html is None:
             return None
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        soup = BeautifulSoup(html, "lxml")
 
         list_of_titles = soup.find_all(attrs={"class": title_class})
         list_of_videos = soup.find_all(attrs={"class": video_class})
@@ -95,19 +133,96 @@ class Anime1Downloader:
 
         return merged
 
+    def _crawl_category(self):
+        """
+        Crawls a category URL: discovers every listing page, fetches them
+        concurrently and returns (title, data-apireq) pairs for all episodes,
+        deduplicated by title in page order.
+        """
+        if not self._check_cloudflare_args():
+            return None
+
+        html = self._fetch_page(self.args.url)
+        if html is None:
+            return None
+
+        soup = BeautifulSoup(html, "lxml")
+        episodes_by_page = {1: _parse_articles(soup)}
+        known_pages = _page_links(soup, self.args.url)
+        scheduled = {1}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.args.crawl_jobs, thread_name_prefix="crawl"
+        ) as executor:
+            futures = {}
+
+            def schedule():
+                for number, url in _fill_page_gaps(known_pages).items():
+                    if number not in scheduled and number <= self.args.max_pages:
+                        scheduled.add(number)
+                        futures[executor.submit(self._fetch_page, url)] = (number, url)
+
+            schedule()
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    number, url = futures.pop(future)
+                    try:
+                        html = future.result()
+                    except requests.RequestException as e:
+                        logger.warning("Failed to fetch page %d (%s): %s", number, url, e)
+                        continue
+                    if html is None:
+                        continue
+                    soup = BeautifulSoup(html, "lxml")
+                    episodes_by_page[number] = _parse_articles(soup)
+                    known_pages.update(_page_links(soup, url))
+                schedule()
+
+        seen = set()
+        episodes = []
+        for number in sorted(episodes_by_page):
+            for title, data_apireq in episodes_by_page[number]:
+                if title not in seen:
+                    seen.add(title)
+                    episodes.append((title, data_apireq))
+
+        logger.info("Crawled %d pages, found %d episodes", len(episodes_by_page), len(episodes))
+        for title, data_apireq in episodes:
+            logger.info("Title: %s", title)
+            logger.debug("- data-apireq: %s", data_apireq)
+        return episodes
+
+    def _skip_downloaded(self, videos):
+        """Drops episodes already in history (unless --force) before any API call."""
+        if not self.history_path or self.args.force:
+            return videos
+
+        pending = []
+        for video in videos:
+            if self._is_downloaded(video[0]):
+                logger.info("[%-20s] Already downloaded, skipping", video[0])
+            else:
+                pending.append(video)
+        return pending
+
     def _get_source(self, video_data_apireq):
         """
         Fetches the actual video stream URL and associated cookies from the
         anime1.me API based on data-apireq.
         """
         data_raw = "d=" + video_data_apireq
-        session = requests.Session()
 
-        response = session.post(
-            "https://v.anime1.me/api",
-            data=data_raw,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+        # A fresh session per episode keeps its e/h/p cookies to itself
+        with self.http.session() as session:
+            response = session.post(
+                "https://v.anime1.me/api",
+                data=data_raw,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            cookies = session.cookies.get_dict()
 
         try:
             response.raise_for_status()
@@ -125,7 +240,7 @@ class Anime1Downloader:
             logger.debug("Source: https:%s", str(result["s"][0]["src"]))
         except Exception:
             logger.debug("Source unknown, raw API response: %s", response.content.decode("utf-8"))
-        logger.debug("cookie: %s", session.cookies.get_dict())
+        logger.debug("cookie: %s", cookies)
         logger.debug("raw API response: %s", response.content.decode("utf-8"))
 
         try:
@@ -134,10 +249,13 @@ class Anime1Downloader:
             logger.error("Failed to parse source: %s; response: %s", e, result)
             raise
 
-        return src, session.cookies.get_dict()
+        return src, cookies
 
     def _download_video(self, src, cookie, title, anime_series_name):
-        """Downloads a video using the yt-dlp library."""
+        """
+        Downloads a video using the yt-dlp library, within this episode's share
+        of the global fragment and bandwidth budget.
+        """
         import yt_dlp
 
         src = "https:" + src
@@ -157,52 +275,129 @@ class Anime1Downloader:
         final_output_dir = os.path.join(self.args.output_dir, anime_series_name)
         os.makedirs(final_output_dir, exist_ok=True)
 
-        ydl_opts = {
-            "concurrent_fragment_downloads": 32,
-            "http_headers": yt_dlp_cookie_dict,
-            "verbose": logger.isEnabledFor(logging.DEBUG),
-            "outtmpl": title + ".%(ext)s",
-            "paths": {"home": final_output_dir},
-        }
+        with self.scheduler.lease() as fragments:
+            ydl_opts = {
+                "concurrent_fragment_downloads": fragments,
+                "http_headers": yt_dlp_cookie_dict,
+                "progress_hooks": [self.scheduler.progress_hook(), *self._journal_hooks(title)],
+                "continuedl": True,
+                "verbose": logger.isEnabledFor(logging.DEBUG),
+                "outtmpl": title + ".%(ext)s",
+                "paths": {"home": final_output_dir},
+            }
+
+            logger.debug("yt-dlp options: %s", ydl_opts)
+            logger.info(
+                "Passing info for '%s' to yt-dlp for download (%d fragment connections)...",
+                title,
+                fragments,
+            )
 
-        logger.debug("yt-dlp options: %s", ydl_opts)
-        logger.info("Passing info for '%s' to yt-dlp for download...", title)
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                ydl.download([src])
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([src])
+    def _journal_hooks(self, title):
+        """yt-dlp progress hooks that checkpoint this episode in the journal, if any."""
+        return [self.journal.progress_hook(title)] if self.journal else []
 
-    def _process_single_episode(self, video_tuple, anime_series_name):
-        """
-        Processes a single video entry (gets source and potentially downloads),
-        runs in a thread pool.
+    def _download_episode(self, title, data_apireq, src, cookie, anime_series_name):
+        """Downloads one resolved episode and records it in history, runs in the download pool.
+
+        The source may have waited in the queue behind long downloads, so its
+        token is checked again and the episode re-resolved if it is about to expire.
         """
-        title, data_apireq = video_tuple
+        try:
+            output_path = os.path.join(self.args.output_dir, anime_series_name, title)
+            if token_expiry(cookie) <= time.time() + AnimeDownloaderConfig.TOKEN_MARGIN:
+                logger.info("[%-20s] Source token expires soon, resolving again", title)
+                src, cookie = self._get_source(data_apireq)
+                if self.journal:
+                    self.journal.resolved(title, src, cookie, output_path)
+
+            self._download_video(src, cookie, title, anime_series_name)
+            logger.info("[%-20s] Download complete", title)
+
+            # Record to history before the journal, so a finished job is never missing from both
+            self._record_downloaded(title, anime_series_name, output_path)
+            if self.journal:
+                self.journal.finished(title)
+        except Exception:
+            logger.exception("Failed to download '%s'", title)
+
+    def _is_downloaded(self, title):
+        """Whether title is in history, safe to call from any thread."""
+        with self._titles_lock:
+            return title in self.downloaded_titles
 
-        # Check if already downloaded (skip unless --force)
-        if self.history_path and not self.args.force and title in self.downloaded_titles:
-            logger.info("[%-20s] Already downloaded, skipping", title)
+    def _record_downloaded(self, title, anime_series_name, output_path):
+        """Queues a history entry for the writer thread, safe to call from any thread.
+
+        A title already in history is recorded again only for --force re-downloads.
+        """
+        if not self.history_writer:
             return
+        with self._titles_lock:
+            if title in self.downloaded_titles and not self.args.force:
+                return
+            self.downloaded_titles.add(title)
+        self.history_writer.put(
+            create_history_entry(
+                title=title,
+                anime_series=anime_series_name,
+                url=self.args.url,
+                output_path=output_path,
+            )
+        )
+        logger.debug("[%-20s] Added to history", title)
+
+    def _resume_from_journal(self, videos, anime_series_name):
+        """Drops episodes the journal records as finished and reports partial downloads."""
+        if not self.args.resume:
+            return videos
+
+        pending = []
+        for title, data_apireq in videos:
+            if self.journal.is_finished(title) and not self.args.force:
+                logger.info("[%-20s] Finished in the interrupted run, skipping", title)
+                # The run may have died before its history batch was written
+                output_path = self.journal.jobs[title].get("output_path", "")
+                self._record_downloaded(title, anime_series_name, output_path)
+                continue
+            pending.append((title, data_apireq))
+
+            part = self.journal.jobs.get(title, {}).get("tmpfilename")
+            if part and os.path.exists(part):
+                logger.info(
+                    "[%-20s] Resuming from %.1f MiB in %s",
+                    title,
+                    os.path.getsize(part) / 1024 / 1024,
+                    part,
+                )
+        return pending
 
-        try:
-            logger.info("[%-20s] Start processing", title)
-            src, cookie = self._get_source(data_apireq)
-            if not self.args.extract:
-                self._download_video(src, cookie, title, anime_series_name)
-                logger.info("[%-20s] Download complete", title)
-
-                # Record to history
-                if self.history_path:
-                    output_path = os.path.join(self.args.output_dir, anime_series_name, title)
-                    entry = create_history_entry(
-                        title=title,
-                        anime_series=anime_series_name,
-                        url=self.args.url,
-                        output_path=output_path,
-                    )
-                    append_to_history(self.history_path, entry)
-                    self.downloaded_titles.add(title)
-                    logger.debug("[%-20s] Added to history", title)
-            else:
+    async def _resolve_episodes(self, videos, anime_series_name, executor):
+        """
+        Resolves every episode's data-apireq concurrently and hands each one to
+        the download pool as soon as its source is known. Returns the download
+        futures.
+        """
+        downloads = []
+        async for (title, data_apireq), source, error in resolve_all(
+            videos,
+            lambda video: self._get_source(video[1]),
+            concurrency=self.args.resolve_jobs,
+            rate=self.args.resolve_rate,
+        ):
+            if error is not None:
+                logger.error("Failed to resolve '%s'", title, exc_info=error)
+                self.scheduler.cancel()
+                continue
+
+            src, cookie = source
+            if self.journal:
+                output_path = os.path.join(self.args.output_dir, anime_series_name, title)
+                self.journal.resolved(title, src, cookie, output_path)
+            if self.args.extract:
                 logger.info("[%-20s] Information extracted", title)
                 logger.info(" - Source URL: https:%s", src)
                 logger.info(" - Cookie: %s", cookie)
@@ -210,21 +405,45 @@ class Anime1Downloader:
                     self.args.output_dir, anime_series_name, title + "."
                 )
                 logger.info(" - Expected output path: %s", expected_full_path)
-        except Exception:
-            logger.exception("Failed to process '%s'", title)
+            else:
+                logger.info("[%-20s] Source resolved, queued for download", title)
+                downloads.append(
+                    executor.submit(
+                        self._download_episode,
+                        title,
+                        data_apireq,
+                        src,
+                        cookie,
+                        anime_series_name,
+                    )
+                )
+        return downloads
 
     def run(self):
         """Main execution method for the downloader."""
+        try:
+            self._run()
+        finally:
+            self.http.close()
+            # Writes whatever is still queued, also on Ctrl+C or SIGTERM
+            if self.history_writer:
+                self.history_writer.close()
+            if self.history:
+                self.history.close()
+
+    def _run(self):
         logger.info("Extracting information from %s", self.args.url)
 
-        # Load history if enabled
+        # Load history if enabled; the store stays open so appends reuse its index
         if self.history_path:
             logger.info("Loading download history from %s", self.history_path)
-            self.downloaded_titles = load_history(self.history_path)
+            self.history = open_history(self.history_path)
+            self.history_writer = HistoryWriter(self.history)
+            self.downloaded_titles = self.history.keys()
             if self.downloaded_titles:
                 logger.info("Found %d previously downloaded episodes", len(self.downloaded_titles))
 
-        videos = self._extract_api_path()
+        videos = self._crawl_category() if self.args.crawl else self._extract_api_path()
         if not videos:
             logger.error("No videos found on the page. Cannot continue.")
             return
@@ -240,24 +459,102 @@ class Anime1Downloader:
         logger.info(
             "Using output directory: '%s'", os.path.join(self.args.output_dir, anime_series_name)
         )
+        videos = self._skip_downloaded(videos)
+        if not self.args.extract:
+            self.journal = JobJournal.open(
+                Path(self.args.output_dir) / anime_series_name / AnimeDownloaderConfig.JOURNAL_NAME,
+                resume=self.args.resume,
+            )
+            videos = self._resume_from_journal(videos, anime_series_name)
         logger.info("Max concurrent downloads: %d", self.args.max_concurrent_downloads)
+        logger.info(
+            "Download budget: %d fragment connections, %s",
+            self.args.max_fragments,
+            f"{self.args.max_rate / 1024 / 1024:.1f} MiB/s"
+            if self.args.max_rate
+            else "no rate limit",
+        )
         if self.history_path:
             logger.info("History file: %s", self.history_path)
         logger.info("_")
 
+        # Stage 1 resolves every source in seconds; stage 2 downloads them
+        # on its own pool, so API calls never wait behind a download
+        if not self.args.extract:
+            self.scheduler.expect(len(videos))
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=self.args.max_concurrent_downloads, thread_name_prefix="dl"
         ) as executor:
-            futures = [
-                executor.submit(self._process_single_episode, video, anime_series_name)
-                for video in videos
-            ]
+            # Sources still valid in the journal skip the API entirely
+            futures, to_resolve = [], []
+            for video in videos:
+                source = self.journal.reusable_source(video[0]) if self.journal else None
+                if source:
+                    logger.info("[%-20s] Reusing source from journal", video[0])
+                    futures.append(
+                        executor.submit(self._download_episode, *video, *source, anime_series_name)
+                    )
+                else:
+                    to_resolve.append(video)
+            futures += asyncio.run(self._resolve_episodes(to_resolve, anime_series_name, executor))
 
             for future in concurrent.futures.as_completed(futures):
                 try:
                     future.result()
                 except Exception:
-                    logger.exception("An unhandled exception occurred in a video processing task")
+                    logger.exception("An unhandled exception occurred in a download task")
+
+        if self.history_writer:
+            self.history_writer.flush()
+        if self.journal and not self.journal.pending():
+            self.journal.remove()
+
+
+def _parse_articles(soup):
+    """
+    Pairs each post's entry-title with its video-js data-apireq on a listing
+    page. Posts without a video (e.g. announcements) are skipped.
+    """
+    episodes = []
+    for article in soup.find_all("article"):
+        title_tag = article.find(attrs={"class": "entry-title"})
+        video_tag = article.find(attrs={"class": "video-js", "data-apireq": True})
+        if title_tag and video_tag:
+            episodes.append((title_tag.get_text(), video_tag.get("data-apireq")))
+    return episodes
+
+
+def _listing_base(url):
+    """Returns a listing URL without its page number, for comparing listings."""
+    return unquote(_PAGE_RE.sub("", url)).rstrip("/")
+
+
+def _page_links(soup, page_url):
+    """Finds links to other pages of the same listing as {page number: url}."""
+    base = _listing_base(page_url)
+    pages = {}
+    for link in soup.find_all("a", href=True):
+        href = urljoin(page_url, link["href"])
+        match = _PAGE_RE.search(href)
+        if match and _listing_base(href) == base:
+            pages[int(match.group(2))] = href
+    return pages
+
+
+def _fill_page_gaps(pages):
+    """
+    Adds URLs for page numbers skipped by the pagination widget (e.g. "1 2 … 9"),
+    built from the pattern of a known page link.
+    """
+    if not pages:
+        return pages
+    template = next(iter(pages.values()))
+    filled = {
+        number: _PAGE_RE.sub(lambda m, n=number: f"{m.group(1)}{n}", template)
+        for number in range(2, max(pages) + 1)
+    }
+    filled.update(pages)
+    return filled
 
 
 def create_parser():
@@ -271,6 +568,23 @@ def create_parser():
         "url",
         help="A direct URL to an anime1.me page, e.g., https://anime1.me/18305\nYou may need to wrap this in quotes",
     )
+    parser.add_argument(
+        "--crawl",
+        action="store_true",
+        help="Treat the URL as a category listing: crawl all of its pages and\ndownload every episode found",
+    )
+    parser.add_argument(
+        "--crawl-jobs",
+        type=int,
+        default=AnimeDownloaderConfig.CRAWL_CONCURRENCY,
+        help=f"Listing pages fetched concurrently in --crawl mode. Default is {AnimeDownloaderConfig.CRAWL_CONCURRENCY}.",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=AnimeDownloaderConfig.CRAWL_MAX_PAGES,
+        help=f"Maximum listing pages to crawl. Default is {AnimeDownloaderConfig.CRAWL_MAX_PAGES}.",
+    )
     parser.add_argument(
         "-x", "--extract", action="store_true", help="Only extract URLs, do not download"
     )
@@ -295,12 +609,42 @@ def create_parser():
         default=AnimeDownloaderConfig.MAX_CONCURRENT_DOWNLOADS,
         help=f"Maximum number of concurrent video downloads. Default is {AnimeDownloaderConfig.MAX_CONCURRENT_DOWNLOADS}.",
     )
+    parser.add_argument(
+        "--max-fragments",
+        type=int,
+        default=AnimeDownloaderConfig.MAX_FRAGMENTS,
+        help=f"Total concurrent fragment connections shared by all downloads. Default is {AnimeDownloaderConfig.MAX_FRAGMENTS}.",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=parse_rate,
+        default=AnimeDownloaderConfig.MAX_RATE,
+        help=f"Total download speed shared by all downloads, e.g. 500K or 10M (0 for no limit). Default is {AnimeDownloaderConfig.MAX_RATE}.",
+        metavar="RATE",
+    )
+    parser.add_argument(
+        "--resolve-jobs",
+        type=int,
+        default=AnimeDownloaderConfig.RESOLVE_CONCURRENCY,
+        help=f"Maximum concurrent API requests resolving video sources. Default is {AnimeDownloaderConfig.RESOLVE_CONCURRENCY}.",
+    )
+    parser.add_argument(
+        "--resolve-rate",
+        type=float,
+        default=AnimeDownloaderConfig.RESOLVE_RATE,
+        help=f"Maximum API requests started per second (0 for no limit). Default is {AnimeDownloaderConfig.RESOLVE_RATE:g}.",
+    )
     parser.add_argument(
         "--history",
         help=f"Path to JSONL history file for tracking downloads. Default: {AnimeDownloaderConfig.DEFAULT_HISTORY_FILE}",
         default=AnimeDownloaderConfig.DEFAULT_HISTORY_FILE,
         metavar="FILE",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its journal: skip finished episodes,\nreuse .part files and unexpired sources",
+    )
     parser.add_argument(
         "--force",
         action="store_true",
@@ -309,10 +653,16 @@ def create_parser():
     return parser
 
 
+def _exit_on_signal(signum, frame):
+    """Turns SIGTERM into SystemExit so run() flushes history before exiting."""
+    raise SystemExit(128 + signum)
+
+
 def main():
     """Main entry point for the script."""
     parser = create_parser()
     args = parser.parse_args()
+    signal.signal(signal.SIGTERM, _exit_on_signal)
     try:
         downloader = Anime1Downloader(args)
         downloader.run()
@@ -13,3 +13,24 @@ class AnimeDownloaderConfig:
     DOWNLOAD_DIR = os.getenv("ANIME1_DOWNLOAD_DIR", "anime")
     MAX_CONCURRENT_DOWNLOADS = int(os.getenv("ANIME1_MAX_CONCURRENT_DOWNLOADS", 4))
     DEFAULT_HISTORY_FILE = os.getenv("ANIME1_HISTORY_FILE", "anime_downloaded.jsonl")
+
+    # Category crawl: listing pages fetched at once, and the most pages followed
+    CRAWL_CONCURRENCY = int(os.getenv("ANIME1_CRAWL_CONCURRENCY", 4))
+    CRAWL_MAX_PAGES = int(os.getenv("ANIME1_CRAWL_MAX_PAGES", 50))
+
+    # Download budget shared by all episodes: fragment connections, and bytes/sec (0 = no limit)
+    MAX_FRAGMENTS = int(os.getenv("ANIME1_MAX_FRAGMENTS", 32))
+    MAX_RATE = os.getenv("ANIME1_MAX_RATE", "0")
+
+    # Resume journal kept in the series directory, its progress checkpoint interval (s),
+    # and how long (s) a journaled API token must stay valid to be reused
+    JOURNAL_NAME = ".anime1_journal.jsonl"
+    JOURNAL_PROGRESS_INTERVAL = 5.0
+    TOKEN_MARGIN = int(os.getenv("ANIME1_TOKEN_MARGIN", 600))
+
+    # API resolution: data-apireq lookups in flight at once, and started per second
+    RESOLVE_CONCURRENCY = int(os.getenv("ANIME1_RESOLVE_CONCURRENCY", 8))
+    RESOLVE_RATE = float(os.getenv("ANIME1_RESOLVE_RATE", 5))
+
+    # Hosts whose keep-alive connection pools are kept (anime1.me, v.anime1.me, ...)
+    HTTP_POOL_HOSTS = int(os.getenv("ANIME1_HTTP_POOL_HOSTS", 4))
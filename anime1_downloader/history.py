@@ -1,15 +1,15 @@
 """Download history management for anime1_downloader.
 
 This module provides functions for tracking downloaded anime episodes
-in a JSONL (JSON Lines) format file.
+in a JSONL (JSON Lines) format file, indexed by utils.history_store.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from logger_setup import get_logger
+from utils.history_store import HistoryStore
 
 logger = get_logger(__name__, "anime1_downloader")
 
@@ -26,22 +26,21 @@ def load_history(history_path: Path) -> set[str]:
     Returns:
         Set of episode titles that have been downloaded
     """
-    downloaded_titles = set()
-
     if not history_path.exists():
-        return downloaded_titles
+        return set()
 
     try:
-        with open(history_path, encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    entry = json.loads(line)
-                    # Use title as unique identifier
-                    downloaded_titles.add(entry.get("title", ""))
+        # Use title as unique identifier
+        with open_history(history_path) as store:
+            return store.keys()
     except Exception as e:
         logger.warning(f"Error loading history file: {e}")
+        return set()
+
 
-    return downloaded_titles
+def open_history(history_path: Path) -> HistoryStore:
+    """Open the indexed history store for a JSONL history file, keyed by title."""
+    return HistoryStore(history_path, key="title")
 
 
 def append_to_history(history_path: Path, entry: dict) -> None:
@@ -51,12 +50,9 @@ def append_to_history(history_path: Path, entry: dict) -> None:
         history_path: Path to JSONL history file
         entry: Dictionary containing download metadata
     """
-    # Ensure directory exists
-    history_path.parent.mkdir(parents=True, exist_ok=True)
-
     try:
-        with open(history_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        with open_history(history_path) as store:
+            store.append(entry)
     except Exception as e:
         logger.error(f"Failed to write to history file: {e}")
 
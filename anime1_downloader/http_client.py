@@ -0,0 +1,50 @@
+"""Pooled HTTP client shared by all anime1.me requests in a run."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import AnimeDownloaderConfig
+
+
+class PooledHTTPClient:
+    """Thread-safe HTTP client that reuses keep-alive connections across episodes.
+
+    A single HTTPAdapter (and so a single urllib3 pool per host) is mounted on
+    every session the client hands out, so episodes after the first skip the
+    TCP+TLS handshake to anime1.me and v.anime1.me. Each session still has its
+    own cookie jar: the e/h/p cookies the API sets for one episode are never
+    sent with another episode's requests.
+    """
+
+    def __init__(self, pool_size: int = AnimeDownloaderConfig.MAX_CONCURRENT_DOWNLOADS):
+        """
+        Args:
+            pool_size: Connections kept alive per host; match it to the number
+                of threads making requests concurrently
+        """
+        self.pool_size = pool_size
+        self._adapter = HTTPAdapter(
+            pool_connections=AnimeDownloaderConfig.HTTP_POOL_HOSTS, pool_maxsize=pool_size
+        )
+
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """Yield a fresh session with an empty cookie jar on the shared pool.
+
+        The session is not closed on exit, since closing a Session closes its
+        adapters and would drop the pooled connections of every other session.
+        """
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        try:
+            yield session
+        finally:
+            session.cookies.clear()
+
+    def close(self):
+        """Close all pooled connections."""
+        self._adapter.close()
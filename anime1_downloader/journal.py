@@ -0,0 +1,144 @@
+"""Job journal that lets an interrupted anime1_downloader run resume.
+
+The journal is a JSONL file in the series output directory. Every resolved
+source, yt-dlp progress checkpoint and finished download is appended as one
+event, so after a crash the next run with --resume knows which episodes are
+done, which have .part files to continue, and which API tokens are still valid.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from logger_setup import get_logger
+
+from .config import AnimeDownloaderConfig
+
+logger = get_logger(__name__, "anime1_downloader")
+
+
+def token_expiry(cookies: dict) -> float:
+    """Return the expiry (unix time) of an API token from its `e` cookie, 0 if unknown."""
+    try:
+        return float(cookies["e"])
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
+class JobJournal:
+    """Append-only record of per-episode download state, folded by title on load."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: JSONL journal file
+        """
+        self.path = path
+        self.jobs: dict[str, dict] = {}  # title -> latest merged state
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: Path, resume: bool = False) -> "JobJournal":
+        """Open the journal at path, continuing it if resume is set or starting afresh."""
+        journal = cls(path)
+        if resume and path.exists():
+            journal._load()
+            journal._compact()
+        elif path.exists():
+            path.unlink()
+        return journal
+
+    def resolved(self, title: str, src: str, cookies: dict, output_path: str):
+        """Record a resolved source and where it will be saved."""
+        self._record("resolved", title, src=src, cookies=cookies, output_path=output_path)
+
+    def finished(self, title: str):
+        """Record a completed download."""
+        self._record("finished", title)
+
+    def is_finished(self, title: str) -> bool:
+        """Whether the journal has recorded title as downloaded."""
+        return self.jobs.get(title, {}).get("state") == "finished"
+
+    def pending(self) -> list[str]:
+        """Titles with journal entries that have not finished."""
+        return [title for title, job in self.jobs.items() if job.get("state") != "finished"]
+
+    def reusable_source(
+        self, title: str, margin: float = AnimeDownloaderConfig.TOKEN_MARGIN
+    ) -> tuple[str, dict] | None:
+        """Return the journaled (src, cookies) if its token is valid for `margin` more seconds."""
+        job = self.jobs.get(title, {})
+        if "src" not in job or job.get("state") == "finished":
+            return None
+        if token_expiry(job.get("cookies")) <= time.time() + margin:
+            return None
+        return job["src"], job["cookies"]
+
+    def progress_hook(
+        self, title: str, interval: float = AnimeDownloaderConfig.JOURNAL_PROGRESS_INTERVAL
+    ) -> Callable[[dict], None]:
+        """Return a yt-dlp progress hook that checkpoints part-file progress every interval seconds."""
+        last = 0.0
+
+        def hook(status: dict):
+            nonlocal last
+            now = time.monotonic()
+            if status.get("status") != "downloading" or now - last < interval:
+                return
+            last = now
+            self._record(
+                "progress",
+                title,
+                filename=status.get("filename"),
+                tmpfilename=status.get("tmpfilename"),
+                downloaded_bytes=status.get("downloaded_bytes"),
+                total_bytes=status.get("total_bytes") or status.get("total_bytes_estimate"),
+            )
+
+        return hook
+
+    def remove(self):
+        """Delete the journal once every job has finished."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+    def _record(self, event: str, title: str, **fields):
+        entry = {"event": event, "title": title, "at": time.time(), **fields}
+        with self._lock:
+            self._apply(entry)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _apply(self, entry: dict):
+        job = self.jobs.setdefault(entry["title"], {})
+        event = entry.get("event")
+        job.update({key: value for key, value in entry.items() if key not in ("event", "state")})
+        if event != "progress" or job.get("state") != "finished":
+            job["state"] = entry.get("state", event)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply(json.loads(line))
+                    except (json.JSONDecodeError, KeyError):
+                        continue  # torn last line from a crash
+        except OSError as e:
+            logger.warning(f"Error loading job journal: {e}")
+
+    def _compact(self):
+        """Rewrite the journal as one line per job, dropping superseded events."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for title, job in self.jobs.items():
+                entry = {"event": "snapshot", "title": title, **job}
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
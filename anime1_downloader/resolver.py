@@ -0,0 +1,60 @@
+"""Concurrent, rate-limited resolution of anime1.me API requests."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any
+
+from .config import AnimeDownloaderConfig
+
+
+class RateLimiter:
+    """Spaces out calls so that at most `rate` of them start per second."""
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Calls allowed per second; 0 or less disables the limit
+        """
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Sleep until the next call slot."""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def resolve_all(
+    items: Iterable[Any],
+    resolve: Callable[[Any], Any],
+    concurrency: int = AnimeDownloaderConfig.RESOLVE_CONCURRENCY,
+    rate: float = AnimeDownloaderConfig.RESOLVE_RATE,
+) -> AsyncIterator[tuple[Any, Any, Exception | None]]:
+    """Run the blocking resolve(item) for every item concurrently.
+
+    Calls run in worker threads via asyncio.to_thread, at most `concurrency`
+    at once and at most `rate` started per second. Results are yielded as
+    they complete, so a consumer can start on the first one right away.
+
+    Yields:
+        (item, result, None) on success or (item, None, error) on failure
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate)
+
+    async def resolve_one(item):
+        async with semaphore:
+            await limiter.wait()
+            try:
+                return item, await asyncio.to_thread(resolve, item), None
+            except Exception as e:
+                return item, None, e
+
+    for task in asyncio.as_completed([resolve_one(item) for item in items]):
+        yield await task
@@ -0,0 +1,116 @@
+"""Global fragment-connection and bandwidth budget shared by concurrent downloads."""
+
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+_RATE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?)i?B?\s*$", re.IGNORECASE)
+_RATE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_rate(value: str) -> int:
+    """Parse a rate such as '500K', '2.5M' or '1048576' into bytes per second.
+
+    Raises:
+        ValueError: If the value is not a number with an optional K/M/G suffix
+    """
+    match = _RATE_RE.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid rate: {value!r} (expected e.g. 500K, 10M)")
+    number, unit = match.groups()
+    return int(float(number) * _RATE_UNITS[unit.upper()])
+
+
+class DownloadScheduler:
+    """Splits a fragment-connection cap and a bandwidth cap across downloads.
+
+    Each yt-dlp download leases its concurrent_fragment_downloads when it
+    starts: an even share of the cap across the downloads that can run at
+    once, limited to the connections other downloads are not using. Shares
+    are returned as downloads finish, so later (and last) episodes get more.
+    The cap is hard: when every connection is leased, the next download
+    waits for one to be returned.
+
+    Bandwidth is a single token bucket fed through yt-dlp progress hooks, so
+    every running download draws from the same bytes/sec budget and the
+    survivors speed up as soon as one finishes.
+    """
+
+    def __init__(self, max_fragments: int, max_rate: int, slots: int):
+        """
+        Args:
+            max_fragments: Total fragment connections across all downloads
+            max_rate: Total bytes per second across all downloads, 0 for no limit
+            slots: Downloads that run at once (the download pool size)
+        """
+        self.max_fragments = max(1, max_fragments)
+        self.max_rate = max_rate
+        self.slots = max(1, slots)
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._in_use = 0
+        self._outstanding = 0  # downloads expected that have not finished
+        self._allowance = float(max_rate)  # token bucket, at most one second of burst
+        self._last_refill = time.monotonic()
+
+    def expect(self, count: int = 1):
+        """Announce downloads that are about to be queued, so early ones leave room."""
+        with self._lock:
+            self._outstanding += count
+
+    def cancel(self, count: int = 1):
+        """Withdraw expected downloads that will not run (e.g. failed to resolve)."""
+        with self._lock:
+            self._outstanding = max(0, self._outstanding - count)
+
+    @contextmanager
+    def lease(self) -> Iterator[int]:
+        """Reserve fragment connections for one download, waiting for a free one; yields how many."""
+        with self._released:
+            while self._in_use >= self.max_fragments:
+                self._released.wait()
+            fair = self.max_fragments // max(1, min(self.slots, self._outstanding))
+            fragments = max(1, min(fair, self.max_fragments - self._in_use))
+            self._in_use += fragments
+        try:
+            yield fragments
+        finally:
+            with self._released:
+                self._in_use -= fragments
+                self._outstanding = max(0, self._outstanding - 1)
+                self._released.notify_all()
+
+    def progress_hook(self) -> Callable[[dict], None]:
+        """Return a yt-dlp progress hook that charges one download's bytes to the budget."""
+        lock = threading.Lock()
+        last = 0
+
+        def hook(status: dict):
+            nonlocal last
+            downloaded = status.get("downloaded_bytes")
+            if status.get("status") != "downloading" or downloaded is None:
+                return
+            with lock:
+                delta = downloaded - last if downloaded >= last else downloaded
+                last = downloaded
+            self.throttle(delta)
+
+        return hook
+
+    def throttle(self, nbytes: int):
+        """Block the calling thread until nbytes fit in the bandwidth budget."""
+        if not self.max_rate or nbytes <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(
+                float(self.max_rate),
+                self._allowance + (now - self._last_refill) * self.max_rate,
+            )
+            self._last_refill = now
+            self._allowance -= nbytes
+            delay = -self._allowance / self.max_rate
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,153 @@
+"""Unit tests for anime1_downloader category crawl mode."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from anime1_downloader.cli import Anime1Downloader, create_parser
+from anime1_downloader.config import AnimeDownloaderConfig
+from anime1_downloader.journal import token_expiry
+
+CATEGORY = "https://anime1.me/category/2024年秋季/anime-a"
+
+
+def _page(episodes, pages):
+    """Build a listing page with one article per episode and pagination links."""
+    articles = "".join(
+        f'<article><h2 class="entry-title">{title}</h2>'
+        f'<video class="video-js" data-apireq="{apireq}"></video></article>'
+        for title, apireq in episodes
+    )
+    links = "".join(f'<a href="{CATEGORY}/page/{number}">{number}</a>' for number in pages)
+    return f"<html><body>{articles}<article><h2 class='entry-title'>News</h2></article>{links}</body></html>"
+
+
+SITE = {
+    CATEGORY: _page([("Anime A [03]", "req3")], [2, 3]),
+    f"{CATEGORY}/page/2": _page([("Anime A [02]", "req2"), ("Anime A [03]", "req3")], [3, 4]),
+    f"{CATEGORY}/page/3": _page([("Anime A [01]", "req1")], []),
+    f"{CATEGORY}/page/4": _page([("Anime A [00]", "req0")], []),
+}
+
+
+def _downloader(tmp_path: Path, *extra: str) -> tuple[Anime1Downloader, list[str]]:
+    """Create a downloader whose page fetches come from SITE and which records downloads."""
+    args = create_parser().parse_args(
+        [
+            CATEGORY,
+            "--crawl",
+            "--history",
+            str(tmp_path / "history.jsonl"),
+            "--output-dir",
+            str(tmp_path),
+            *extra,
+        ]
+    )
+    downloader = Anime1Downloader(args)
+    fetched = []
+
+    def fetch_page(url):
+        fetched.append(url)
+        return SITE[url]
+
+    downloader._fetch_page = fetch_page
+    downloader._get_source = lambda data_apireq: ("//v.anime1.me/" + data_apireq, {})
+    downloader._download_episode = lambda title, apireq, src, cookie, series: fetched.append(title)
+    return downloader, fetched
+
+
+class TestCrawl:
+    """Tests for page discovery, dedupe and the history filter."""
+
+    def test_discovers_all_pages_and_dedupes(self, tmp_path: Path) -> None:
+        """Test that linked pages are followed and repeated episodes are kept once."""
+        downloader, fetched = _downloader(tmp_path)
+
+        episodes = downloader._crawl_category()
+
+        assert sorted(fetched) == sorted(SITE)
+        assert episodes == [
+            ("Anime A [03]", "req3"),
+            ("Anime A [02]", "req2"),
+            ("Anime A [01]", "req1"),
+            ("Anime A [00]", "req0"),
+        ]
+
+    def test_max_pages(self, tmp_path: Path) -> None:
+        """Test that pages past --max-pages are not fetched."""
+        downloader, fetched = _downloader(tmp_path, "--max-pages", "2")
+
+        downloader._crawl_category()
+
+        assert sorted(fetched) == [CATEGORY, f"{CATEGORY}/page/2"]
+
+    def test_skips_history_before_processing(self, tmp_path: Path) -> None:
+        """Test that episodes already in history never reach the episode pipeline."""
+        history = tmp_path / "history.jsonl"
+        history.write_text(json.dumps({"title": "Anime A [02]"}) + "\n", encoding="utf-8")
+        downloader, processed = _downloader(tmp_path)
+
+        downloader.run()
+
+        assert "Anime A [02]" not in processed
+        assert {"Anime A [03]", "Anime A [01]", "Anime A [00]"} <= set(processed)
+
+    def test_force_keeps_history(self, tmp_path: Path) -> None:
+        """Test that --force sends episodes in history through the pipeline again."""
+        history = tmp_path / "history.jsonl"
+        history.write_text(json.dumps({"title": "Anime A [02]"}) + "\n", encoding="utf-8")
+        downloader, processed = _downloader(tmp_path, "--force")
+
+        downloader.run()
+
+        assert "Anime A [02]" in processed
+
+    def test_force_appends_history_again(self, tmp_path: Path) -> None:
+        """Test that a --force re-download adds a new history record, as before."""
+        history = tmp_path / "history.jsonl"
+        history.write_text(json.dumps({"title": "Anime A [02]"}) + "\n", encoding="utf-8")
+        downloader, _ = _downloader(tmp_path, "--force")
+        del downloader._download_episode  # run the real one, without yt-dlp
+        downloader._download_video = lambda src, cookie, title, series: None
+
+        downloader.run()
+
+        titles = [json.loads(line)["title"] for line in history.read_text("utf-8").splitlines()]
+        assert titles.count("Anime A [02]") == 2
+        assert titles.count("Anime A [03]") == 1
+
+
+class TestTokenRefresh:
+    """Tests for re-resolving sources whose token expired while queued."""
+
+    def test_queued_episode_is_resolved_again(self, tmp_path: Path) -> None:
+        """Test that a download starting after its token expired fetches a new source."""
+        downloader, _ = _downloader(tmp_path, "-j", "1", "--resolve-rate", "0")
+        lock = threading.Lock()
+        resolved = []
+
+        def get_source(data_apireq):
+            with lock:
+                resolved.append(data_apireq)
+                # Stage 1 tokens outlive the margin by 0.2s; later ones by an hour
+                lifetime = 0.2 if len(resolved) <= 4 else 3600
+            expiry = time.time() + AnimeDownloaderConfig.TOKEN_MARGIN + lifetime
+            return "//v.anime1.me/" + data_apireq, {"e": str(expiry)}
+
+        downloads = []
+
+        def download_video(src, cookie, title, series):
+            downloads.append((title, cookie, time.time()))
+            time.sleep(0.3)
+
+        del downloader._download_episode
+        downloader._get_source = get_source
+        downloader._download_video = download_video
+
+        downloader.run()
+
+        assert len(downloads) == 4
+        assert len(resolved) > 4
+        for title, cookie, started in downloads:
+            assert token_expiry(cookie) > started + AnimeDownloaderConfig.TOKEN_MARGIN, title
@@ -0,0 +1,64 @@
+"""Unit tests for anime1_downloader pooled HTTP client."""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from anime1_downloader.http_client import PooledHTTPClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Sets cookies on /set and echoes the Cookie header and client port otherwise."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self) -> None:
+        body = f"{self.headers.get('Cookie', '')}|{self.client_address[1]}".encode()
+        self.send_response(200)
+        if self.path == "/set":
+            self.send_header("Set-Cookie", "e=1; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledHTTPClient:
+    """Tests for PooledHTTPClient."""
+
+    def test_sessions_reuse_connections(self, server_url: str) -> None:
+        """Test that consecutive sessions share one keep-alive connection."""
+        client = PooledHTTPClient(pool_size=2)
+
+        with client.session() as first:
+            first_port = first.get(server_url).text.split("|")[1]
+        with client.session() as second:
+            second_port = second.get(server_url).text.split("|")[1]
+        client.close()
+
+        assert first_port == second_port
+
+    def test_cookies_do_not_leak_between_sessions(self, server_url: str) -> None:
+        """Test that cookies set for one episode are not sent by the next."""
+        client = PooledHTTPClient(pool_size=2)
+
+        with client.session() as first:
+            first.get(f"{server_url}/set")
+            assert first.get(server_url).text.startswith("e=1|")
+        with client.session() as second:
+            assert second.get(server_url).text.startswith("|")
+        client.close()
@@ -0,0 +1,71 @@
+"""Unit tests for anime1_downloader journal module."""
+
+import json
+import time
+from pathlib import Path
+
+from anime1_downloader.journal import JobJournal, token_expiry
+
+
+def _cookies(expires_in: float) -> dict:
+    return {"e": str(int(time.time() + expires_in)), "h": "hash", "p": "/path"}
+
+
+class TestJobJournal:
+    """Tests for JobJournal class."""
+
+    def test_resume_restores_state(self, tmp_path: Path) -> None:
+        """Test that a reopened journal knows finished, partial and resolved jobs."""
+        path = tmp_path / "journal.jsonl"
+        journal = JobJournal.open(path)
+        journal.resolved("Anime A [01]", "//v/1.mp4", _cookies(3600), "/out/Anime A [01]")
+        journal.resolved("Anime A [02]", "//v/2.mp4", _cookies(3600), "/out/Anime A [02]")
+        journal.progress_hook("Anime A [02]", interval=0)(
+            {"status": "downloading", "tmpfilename": "/out/2.mp4.part", "downloaded_bytes": 5}
+        )
+        journal.finished("Anime A [01]")
+
+        resumed = JobJournal.open(path, resume=True)
+
+        assert resumed.is_finished("Anime A [01]")
+        assert resumed.pending() == ["Anime A [02]"]
+        assert resumed.jobs["Anime A [02]"]["tmpfilename"] == "/out/2.mp4.part"
+        assert resumed.reusable_source("Anime A [02]", margin=60)[0] == "//v/2.mp4"
+
+    def test_expired_token_is_not_reused(self, tmp_path: Path) -> None:
+        """Test that a source whose `e` cookie expires within the margin must be re-resolved."""
+        journal = JobJournal.open(tmp_path / "journal.jsonl")
+        journal.resolved("Anime A [01]", "//v/1.mp4", _cookies(30), "/out/Anime A [01]")
+
+        assert journal.reusable_source("Anime A [01]", margin=60) is None
+        assert journal.reusable_source("Anime A [01]", margin=0) is not None
+
+    def test_without_resume_starts_afresh(self, tmp_path: Path) -> None:
+        """Test that opening without resume discards an old journal."""
+        path = tmp_path / "journal.jsonl"
+        JobJournal.open(path).finished("Anime A [01]")
+
+        journal = JobJournal.open(path)
+
+        assert not journal.is_finished("Anime A [01]")
+        assert not path.exists()
+
+    def test_torn_line_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a half-written line from a crash does not break resume."""
+        path = tmp_path / "journal.jsonl"
+        entry = {"event": "finished", "title": "Anime A [01]"}
+        path.write_text(json.dumps(entry) + '\n{"event": "resol', encoding="utf-8")
+
+        journal = JobJournal.open(path, resume=True)
+
+        assert journal.is_finished("Anime A [01]")
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+class TestTokenExpiry:
+    """Tests for token_expiry function."""
+
+    def test_missing_cookie(self) -> None:
+        """Test that a missing or malformed `e` cookie counts as expired."""
+        assert token_expiry({}) == 0.0
+        assert token_expiry({"e": "soon"}) == 0.0
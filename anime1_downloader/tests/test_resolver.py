@@ -0,0 +1,69 @@
+"""Unit tests for anime1_downloader resolver module."""
+
+import asyncio
+import threading
+import time
+
+from anime1_downloader.resolver import resolve_all
+
+
+def _collect(items, resolve, **kwargs):
+    """Run resolve_all to completion and return what it yielded."""
+
+    async def collect():
+        return [result async for result in resolve_all(items, resolve, **kwargs)]
+
+    return asyncio.run(collect())
+
+
+class TestResolveAll:
+    """Tests for resolve_all function."""
+
+    def test_resolves_concurrently(self) -> None:
+        """Test that blocking calls overlap up to the concurrency limit."""
+        active, peak = 0, 0
+        lock = threading.Lock()
+
+        def resolve(item):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return item * 2
+
+        results = _collect(range(8), resolve, concurrency=4, rate=0)
+
+        assert sorted(result for _, result, _ in results) == [0, 2, 4, 6, 8, 10, 12, 14]
+        assert peak == 4
+
+    def test_rate_limit(self) -> None:
+        """Test that no more than `rate` calls start per second."""
+        starts = []
+
+        def resolve(item):
+            starts.append(time.monotonic())
+            return item
+
+        _collect(range(4), resolve, concurrency=4, rate=20)
+
+        # 4 starts at 20/s span at least 3 intervals of 0.05s; thread start-up
+        # jitter can shift single calls, so check the span rather than each gap
+        starts.sort()
+        assert starts[-1] - starts[0] >= 0.12
+
+    def test_errors_are_yielded(self) -> None:
+        """Test that a failing call is reported without stopping the others."""
+
+        def resolve(item):
+            if item == 1:
+                raise ValueError("expired")
+            return item
+
+        results = {item: (result, error) for item, result, error in _collect([0, 1, 2], resolve)}
+
+        assert results[0] == (0, None)
+        assert results[2] == (2, None)
+        assert isinstance(results[1][1], ValueError)
@@ -0,0 +1,124 @@
+"""Unit tests for anime1_downloader scheduler module."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from anime1_downloader.scheduler import DownloadScheduler, parse_rate
+
+
+class TestParseRate:
+    """Tests for parse_rate function."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("0", 0), ("1048576", 1048576), ("500K", 512000), ("2.5M", 2621440), ("1GiB", 1024**3)],
+    )
+    def test_valid(self, value: str, expected: int) -> None:
+        """Test plain byte counts and K/M/G suffixes."""
+        assert parse_rate(value) == expected
+
+    def test_invalid(self) -> None:
+        """Test that garbage is rejected."""
+        with pytest.raises(ValueError):
+            parse_rate("fast")
+
+
+class TestFragmentBudget:
+    """Tests for splitting fragment connections across downloads."""
+
+    def test_even_split_across_slots(self) -> None:
+        """Test that concurrent downloads share the cap evenly."""
+        scheduler = DownloadScheduler(max_fragments=32, max_rate=0, slots=4)
+        scheduler.expect(10)
+
+        with scheduler.lease() as a, scheduler.lease() as b:
+            assert (a, b) == (8, 8)
+
+    def test_full_cap_waits_for_a_release(self) -> None:
+        """Test that a lease beyond the cap waits until connections are returned."""
+        scheduler = DownloadScheduler(max_fragments=8, max_rate=0, slots=2)
+        scheduler.expect(3)
+        third = []
+
+        def wait_for_lease():
+            with scheduler.lease() as fragments:
+                third.append(fragments)
+
+        with scheduler.lease() as a, scheduler.lease() as b:
+            assert a + b == 8
+            waiter = threading.Thread(target=wait_for_lease)
+            waiter.start()
+            waiter.join(0.1)
+            assert waiter.is_alive()
+
+        waiter.join(1)
+        assert third == [8]
+
+    def test_concurrent_leases_respect_cap(self) -> None:
+        """Test that more downloads than connections never exceed the cap."""
+        scheduler = DownloadScheduler(max_fragments=2, max_rate=0, slots=4)
+        scheduler.expect(12)
+        peak = 0
+        lock = threading.Lock()
+
+        def download():
+            nonlocal peak
+            with scheduler.lease() as fragments:
+                assert fragments >= 1
+                with lock:
+                    peak = max(peak, scheduler._in_use)
+                time.sleep(0.01)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: download(), range(12)))
+
+        assert peak <= scheduler.max_fragments
+        assert scheduler._in_use == 0
+
+    def test_last_download_gets_freed_connections(self) -> None:
+        """Test that shares grow as other downloads finish."""
+        scheduler = DownloadScheduler(max_fragments=32, max_rate=0, slots=4)
+        scheduler.expect(4)
+        for _ in range(3):
+            with scheduler.lease():
+                pass
+
+        with scheduler.lease() as last:
+            assert last == 32
+
+    def test_cancel(self) -> None:
+        """Test that withdrawn downloads no longer reserve a share."""
+        scheduler = DownloadScheduler(max_fragments=32, max_rate=0, slots=4)
+        scheduler.expect(2)
+        scheduler.cancel()
+
+        with scheduler.lease() as only:
+            assert only == 32
+
+
+class TestBandwidthBudget:
+    """Tests for the shared bytes/sec budget."""
+
+    def test_unlimited_does_not_block(self) -> None:
+        """Test that a zero rate never sleeps."""
+        scheduler = DownloadScheduler(max_fragments=1, max_rate=0, slots=1)
+        start = time.monotonic()
+
+        scheduler.throttle(10**9)
+
+        assert time.monotonic() - start < 0.05
+
+    def test_hooks_share_one_budget(self) -> None:
+        """Test that bytes reported by different downloads draw on the same bucket."""
+        scheduler = DownloadScheduler(max_fragments=1, max_rate=100_000, slots=2)
+        first, second = scheduler.progress_hook(), scheduler.progress_hook()
+        start = time.monotonic()
+
+        first({"status": "downloading", "downloaded_bytes": 100_000})  # burst allowance
+        second({"status": "downloading", "downloaded_bytes": 10_000})
+        first({"status": "downloading", "downloaded_bytes": 110_000})
+
+        assert time.monotonic() - start >= 0.15
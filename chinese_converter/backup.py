@@ -0,0 +1,81 @@
+"""Backup creation strategies for chinese_converter inputs."""
+
+import os
+import shutil
+from pathlib import Path
+
+from config import Config
+from logger_setup import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = get_logger(__name__, "chinese_converter")
+
+# ioctl request that clones a file's extents (btrfs, XFS, bcachefs, ...)
+_FICLONE = 0x40049409
+
+BACKUP_STRATEGIES = ["copy", "hardlink", "skip"]
+
+
+def make_backup(input_path: Path, output_path: Path, strategy: str = "copy") -> Path | None:
+    """Back up input_path next to itself without loading it into memory.
+
+    Strategies:
+        copy: reflink clone where the filesystem supports it, otherwise an
+            in-kernel copy via shutil.copyfile (sendfile/copy_file_range)
+        hardlink: hardlink when output_path differs from input_path, since the
+            input is then never modified; falls back to copy
+        skip: no backup when output_path differs from input_path; falls back
+            to copy otherwise
+
+    Returns:
+        Path to the backup, or None if it was skipped
+    """
+    if strategy not in BACKUP_STRATEGIES:
+        raise ValueError(f"Unknown backup strategy: {strategy}")
+
+    backup_path = input_path.with_suffix(input_path.suffix + Config.BACKUP_SUFFIX)
+    separate_output = not _same_file(input_path, output_path)
+
+    if strategy == "skip" and separate_output:
+        logger.info("Backup skipped: output is written to a separate file")
+        return None
+
+    if strategy == "hardlink" and separate_output:
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(input_path, backup_path)
+            logger.info(f"Backup hardlinked: {backup_path}")
+            return backup_path
+        except OSError as e:
+            logger.debug(f"Hardlink failed ({e}), copying instead")
+
+    if _reflink(input_path, backup_path):
+        logger.info(f"Backup cloned: {backup_path}")
+    else:
+        shutil.copyfile(input_path, backup_path)
+        logger.info(f"Backup created: {backup_path}")
+    return backup_path
+
+
+def _same_file(input_path: Path, output_path: Path) -> bool:
+    """Check whether output_path refers to input_path."""
+    try:
+        return output_path.exists() and os.path.samefile(input_path, output_path)
+    except OSError:
+        return False
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone src to dst with FICLONE; False if unsupported (dst may then be partial)."""
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,365 @@
+"""Conversion throughput benchmark on synthetic corpora.
+
+Generates a large TXT file, an EPUB with many small chapters and an EPUB with
+a few huge chapters, converts each with every requested conversion type and
+reports chars/sec, members/sec, peak RSS and the time spent per pipeline
+stage. Results are written as JSON so runs can be compared.
+
+Usage:
+    python -m chinese_converter.benchmark [--scale 0.5] [--types s2t t2s]
+    python -m chinese_converter.benchmark --baseline temp/benchmarks/previous.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from chinese_converter.cli import get_handler
+from chinese_converter.text_converter import ChineseConverter
+from chinese_converter.timing import format_stages
+from config import Config
+from logger_setup import get_logger
+
+from .config import EPUBConfig
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = get_logger(__name__, "chinese_converter")
+
+# Word pool mixing simplified and traditional forms so every conversion type has work to do
+_WORDS = (
+    "软件", "开发", "这是", "一个", "关于", "故事", "程序员", "计算机", "网络", "发展",
+    "历史", "头发", "后来", "里面", "干净", "系统", "数据", "图书馆", "我们", "说话",
+    "軟件", "開發", "這是", "一個", "關於", "電腦", "網絡", "歷史", "頭髮", "後來",
+    "裡面", "乾淨", "系統", "數據", "圖書館", "他們", "說話", "的", "了", "在",
+    "时间", "時間", "学习", "學習", "问题", "問題", "东西", "東西", "Python", "2024",
+)  # fmt: skip
+_PUNCTUATION = ("，", "，", "，", "。", "、", "；", "！", "？")
+
+# Corpus name -> (kind, number of chapters, characters per chapter); scale applies to the latter
+CORPORA = {
+    "txt_large": ("txt", 1, 2_000_000),
+    "epub_many_small": ("epub", 500, 2_000),
+    "epub_few_huge": ("epub", 4, 250_000),
+}
+
+_CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+
+def generate_text(rng: random.Random, chars: int, paragraph_chars: int = 200) -> str:
+    """Generate roughly chars characters of mixed Chinese prose in paragraphs."""
+    paragraphs = []
+    total = 0
+    while total < chars:
+        words = []
+        length = 0
+        while length < paragraph_chars:
+            word = rng.choice(_WORDS)
+            words.append(word)
+            length += len(word)
+            if rng.random() < 0.15:
+                words.append(rng.choice(_PUNCTUATION))
+                length += 1
+        paragraph = "".join(words) + "。"
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 1
+    return "\n".join(paragraphs) + "\n"
+
+
+def build_corpus(name: str, directory: Path, scale: float = 1.0, seed: int = 0) -> dict:
+    """Write one synthetic corpus into directory.
+
+    Returns:
+        Corpus metadata: name, kind, path, members and Chinese text characters
+    """
+    kind, chapters, chapter_chars = CORPORA[name]
+    chapter_chars = max(100, round(chapter_chars * scale))
+    rng = random.Random(seed)
+
+    if kind == "txt":
+        path = directory / f"{name}.txt"
+        text = generate_text(rng, chapter_chars)
+        path.write_text(text, encoding="utf-8")
+        return {"name": name, "kind": kind, "path": str(path), "members": 1, "chars": len(text)}
+
+    path = directory / f"{name}.epub"
+    chars = 0
+    nav_points = []
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(EPUBConfig.MIMETYPE_FILE, "application/epub+zip", zipfile.ZIP_STORED)
+        zf.writestr(EPUBConfig.CONTAINER_XML, _CONTAINER_XML)
+        for index in range(1, chapters + 1):
+            title = f"第{index}章 {generate_text(rng, 6, 6).strip()}"
+            paragraphs = generate_text(rng, chapter_chars).splitlines()
+            body = "\n".join(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+            chars += len(title) * 4 + sum(len(paragraph) for paragraph in paragraphs)
+            zf.writestr(
+                f"OEBPS/text/ch{index:04d}.xhtml",
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<html xmlns="http://www.w3.org/1999/xhtml">\n'
+                f"<head><title>{title}</title></head>\n"
+                f'<body>\n<h1 title="{title}">{title}</h1>\n{body}\n</body>\n</html>\n',
+            )
+            nav_points.append(
+                f'<navPoint id="p{index}"><navLabel><text>{title}</text></navLabel></navPoint>'
+            )
+        zf.writestr(
+            "OEBPS/content.opf",
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<package xmlns="http://www.idpf.org/2007/opf" version="2.0">\n'
+            '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            f"<dc:title>{name}</dc:title><dc:creator>基准测试</dc:creator></metadata>\n"
+            "</package>\n",
+        )
+        zf.writestr(
+            "OEBPS/toc.ncx",
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">\n'
+            f"<navMap>{''.join(nav_points)}</navMap>\n</ncx>\n",
+        )
+    return {
+        "name": name,
+        "kind": kind,
+        "path": str(path),
+        "members": chapters + 2,
+        "chars": chars,
+    }
+
+
+def run_case(
+    corpus: dict,
+    conversion_type: str,
+    engine: str = EPUBConfig.ENGINE,
+    streaming: bool = False,
+    member_jobs: int = 1,
+) -> dict:
+    """Convert one corpus with one conversion type and measure it."""
+    start = time.perf_counter()
+    converter = ChineseConverter(conversion_type, engine=engine)
+    setup = time.perf_counter() - start
+
+    input_path = Path(corpus["path"])
+    output_path = input_path.with_name(f"{input_path.stem}_{conversion_type}{input_path.suffix}")
+    handler = get_handler(str(input_path), converter, streaming, None, member_jobs)
+
+    start = time.perf_counter()
+    success = handler.process_file(input_path, output_path)
+    elapsed = time.perf_counter() - start
+    handler.record_converter_stats()
+    output_path.unlink(missing_ok=True)
+
+    stages = {name: round(seconds, 6) for name, seconds in handler.timer.totals.items()}
+    stages["other"] = round(max(elapsed - sum(handler.timer.totals.values()), 0.0), 6)
+    members = handler.stats["files_processed"] + handler.stats["skipped"]
+    return {
+        "corpus": corpus["name"],
+        "conversion_type": conversion_type,
+        "success": success,
+        "chars": corpus["chars"],
+        "members": members,
+        "setup_seconds": round(setup, 6),
+        "seconds": round(elapsed, 6),
+        "chars_per_sec": round(corpus["chars"] / elapsed, 1) if elapsed else None,
+        "members_per_sec": round(members / elapsed, 1) if elapsed else None,
+        "peak_rss_mb": _peak_rss_mb(),
+        "stages": stages,
+        "stats": dict(handler.stats),
+    }
+
+
+def run_benchmark(
+    corpora: list[str],
+    conversion_types: list[str],
+    engine: str = EPUBConfig.ENGINE,
+    streaming: bool = False,
+    member_jobs: int = 1,
+    scale: float = 1.0,
+    seed: int = 0,
+    isolate: bool = True,
+) -> dict:
+    """Run every corpus/conversion type pair and collect the results.
+
+    Args:
+        corpora: Names from CORPORA to generate and convert
+        conversion_types: Conversion types to run on every corpus
+        engine: Conversion engine name
+        streaming: Use the streaming handlers
+        member_jobs: Worker processes per EPUB
+        scale: Multiplier for corpus sizes
+        seed: Random seed for corpus generation
+        isolate: Run each case in a fresh process so peak RSS is per case
+
+    Returns:
+        JSON-serializable report with environment details and one result per case
+    """
+    report = {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "engine": engine,
+        "streaming": streaming,
+        "member_jobs": member_jobs,
+        "scale": scale,
+        "seed": seed,
+        "results": [],
+    }
+
+    Config.TEMP_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(
+        prefix=Config.TEMP_DIR_PREFIX, dir=Config.TEMP_DIRECTORY
+    ) as directory:
+        for name in corpora:
+            corpus = build_corpus(name, Path(directory), scale, seed)
+            logger.info(f"Generated {name}: {corpus['chars']:,} chars, {corpus['members']} members")
+            for conversion_type in conversion_types:
+                args = (corpus, conversion_type, engine, streaming, member_jobs)
+                if isolate:
+                    with ProcessPoolExecutor(max_workers=1) as executor:
+                        result = executor.submit(run_case, *args).result()
+                else:
+                    result = run_case(*args)
+                report["results"].append(result)
+                _log_result(result)
+
+    return report
+
+
+def compare(report: dict, baseline: dict) -> list[dict]:
+    """Pair each result with the baseline run of the same corpus and type.
+
+    Returns:
+        One entry per matched case with both throughputs and the relative change
+    """
+    previous = {(r["corpus"], r["conversion_type"]): r for r in baseline.get("results", [])}
+    rows = []
+    for result in report["results"]:
+        before = previous.get((result["corpus"], result["conversion_type"]))
+        if not before or not before["chars_per_sec"] or not result["chars_per_sec"]:
+            continue
+        rows.append(
+            {
+                "corpus": result["corpus"],
+                "conversion_type": result["conversion_type"],
+                "baseline_chars_per_sec": before["chars_per_sec"],
+                "chars_per_sec": result["chars_per_sec"],
+                "change": round(result["chars_per_sec"] / before["chars_per_sec"] - 1, 4),
+            }
+        )
+    return rows
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process, in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _format_rate(value: float | None, spec: str) -> str:
+    """Format a throughput, or 'n/a' when the run was too short to time."""
+    return "n/a" if value is None else format(value, spec)
+
+
+def _log_result(result: dict):
+    logger.info(
+        f"{result['corpus']} [{result['conversion_type']}]: "
+        f"{result['seconds']:.2f}s, "
+        f"{_format_rate(result['chars_per_sec'], ',.0f')} chars/s, "
+        f"{_format_rate(result['members_per_sec'], ',.1f')} members/s, "
+        f"peak RSS {result['peak_rss_mb']} MiB"
+    )
+    logger.info(f"  Stages: {format_stages(result['stages'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chinese_converter throughput")
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        choices=list(CORPORA),
+        default=list(CORPORA),
+        help="Synthetic corpora to run (default: all)",
+    )
+    parser.add_argument(
+        "--types",
+        nargs="+",
+        choices=EPUBConfig.CONVERSION_TYPES,
+        default=EPUBConfig.CONVERSION_TYPES,
+        help="Conversion types to run (default: all)",
+    )
+    parser.add_argument("--engine", "-e", choices=EPUBConfig.ENGINES, default=EPUBConfig.ENGINE)
+    parser.add_argument("--stream", action="store_true", help="Use the streaming handlers")
+    parser.add_argument(
+        "--member-jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes per EPUB; stage times are then summed across workers",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplier for corpus sizes (default: 1.0)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed (default: 0)")
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run all cases in this process (peak RSS then covers every case so far)",
+    )
+    parser.add_argument("--output", "-o", help="JSON report path (default: temp/benchmarks/)")
+    parser.add_argument("--baseline", help="Previous JSON report to compare chars/sec against")
+
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        args.corpus,
+        args.types,
+        args.engine,
+        args.stream,
+        args.member_jobs,
+        args.scale,
+        args.seed,
+        not args.no_isolate,
+    )
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        report["comparison"] = compare(report, baseline)
+        for row in report["comparison"]:
+            logger.info(
+                f"{row['corpus']} [{row['conversion_type']}]: "
+                f"{row['baseline_chars_per_sec']:,.0f} -> {row['chars_per_sec']:,.0f} chars/s "
+                f"({row['change']:+.1%})"
+            )
+
+    if args.output:
+        output = Path(args.output)
+    else:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = Config.TEMP_DIRECTORY / "benchmarks" / f"chinese_converter-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    logger.info(f"Report written to {output}")
+
+
+if __name__ == "__main__":
+    main()
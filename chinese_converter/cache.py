@@ -0,0 +1,135 @@
+"""Persistent, content-addressed cache of converted files and EPUB members."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from config import Config
+from logger_setup import get_logger
+
+from .config import EPUBConfig
+
+logger = get_logger(__name__, "chinese_converter")
+
+
+class ConversionCache:
+    """SQLite-backed LRU cache of converted content.
+
+    Keys combine the SHA-256 of the input content with everything that affects
+    the output (member type, conversion type, engine version and the cache
+    format version), so a key never maps to stale output. Total stored bytes
+    are capped; the least recently used entries are evicted first.
+    """
+
+    # Bump when handler output for the same input changes
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_bytes: int = EPUBConfig.DISK_CACHE_MAX_BYTES,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file (default: TEMP_DIRECTORY/chinese_converter_cache.sqlite3)
+            max_bytes: Upper bound for the total size of cached values
+        """
+        self.path = Path(path or Config.TEMP_DIRECTORY / "chinese_converter_cache.sqlite3")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+        self._db.commit()
+        # Running estimate; other processes may write too, so it is re-summed before evicting
+        self._total = self._stored_bytes()
+
+    @classmethod
+    def make_key(cls, digest: str, kind: str, converter) -> str:
+        """Build a cache key from a content digest and the converter settings.
+
+        Args:
+            digest: SHA-256 hex digest of the input content
+            kind: What the content is, e.g. a member extension or "file"
+            converter: ChineseConverter whose settings determine the output
+        """
+        return (
+            f"{digest}:{kind}:{converter.conversion_type}:"
+            f"{converter.engine_version}:{cls.FORMAT_VERSION}"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value for key and mark it as recently used."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            return row[0]
+
+    def put(self, key: str, value: bytes):
+        """Store value under key, evicting old entries beyond the size limit."""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            self._total += len(value)
+            if self._total > self.max_bytes:
+                self._evict()
+            self._db.commit()
+
+    def _stored_bytes(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self):
+        """Delete least recently used entries until the total size fits."""
+        total = self._stored_bytes()
+        if total <= self.max_bytes:
+            self._total = total
+            return
+
+        freed = 0
+        evicted = []
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if total - freed <= self.max_bytes:
+                break
+            evicted.append((key,))
+            freed += size
+        self._db.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self._total = total - freed
+        logger.debug(f"Evicted {len(evicted)} cache entries ({freed} bytes)")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+def content_digest(content: bytes) -> str:
+    """SHA-256 hex digest of in-memory content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(Config.CHUNK_SIZE * 128):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -1,29 +1,51 @@
 """Multi-format Chinese text converter."""
 
 import argparse
+import codecs
+import signal
 import sys
+import threading
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from chinese_converter.backup import BACKUP_STRATEGIES, make_backup
+from chinese_converter.cache import ConversionCache, file_digest
 from chinese_converter.formats.epub_handler import EPUBHandler
 from chinese_converter.formats.txt_handler import TXTHandler
+from chinese_converter.profiling import PROFILE_MODES, profile, slowest_members
 from chinese_converter.text_converter import ChineseConverter
-from config import Config
+from chinese_converter.timing import format_stages
+from chinese_converter.watcher import DirectoryWatcher
 from logger_setup import get_logger
 
 from .config import EPUBConfig
 
 logger = get_logger(__name__, "chinese_converter")
 
+SUPPORTED_PATTERNS = ["*.epub", "*.txt"]
 
-def get_handler(file_path: str, converter):
+# Per-process converter used by batch workers, built once in _init_worker
+_worker_converter = None
+
+
+def get_handler(
+    file_path: str,
+    converter,
+    streaming: bool = False,
+    cache=None,
+    member_jobs: int = EPUBConfig.MEMBER_JOBS,
+    max_inflight: int = EPUBConfig.MAX_INFLIGHT_MEMBERS,
+    input_encoding: str = EPUBConfig.TXT_INPUT_ENCODING,
+    output_encoding: str = EPUBConfig.TXT_OUTPUT_ENCODING,
+):
     """Get appropriate handler based on file extension."""
     path = Path(file_path)
 
     if path.suffix.lower() == ".epub":
-        return EPUBHandler(path, converter)
+        return EPUBHandler(path, converter, streaming, cache, member_jobs, max_inflight)
     elif path.suffix.lower() == ".txt":
-        return TXTHandler(path, converter)
+        return TXTHandler(path, converter, streaming, cache, input_encoding, output_encoding)
     else:
         raise ValueError(f"Unsupported format: {path.suffix}")
 
@@ -31,44 +53,102 @@ def get_handler(file_path: str, converter):
 class ChineseTextConverter:
     """Multi-format Chinese text converter."""
 
-    def __init__(self, conversion_type: str = "s2t"):
+    def __init__(
+        self,
+        conversion_type: str = "s2t",
+        streaming: bool = EPUBConfig.STREAMING,
+        engine: str = EPUBConfig.ENGINE,
+        use_cache: bool = EPUBConfig.DISK_CACHE,
+        backup_strategy: str = EPUBConfig.BACKUP_STRATEGY,
+        member_jobs: int = EPUBConfig.MEMBER_JOBS,
+        max_inflight: int = EPUBConfig.MAX_INFLIGHT_MEMBERS,
+        profile_mode: str | None = None,
+        input_encoding: str = EPUBConfig.TXT_INPUT_ENCODING,
+        output_encoding: str = EPUBConfig.TXT_OUTPUT_ENCODING,
+    ):
         self.conversion_type = conversion_type
-        self.converter = ChineseConverter(conversion_type)
+        self.streaming = streaming
+        self.engine = engine
+        self.use_cache = use_cache
+        self.backup_strategy = backup_strategy
+        self.member_jobs = member_jobs
+        self.max_inflight = max_inflight
+        self.profile_mode = profile_mode
+        self.input_encoding = input_encoding
+        self.output_encoding = output_encoding
+        self.converter = ChineseConverter(conversion_type, engine=engine)
+        self.cache = ConversionCache() if use_cache else None
+        self.last_stats: dict = {}
+        self.last_timings: dict = {}
+        self.last_member_timings: dict = {}
+        self.batch_stats: dict = {}
 
     def convert_file(self, input_path: str, output_path: str, create_backup: bool = True) -> bool:
         """Convert a single file."""
         logger.info(f"Converting: {input_path} -> {output_path}")
         start_time = time.time()
+        self.last_stats = {}
+        self.last_timings = {}
+        self.last_member_timings = {}
+
+        file_key = None
+        if self.cache is not None:
+            file_key = self.cache.make_key(
+                file_digest(Path(input_path)), self._file_kind(input_path), self.converter
+            )
+            if self._is_up_to_date(file_key, Path(output_path)):
+                logger.info(f"✓ Unchanged since last conversion, skipping: {input_path}")
+                self.last_stats = {"skipped": 1, "disk_cache_hits": 1}
+                return True
 
         # Create backup
         if create_backup:
-            backup_path = Path(input_path).with_suffix(
-                Path(input_path).suffix + Config.BACKUP_SUFFIX
-            )
-            backup_path.write_bytes(Path(input_path).read_bytes())
-            logger.info(f"Backup created: {backup_path}")
+            make_backup(Path(input_path), Path(output_path), self.backup_strategy)
 
         try:
-            handler = get_handler(input_path, self.converter)
-
-            # Validate file first
-            valid, errors = handler.validate_file(Path(input_path))
-            if not valid:
-                logger.error(f"Invalid file: {'; '.join(errors)}")
-                return False
+            handler = get_handler(
+                input_path,
+                self.converter,
+                self.streaming,
+                self.cache,
+                self.member_jobs,
+                self.max_inflight,
+                self.input_encoding,
+                self.output_encoding,
+            )
 
-            # Process the file
-            success = handler.process_file(Path(input_path), Path(output_path))
+            with profile(self.profile_mode, Path(input_path).stem):
+                # Validate file first
+                with handler.timer.stage("validate"):
+                    valid, errors = handler.validate_file(Path(input_path))
+                if not valid:
+                    logger.error(f"Invalid file: {'; '.join(errors)}")
+                    return False
+
+                # Process the file
+                success = handler.process_file(Path(input_path), Path(output_path))
+            handler.record_converter_stats()
+            self.last_stats = dict(handler.stats)
+            self.last_timings = dict(handler.timer.totals)
+            self.last_member_timings = dict(handler.member_timings)
 
             if success:
+                if file_key is not None:
+                    self.cache.put(file_key, file_digest(Path(output_path)).encode())
                 stats = handler.stats
                 elapsed = time.time() - start_time
                 logger.info(f"✓ Conversion completed in {elapsed:.2f}s")
                 logger.info(
                     f"  Files: {stats['files_processed']}, "
                     f"Texts: {stats['texts_converted']}, "
-                    f"Errors: {stats['errors']}"
+                    f"Errors: {stats['errors']}, "
+                    f"Skipped: {stats['skipped']}, "
+                    f"Cache hits/misses: {stats['cache_hits']}/{stats['cache_misses']}, "
+                    f"Engine calls: {stats['engine_calls']}"
                 )
+                logger.info(f"  Stages: {format_stages(handler.timer.totals)}")
+                if self.profile_mode:
+                    self._log_slowest_members(handler.member_timings)
                 return True
             else:
                 logger.error("Conversion failed")
@@ -78,30 +158,309 @@ class ChineseTextConverter:
             logger.error(f"Conversion failed: {e}")
             return False
 
-    def convert_batch(self, input_dir: str, output_dir: str) -> dict:
-        """Convert all supported files in a directory."""
+    def _log_slowest_members(self, member_timings: dict):
+        """Log the members that took longest, with their per-stage split."""
+        slowest = slowest_members(member_timings)
+        if slowest:
+            logger.info(f"  Slowest {len(slowest)} of {len(member_timings)} members:")
+        for name, total, stages in slowest:
+            logger.info(f"    {total:.3f}s {name} ({format_stages(stages)})")
+
+    def watch(
+        self,
+        input_dir: str,
+        output_dir: str,
+        jobs: int = 1,
+        recursive: bool = False,
+        interval: float = EPUBConfig.WATCH_INTERVAL,
+        settle: float = EPUBConfig.WATCH_SETTLE,
+        queue_size: int = EPUBConfig.WATCH_QUEUE_SIZE,
+        stop: threading.Event | None = None,
+    ) -> dict:
+        """Convert files as they arrive in input_dir until stop is set.
+
+        The converter (and its caches) stays warm for the whole session. With
+        jobs > 1 conversions run in worker processes that each load their
+        dictionaries once. At most queue_size conversions are queued; further
+        arrivals wait in the inbox until a slot frees up. Files whose output
+        is newer than the input are skipped, so restarting is cheap.
+
+        Args:
+            input_dir: Inbox directory to watch
+            output_dir: Directory to write converted files to
+            jobs: Number of worker processes (1 converts in a background thread)
+            recursive: Watch subdirectories and mirror the tree into output_dir
+            interval: Seconds between directory scans
+            settle: Seconds a file must stay unchanged before it is converted
+            queue_size: Maximum conversions queued or running at once
+            stop: Event that ends the session (Ctrl+C also stops it)
+
+        Returns:
+            Mapping of input file path to conversion success
+        """
+        input_path = Path(input_dir)
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        stop = stop or threading.Event()
+
+        watcher = DirectoryWatcher(
+            input_path,
+            {pattern.lstrip("*") for pattern in SUPPORTED_PATTERNS},
+            output_path,
+            recursive,
+            settle,
+        )
+        if jobs <= 1:
+            executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            executor = self._worker_pool(jobs, _init_watch_worker)
+        inflight: dict[Future, str] = {}
+        results = {}
+
+        logger.info(f"Watching {input_path} -> {output_path} every {interval}s (Ctrl+C to stop)")
+        with executor:
+            try:
+                while True:
+                    for file_path in watcher.poll():
+                        output_file = output_path / file_path.relative_to(input_path)
+                        if _is_up_to_date_output(file_path, output_file):
+                            logger.debug(f"Already converted: {file_path}")
+                            continue
+                        if len(inflight) >= queue_size:
+                            watcher.release(file_path)
+                            continue
+                        output_file.parent.mkdir(parents=True, exist_ok=True)
+                        worker = _convert_in_worker if jobs > 1 else self._convert_with_stats
+                        future = executor.submit(worker, str(file_path), str(output_file))
+                        inflight[future] = str(file_path)
+
+                    _collect_finished(inflight, results)
+                    if stop.wait(interval):
+                        break
+            finally:
+                for future in as_completed(inflight):
+                    _collect_finished({future: inflight[future]}, results)
+
+        logger.info(f"Watch stopped: {sum(results.values())}/{len(results)} successful")
+        return results
+
+    def _convert_with_stats(self, input_path: str, output_path: str) -> tuple[bool, dict]:
+        """Convert one file in this process, returning its stats like a batch worker."""
+        success = self.convert_file(input_path, output_path)
+        return success, self.last_stats
+
+    def _worker_pool(self, jobs: int, initializer=None) -> ProcessPoolExecutor:
+        """Create a process pool whose workers each build this converter's twin once.
+
+        Workers convert EPUB members serially: member pools inside each of the
+        jobs workers would start jobs x member_jobs processes.
+        """
+        if self.member_jobs > 1:
+            logger.warning(
+                f"Ignoring --member-jobs {self.member_jobs} with {jobs} batch workers; "
+                "each worker converts one member at a time"
+            )
+        return ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=initializer or _init_worker,
+            initargs=(
+                self.conversion_type,
+                self.streaming,
+                self.engine,
+                self.use_cache,
+                self.backup_strategy,
+                1,  # member_jobs
+                self.max_inflight,
+                self.profile_mode,
+                self.input_encoding,
+                self.output_encoding,
+            ),
+        )
+
+    def _file_kind(self, input_path: str) -> str:
+        """Cache kind for a whole file; TXT output also depends on the encodings."""
+        if Path(input_path).suffix.lower() == ".txt":
+            return f"file:{self.input_encoding}:{self.output_encoding}"
+        return "file"
+
+    def _is_up_to_date(self, file_key: str, output_path: Path) -> bool:
+        """Check whether output_path still holds the recorded result for file_key."""
+        recorded = self.cache.get(file_key)
+        return (
+            recorded is not None
+            and output_path.exists()
+            and file_digest(output_path).encode() == recorded
+        )
+
+    def convert_batch(
+        self, input_dir: str, output_dir: str, jobs: int = 1, recursive: bool = False
+    ) -> dict:
+        """Convert all supported files in a directory.
+
+        Args:
+            input_dir: Directory to scan for supported files
+            output_dir: Directory to write converted files to
+            jobs: Number of worker processes (1 converts in this process)
+            recursive: Scan subdirectories and mirror the tree into output_dir
+
+        Returns:
+            Mapping of input file path to conversion success
+        """
         input_path = Path(input_dir)
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Find all supported files
-        supported_files = []
-        for pattern in ["*.epub", "*.txt"]:
-            supported_files.extend(input_path.glob(pattern))
-
+        supported_files = _find_supported_files(input_path, output_path, recursive)
         logger.info(f"Found {len(supported_files)} supported files")
 
-        results = {}
+        tasks = {}
         for file_path in supported_files:
-            output_file = output_path / file_path.name
-            success = self.convert_file(str(file_path), str(output_file))
-            results[str(file_path)] = success
+            output_file = output_path / file_path.relative_to(input_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            tasks[str(file_path)] = str(output_file)
+
+        totals = {"files": 0, "texts": 0, "errors": 0, "bytes": 0, "elapsed": 0.0}
+        start_time = time.time()
+
+        results = {}
+        if jobs <= 1:
+            for file_path, output_file in tasks.items():
+                success = self.convert_file(file_path, output_file)
+                _add_batch_stats(totals, file_path, success, self.last_stats)
+                results[file_path] = success
+        else:
+            logger.info(f"Using {jobs} worker processes")
+            with self._worker_pool(jobs) as executor:
+                futures = {
+                    executor.submit(_convert_in_worker, file_path, output_file): file_path
+                    for file_path, output_file in tasks.items()
+                }
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        success, stats = future.result()
+                    except Exception as e:
+                        logger.error(f"Worker failed on {file_path}: {e}")
+                        success, stats = False, {}
+                    _add_batch_stats(totals, file_path, success, stats)
+                    results[file_path] = success
+
+        totals["elapsed"] = time.time() - start_time
+        self.batch_stats = totals
 
         successful = sum(1 for success in results.values() if success)
         logger.info(f"Batch completed: {successful}/{len(results)} successful")
+        logger.info(
+            f"  Files: {totals['files']}, "
+            f"Texts: {totals['texts']}, "
+            f"Errors: {totals['errors']}, "
+            f"Bytes: {totals['bytes']}, "
+            f"Elapsed: {totals['elapsed']:.2f}s"
+        )
         return results
 
 
+def _find_supported_files(input_path: Path, output_path: Path, recursive: bool) -> list[Path]:
+    """Find supported files, skipping anything already inside the output directory."""
+    supported_files = []
+    for pattern in SUPPORTED_PATTERNS:
+        matches = input_path.rglob(pattern) if recursive else input_path.glob(pattern)
+        supported_files.extend(
+            path for path in matches if path.is_file() and output_path not in path.parents
+        )
+    return sorted(supported_files)
+
+
+def _is_up_to_date_output(input_path: Path, output_path: Path) -> bool:
+    """Check whether output_path was written after input_path last changed."""
+    try:
+        return output_path.stat().st_mtime_ns >= input_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _collect_finished(inflight: dict[Future, str], results: dict):
+    """Move finished watch conversions from inflight into results and log them."""
+    for future in [future for future in inflight if future.done()]:
+        file_path = inflight.pop(future)
+        try:
+            success, _ = future.result()
+        except Exception as e:
+            logger.error(f"Worker failed on {file_path}: {e}")
+            success = False
+        results[file_path] = success
+        if not success:
+            logger.error(f"✗ Failed: {file_path}")
+
+
+def _add_batch_stats(totals: dict, file_path: str, success: bool, stats: dict):
+    """Fold one file's handler stats into the batch totals."""
+    if success:
+        totals["files"] += 1
+        totals["bytes"] += Path(file_path).stat().st_size
+    totals["texts"] += stats.get("texts_converted", 0)
+    totals["errors"] += stats.get("errors", 0)
+
+
+def _init_worker(
+    conversion_type: str,
+    streaming: bool,
+    engine: str,
+    use_cache: bool,
+    backup_strategy: str,
+    member_jobs: int,
+    max_inflight: int,
+    profile_mode: str | None,
+    input_encoding: str,
+    output_encoding: str,
+):
+    """Build the worker's converter once so every file reuses its dictionaries."""
+    global _worker_converter
+    _worker_converter = ChineseTextConverter(
+        conversion_type,
+        streaming,
+        engine,
+        use_cache,
+        backup_strategy,
+        member_jobs,
+        max_inflight,
+        profile_mode,
+        input_encoding,
+        output_encoding,
+    )
+
+
+def _init_watch_worker(*args):
+    """Initialize a watch worker that leaves Ctrl+C to the parent.
+
+    The parent stops scanning and waits for queued conversions, so no output
+    is left half-written.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _init_worker(*args)
+
+
+def _convert_in_worker(input_path: str, output_path: str) -> tuple[bool, dict]:
+    """Convert one file in a batch worker process."""
+    success = _worker_converter.convert_file(input_path, output_path)
+    return success, _worker_converter.last_stats
+
+
+def _encoding_arg(keyword: str):
+    """Build an argparse type accepting a codec name or the given keyword."""
+
+    def parse(value: str) -> str:
+        if value == keyword:
+            return value
+        try:
+            return codecs.lookup(value).name
+        except LookupError:
+            raise argparse.ArgumentTypeError(f"unknown encoding: {value}") from None
+
+    return parse
+
+
 def _generate_default_output(input_path: str, is_batch: bool) -> str:
     """Generate default output path based on input."""
     input_path = Path(input_path)
@@ -128,21 +487,124 @@ def main():
         default=EPUBConfig.DEFAULT_CONVERSION,
         help="Conversion type",
     )
+    parser.add_argument(
+        "--engine",
+        "-e",
+        choices=EPUBConfig.ENGINES,
+        default=EPUBConfig.ENGINE,
+        help="Conversion engine: 'opencc' (reference) or 'trie' (precompiled, faster)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=EPUBConfig.DISK_CACHE,
+        help="Reuse results for unchanged files and EPUB members from the on-disk cache",
+    )
     parser.add_argument("--batch", "-b", action="store_true", help="Batch mode")
+    parser.add_argument(
+        "--watch",
+        "-w",
+        action="store_true",
+        help="Watch the input directory and convert files as they arrive (Ctrl+C to stop)",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=EPUBConfig.WATCH_INTERVAL,
+        metavar="SECONDS",
+        help=f"Seconds between scans in watch mode (default: {EPUBConfig.WATCH_INTERVAL})",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes for batch and watch mode (default: 1)",
+    )
+    parser.add_argument(
+        "--member-jobs",
+        type=int,
+        default=EPUBConfig.MEMBER_JOBS,
+        metavar="N",
+        help="Worker processes converting the members of one EPUB (implies --stream for EPUB; "
+        "ignored when --jobs runs more than one worker)",
+    )
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        default=EPUBConfig.MAX_INFLIGHT_MEMBERS,
+        metavar="N",
+        help="EPUB members read but not yet written at once with --member-jobs "
+        f"(default: {EPUBConfig.MAX_INFLIGHT_MEMBERS})",
+    )
+    parser.add_argument(
+        "--recursive",
+        "-r",
+        action="store_true",
+        help="Batch/watch mode: include subdirectories and mirror them into the output directory",
+    )
     parser.add_argument("--no-backup", action="store_true", help="Skip backup")
+    parser.add_argument(
+        "--backup-strategy",
+        choices=BACKUP_STRATEGIES,
+        default=EPUBConfig.BACKUP_STRATEGY,
+        help="How to back up inputs: 'copy' (reflink or in-kernel copy), "
+        "'hardlink' or 'skip' when the output is a separate file",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=EPUBConfig.STREAMING,
+        help="Stream conversion: EPUB members in memory, TXT files memory-mapped in bounded chunks",
+    )
+    parser.add_argument(
+        "--input-encoding",
+        type=_encoding_arg("auto"),
+        default=EPUBConfig.TXT_INPUT_ENCODING,
+        metavar="CODEC",
+        help="TXT input encoding, or 'auto' to detect UTF-8/GB18030/Big5 (default: "
+        f"{EPUBConfig.TXT_INPUT_ENCODING})",
+    )
+    parser.add_argument(
+        "--output-encoding",
+        type=_encoding_arg("input"),
+        default=EPUBConfig.TXT_OUTPUT_ENCODING,
+        metavar="CODEC",
+        help="TXT output encoding, or 'input' to keep the input's encoding (default: "
+        f"{EPUBConfig.TXT_OUTPUT_ENCODING})",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        help="Capture a cProfile or tracemalloc profile per file and list the slowest members",
+    )
 
     args = parser.parse_args()
 
     # Generate default output if not provided
     if not args.output:
-        args.output = _generate_default_output(args.input, args.batch)
+        args.output = _generate_default_output(args.input, args.batch or args.watch)
         logger.info(f"Auto-generated output path: {args.output}")
 
-    converter = ChineseTextConverter(args.type)
+    converter = ChineseTextConverter(
+        args.type,
+        args.stream,
+        args.engine,
+        args.cache,
+        args.backup_strategy,
+        args.member_jobs,
+        args.max_inflight,
+        args.profile,
+        args.input_encoding,
+        args.output_encoding,
+    )
 
     try:
-        if args.batch:
-            converter.convert_batch(args.input, args.output)
+        if args.watch:
+            converter.watch(args.input, args.output, args.jobs, args.recursive, args.watch_interval)
+        elif args.batch:
+            converter.convert_batch(args.input, args.output, args.jobs, args.recursive)
         else:
             success = converter.convert_file(args.input, args.output, not args.no_backup)
             if not success:
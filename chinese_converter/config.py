@@ -1,19 +1,71 @@
 """EPUB converter specific configuration."""
 
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
+from config import Config
+
 load_dotenv()
 
 
+def _user_cache_directory() -> Path:
+    """Per-user cache root: LOCALAPPDATA on Windows, XDG_CACHE_HOME or ~/.cache elsewhere."""
+    if os.name == "nt":
+        base = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "useful-tools"
+
+
 class EPUBConfig:
     """EPUB converter specific configuration."""
 
     # Conversion settings
     DEFAULT_CONVERSION = os.getenv("EPUB_DEFAULT_CONVERSION", "s2t")
     CREATE_BACKUP = os.getenv("EPUB_CREATE_BACKUP", "true").lower() == "true"
+    BACKUP_STRATEGY = os.getenv("CHINESE_CONVERTER_BACKUP_STRATEGY", "copy")
     CONVERSION_TYPES = ["s2t", "s2tw", "s2hk", "t2s"]
+    ENGINES = ["opencc", "trie"]
+    ENGINE = os.getenv("CHINESE_CONVERTER_ENGINE", "opencc")
+    # Compiled tries of the trie engine; pickles, so kept in a private per-user directory
+    TRIE_CACHE_DIRECTORY = Path(
+        os.getenv("CHINESE_CONVERTER_TRIE_CACHE", _user_cache_directory() / "opencc_trie")
+    )
+    STREAMING = os.getenv("CHINESE_CONVERTER_STREAMING", "false").lower() == "true"
+
+    # Conversion cache: max memoized segments, and longest segment worth caching
+    CACHE_SIZE = int(os.getenv("CHINESE_CONVERTER_CACHE_SIZE", 4096))
+    CACHE_MAX_TEXT_LENGTH = int(os.getenv("CHINESE_CONVERTER_CACHE_MAX_TEXT_LENGTH", 1024))
+
+    # Persistent content-hash cache of converted files and EPUB members
+    DISK_CACHE = os.getenv("CHINESE_CONVERTER_DISK_CACHE", "false").lower() == "true"
+    DISK_CACHE_MAX_BYTES = int(os.getenv("CHINESE_CONVERTER_DISK_CACHE_MAX_MB", 1024)) * 1024 * 1024
+
+    # Worker processes converting members of one EPUB, and members queued at once
+    MEMBER_JOBS = int(os.getenv("CHINESE_CONVERTER_MEMBER_JOBS", 1))
+    MAX_INFLIGHT_MEMBERS = int(os.getenv("CHINESE_CONVERTER_MAX_INFLIGHT_MEMBERS", 16))
+
+    # Watch mode: seconds between scans, seconds a file must stay unchanged before
+    # it is converted, and conversions queued at once
+    WATCH_INTERVAL = float(os.getenv("CHINESE_CONVERTER_WATCH_INTERVAL", 2.0))
+    WATCH_SETTLE = float(os.getenv("CHINESE_CONVERTER_WATCH_SETTLE", 5.0))
+    WATCH_QUEUE_SIZE = int(os.getenv("CHINESE_CONVERTER_WATCH_QUEUE_SIZE", 8))
+
+    # Profiling: rows shown for slowest members and functions, and where .prof files go
+    PROFILE_TOP = int(os.getenv("CHINESE_CONVERTER_PROFILE_TOP", 10))
+    PROFILE_DIRECTORY = Config.TEMP_DIRECTORY / "profiles"
+
+    # Bytes decoded per chunk when streaming TXT files (default: 128 x CHUNK_SIZE)
+    TXT_CHUNK_SIZE = int(os.getenv("CHINESE_CONVERTER_TXT_CHUNK_SIZE", Config.CHUNK_SIZE * 128))
+
+    # TXT encodings: input is 'auto' (sniffed from TXT_ENCODINGS) or a codec name;
+    # output is a codec name or 'input' to keep the input's encoding
+    TXT_INPUT_ENCODING = os.getenv("CHINESE_CONVERTER_TXT_INPUT_ENCODING", "auto")
+    TXT_OUTPUT_ENCODING = os.getenv("CHINESE_CONVERTER_TXT_OUTPUT_ENCODING", "utf-8")
+    TXT_ENCODINGS = os.getenv("CHINESE_CONVERTER_TXT_ENCODINGS", "utf-8,gb18030,big5").split(",")
+    TXT_ENCODING_SAMPLE = int(os.getenv("CHINESE_CONVERTER_TXT_ENCODING_SAMPLE", 65536))
 
     # File processing
     TRANSLATABLE_EXTENSIONS = {
@@ -26,6 +78,9 @@ class EPUBConfig:
         ".css",
     }
 
+    # HTML attributes whose values are converted
+    TRANSLATABLE_ATTRIBUTES = ("title", "alt")
+
     # EPUB structure constants
     MIMETYPE_FILE = "mimetype"
     META_INF_DIR = "META-INF"
@@ -1,14 +1,33 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from chinese_converter.timing import StageTimer
+
 
 class BaseFormatHandler(ABC):
     """Abstract base class for format handlers."""
 
-    def __init__(self, path: Path, converter):
+    def __init__(self, path: Path, converter, streaming: bool = False, cache=None):
         self.path = path
         self.converter = converter
-        self.stats = {"files_processed": 0, "texts_converted": 0, "errors": 0}
+        self.streaming = streaming
+        self.cache = cache
+        self.stats = {
+            "files_processed": 0,
+            "texts_converted": 0,
+            "errors": 0,
+            "skipped": 0,
+            "disk_cache_hits": 0,
+        }
+        self.timer = StageTimer()
+        self.member_timings: dict[str, dict[str, float]] = {}
+        self._converter_baseline = dict(converter.stats)
+
+    def record_converter_stats(self):
+        """Add converter counters accumulated since the last call to stats."""
+        for key, value in self.converter.stats.items():
+            self.stats[key] = self.stats.get(key, 0) + value - self._converter_baseline.get(key, 0)
+        self._converter_baseline = dict(self.converter.stats)
 
     @abstractmethod
     def process_file(self, input_path: Path, output_path: Path) -> bool:
@@ -1,14 +1,24 @@
 """Combined EPUB handling, processing, and validation."""
 
+import copy
 import shutil
+import struct
+import sys
 import tempfile
 import zipfile
-from pathlib import Path
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path, PurePosixPath
 
 from bs4 import BeautifulSoup, NavigableString
 from lxml import etree
 
+from chinese_converter.cache import content_digest
 from chinese_converter.formats.base_handler import BaseFormatHandler
+from chinese_converter.text_converter import ChineseConverter, has_chinese
+from chinese_converter.timing import StageTimer
 from config import Config
 from logger_setup import get_logger
 
@@ -16,13 +26,85 @@ from ..config import EPUBConfig
 
 logger = get_logger(__name__, "chinese_converter")
 
+# _copy_raw_member writes through private zipfile state. It matches ZipFile.mkdir
+# on these CPython versions; anywhere else members are copied with writestr.
+_RAW_COPY_PYTHON = (3, 10) <= sys.version_info[:2] <= (3, 13) and hasattr(zipfile, "_strip_extra")
+_RAW_COPY_ATTRIBUTES = (
+    "_lock",
+    "_seekable",
+    "_writecheck",
+    "_didModify",
+    "start_dir",
+    "fp",
+    "filelist",
+    "NameToInfo",
+)
+
+# Strict parser for well-formed XHTML; entities are left alone, never fetched
+# and CDATA sections survive the round trip instead of becoming escaped text
+_XHTML_PARSER = etree.XMLParser(
+    resolve_entities=False, no_network=True, huge_tree=True, strip_cdata=False
+)
+
+# HTML elements that may be written self-closing; lxml writes any other element
+# without content as <tag/>, which HTML readers take as an unclosed start tag
+_VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+def _text_is_cdata(node: etree._Element) -> bool:
+    """Return True if the element's leading text was parsed from a CDATA section."""
+    serialized = etree.tostring(node, with_tail=False)
+    # lxml escapes ">" inside attribute values, so the first one ends the start tag
+    return serialized[serialized.index(b">") + 1 :].startswith(b"<![CDATA[")
+
+
+def _set_cdata_text(node: etree._Element, text: str):
+    """Store converted text back into an element as a CDATA section."""
+    node.text = etree.CDATA(text)
+
+
+# Per-process handler used by member workers, built once in _init_member_worker
+_worker_handler = None
+
 
 class EPUBHandler(BaseFormatHandler):
     """Handles all EPUB operations: extraction, processing, validation, and creation."""
 
-    def __init__(self, path: Path, converter):
-        """Initialize with EPUB path and text converter."""
-        super().__init__(path, converter)
+    def __init__(
+        self,
+        path: Path,
+        converter,
+        streaming: bool = False,
+        cache=None,
+        member_jobs: int = EPUBConfig.MEMBER_JOBS,
+        max_inflight: int = EPUBConfig.MAX_INFLIGHT_MEMBERS,
+    ):
+        """Initialize with EPUB path, text converter and optional ConversionCache.
+
+        member_jobs > 1 converts members in that many worker processes, with at
+        most max_inflight members read but not yet written at any time. Member
+        parallelism always uses the streaming path.
+        """
+        super().__init__(path, converter, streaming, cache)
+        self.member_jobs = member_jobs
+        self.max_inflight = max(max_inflight, 1)
         self.temp_dir = None
 
         if not self.path.exists():
@@ -36,6 +118,9 @@ class EPUBHandler(BaseFormatHandler):
             logger.error(f"EPUB not found: {input_path}")
             return False
 
+        if self.streaming or self.member_jobs > 1:
+            return self.process_stream(output_path)
+
         try:
             # Use existing process() method
             if self.process():
@@ -58,7 +143,7 @@ class EPUBHandler(BaseFormatHandler):
         errors = []
 
         try:
-            with zipfile.ZipFile(self.path, "r") as zf:
+            with self.timer.stage("validate"), zipfile.ZipFile(self.path, "r") as zf:
                 files = zf.namelist()
 
                 if "mimetype" not in files:
@@ -103,6 +188,126 @@ class EPUBHandler(BaseFormatHandler):
             logger.error(f"Processing failed: {e}")
             return False
 
+    def process_stream(self, output_path: Path) -> bool:
+        """Convert EPUB member by member straight into the output archive.
+
+        Translatable members are converted in memory; every other member, and
+        any translatable member left unchanged, is copied as raw compressed
+        bytes. No temp directory is created.
+        """
+        valid, errors = self.validate()
+        if not valid:
+            logger.error(f"Invalid EPUB: {'; '.join(errors)}")
+            return False
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with (
+                zipfile.ZipFile(self.path, "r") as src,
+                open(self.path, "rb") as raw,
+                zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as dst,
+            ):
+                # Add mimetype first (uncompressed)
+                with self.timer.stage("zip"):
+                    dst.writestr(
+                        EPUBConfig.MIMETYPE_FILE,
+                        src.read(EPUBConfig.MIMETYPE_FILE),
+                        compress_type=zipfile.ZIP_STORED,
+                    )
+
+                members = [
+                    info
+                    for info in src.infolist()
+                    if not info.is_dir() and info.filename != EPUBConfig.MIMETYPE_FILE
+                ]
+                if self.member_jobs > 1:
+                    self._write_members_parallel(src, raw, dst, members)
+                else:
+                    for info in members:
+                        if not _is_translatable(info):
+                            with self.timer.stage("zip"):
+                                _write_member(src, raw, dst, info, None)
+                            continue
+
+                        with self.timer.record() as timings:
+                            with self.timer.stage("unzip"):
+                                content = src.read(info)
+                            converted = self._convert_member(info.filename, content)
+                            with self.timer.stage("zip"):
+                                _write_member(
+                                    src, raw, dst, info, None if converted is content else converted
+                                )
+                        self.member_timings[info.filename] = timings
+
+            logger.info(f"Saved EPUB: {output_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Streaming conversion failed: {e}")
+            output_path.unlink(missing_ok=True)
+            return False
+
+    def _write_members_parallel(self, src, raw, dst, members: list[zipfile.ZipInfo]):
+        """Convert translatable members in a process pool, writing in archive order.
+
+        Skipped and cached members are resolved here; the rest are submitted to
+        the pool. Results are written as soon as the oldest pending member is
+        done, and reading stops while max_inflight members are waiting, so
+        memory is bounded no matter how many chapters the book has.
+        """
+        pending = deque()
+        with ProcessPoolExecutor(
+            max_workers=self.member_jobs,
+            initializer=_init_member_worker,
+            initargs=(
+                self.path,
+                self.converter.conversion_type,
+                self.converter.engine,
+                self.converter.cache_size,
+            ),
+        ) as executor:
+            for info in members:
+                entry = None
+                if _is_translatable(info):
+                    with self.timer.stage("unzip"):
+                        content = src.read(info)
+                    with self.timer.stage("parse"):
+                        resolved, key = self._resolve_member(info.filename, content)
+                    if resolved is None:
+                        future = executor.submit(_convert_member_in_worker, info.filename, content)
+                        entry = (future, key, content)
+                    elif resolved is not content:
+                        entry = (resolved, None, None)
+                pending.append((info, entry))
+
+                while pending and (len(pending) > self.max_inflight or _is_ready(pending[0])):
+                    self._write_pending(src, raw, dst, *pending.popleft())
+
+            while pending:
+                self._write_pending(src, raw, dst, *pending.popleft())
+
+    def _write_pending(self, src, raw, dst, info: zipfile.ZipInfo, entry):
+        """Write one queued member, collecting its worker result if needed."""
+        if entry is None:
+            with self.timer.stage("zip"):
+                _write_member(src, raw, dst, info, None)
+            return
+
+        with self.timer.record() as timings:
+            converted, key, content = entry
+            if isinstance(converted, Future):
+                converted, stats, worker_timings = converted.result()
+                for name, value in stats.items():
+                    self.stats[name] = self.stats.get(name, 0) + value
+                self.timer.merge(worker_timings)
+                if key is not None and not stats["errors"]:
+                    self.cache.put(key, content if converted is None else converted)
+            with self.timer.stage("zip"):
+                _write_member(src, raw, dst, info, converted)
+        self.member_timings[info.filename] = timings
+
     def save_as(self, output_path: str) -> bool:
         """Save processed EPUB to new file."""
         if not self.temp_dir:
@@ -113,7 +318,10 @@ class EPUBHandler(BaseFormatHandler):
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            with (
+                self.timer.stage("zip"),
+                zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf,
+            ):
                 # Add mimetype first (uncompressed)
                 mimetype_path = Path(self.temp_dir) / "mimetype"
                 if mimetype_path.exists():
@@ -136,7 +344,7 @@ class EPUBHandler(BaseFormatHandler):
         """Extract EPUB to temp directory."""
         self.temp_dir = tempfile.mkdtemp(prefix=Config.TEMP_DIR_PREFIX, dir=Config.TEMP_DIRECTORY)
 
-        with zipfile.ZipFile(self.path, "r") as zf:
+        with self.timer.stage("unzip"), zipfile.ZipFile(self.path, "r") as zf:
             zf.extractall(self.temp_dir)
 
         logger.info(f"Extracted to: {self.temp_dir}")
@@ -151,34 +359,87 @@ class EPUBHandler(BaseFormatHandler):
                 self._process_file(file_path)
 
     def _process_file(self, file_path: Path):
-        """Process a single file based on its type."""
+        """Process a single extracted file in place."""
+        with self.timer.record() as timings:
+            with self.timer.stage("unzip"):
+                content = file_path.read_bytes()
+            converted = self._convert_member(file_path.name, content)
+            if converted is not content:
+                with self.timer.stage("zip"):
+                    file_path.write_bytes(converted)
+        self.member_timings[file_path.relative_to(self.temp_dir).as_posix()] = timings
+
+    def _convert_member(self, name: str, content: bytes) -> bytes:
+        """Convert a single member based on its type.
+
+        Returns the original bytes object unchanged if nothing was rewritten,
+        which includes members with no convertible characters at all.
+        """
+        with self.timer.stage("parse"):
+            resolved, key = self._resolve_member(name, content)
+            if resolved is not None:
+                return resolved
+
+            errors = self.stats["errors"]
+            converted = self._convert_member_uncached(name, content)
+            if key is not None and self.stats["errors"] == errors:
+                self.cache.put(key, converted)
+            return converted
+
+    def _resolve_member(self, name: str, content: bytes) -> tuple[bytes | None, str | None]:
+        """Settle a member without parsing it, when possible.
+
+        Returns (result, None) for members that need no conversion or are in
+        the disk cache, otherwise (None, cache_key); the key is None when no
+        cache is configured.
+        """
+        if not _has_convertible(content):
+            logger.debug(f"Skipping {name}: no convertible characters")
+            self.stats["skipped"] += 1
+            return content, None
+
+        if self.cache is None:
+            return None, None
+
+        key = self.cache.make_key(
+            content_digest(content), PurePosixPath(name).suffix.lower(), self.converter
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats["disk_cache_hits"] += 1
+            self.stats["files_processed"] += 1
+            return (content if cached == content else cached), None
+        return None, key
+
+    def _convert_member_uncached(self, name: str, content: bytes) -> bytes:
+        """Parse and convert a member that contains convertible characters."""
         try:
-            extension = file_path.suffix.lower()
-            name = file_path.name.lower()
+            extension = PurePosixPath(name).suffix.lower()
+            filename = PurePosixPath(name).name.lower()
 
-            if extension == ".opf" or "content.opf" in name:
-                self._process_opf(file_path)
+            if extension == ".opf" or "content.opf" in filename:
+                content = self._process_opf(content)
             elif extension == ".ncx":
-                self._process_ncx(file_path)
+                content = self._process_ncx(content)
             elif extension in {".xhtml", ".html", ".htm"}:
-                self._process_html(file_path)
+                content = self._process_html(content)
             elif extension in {".xml", ".css"}:
-                self._process_text_file(file_path)
+                content = self._process_text_file(content)
 
             self.stats["files_processed"] += 1
 
         except Exception as e:
-            logger.error(f"Error processing {file_path}: {e}")
+            logger.error(f"Error processing {name}: {e}")
             self.stats["errors"] += 1
 
-    def _process_opf(self, file_path: Path):
-        """Process OPF metadata file."""
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+        return content
 
-        root = etree.fromstring(content.encode("utf-8"))
+    def _process_opf(self, content: bytes) -> bytes:
+        """Process OPF metadata file."""
+        root = etree.fromstring(content)
 
         # Process metadata
+        nodes = []
         namespaces = {"dc": "http://purl.org/dc/elements/1.1/"}
         for xpath in [
             ".//dc:title",
@@ -188,73 +449,116 @@ class EPUBHandler(BaseFormatHandler):
         ]:
             for elem in root.xpath(xpath, namespaces=namespaces):
                 if elem.text:
-                    converted = self.converter.convert(elem.text)
-                    if converted != elem.text:
-                        elem.text = converted
-                        self.stats["texts_converted"] += 1
+                    nodes.append((elem.text, partial(setattr, elem, "text")))
+        self._convert_nodes(nodes)
 
-        with open(file_path, "wb") as f:
-            f.write(etree.tostring(root, encoding="utf-8", xml_declaration=True))
+        with self.timer.stage("serialize"):
+            return etree.tostring(root, encoding="utf-8", xml_declaration=True)
 
-    def _process_ncx(self, file_path: Path):
+    def _process_ncx(self, content: bytes) -> bytes:
         """Process NCX navigation file."""
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        root = etree.fromstring(content.encode("utf-8"))
-
-        for elem in root.xpath(".//*[local-name()='text']"):
-            if elem.text:
-                converted = self.converter.convert(elem.text)
-                if converted != elem.text:
-                    elem.text = converted
-                    self.stats["texts_converted"] += 1
-
-        with open(file_path, "wb") as f:
-            f.write(etree.tostring(root, encoding="utf-8", xml_declaration=True))
-
-    def _process_html(self, file_path: Path):
-        """Process HTML content files."""
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        soup = BeautifulSoup(content, "html.parser")
-
-        # Process text nodes
-        for text_node in soup.find_all(string=True):
-            if isinstance(text_node, NavigableString) and text_node.strip():
-                converted = self.converter.convert(str(text_node))
-                if converted != str(text_node):
-                    text_node.replace_with(converted)
-                    self.stats["texts_converted"] += 1
-
-        # Process attributes
-        for tag in soup.find_all(attrs={"title": True}):
-            converted = self.converter.convert(tag["title"])
-            if converted != tag["title"]:
-                tag["title"] = converted
-                self.stats["texts_converted"] += 1
+        root = etree.fromstring(content)
 
-        for tag in soup.find_all(attrs={"alt": True}):
-            converted = self.converter.convert(tag["alt"])
-            if converted != tag["alt"]:
-                tag["alt"] = converted
-                self.stats["texts_converted"] += 1
+        nodes = [
+            (elem.text, partial(setattr, elem, "text"))
+            for elem in root.xpath(".//*[local-name()='text']")
+            if elem.text
+        ]
+        self._convert_nodes(nodes)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(str(soup))
+        with self.timer.stage("serialize"):
+            return etree.tostring(root, encoding="utf-8", xml_declaration=True)
 
-    def _process_text_file(self, file_path: Path):
+    def _process_html(self, content: bytes) -> bytes:
+        """Process HTML content files, preferring the lxml XHTML path."""
+        try:
+            return self._process_xhtml(content)
+        except etree.XMLSyntaxError as e:
+            # Not well-formed XML (e.g. tag-soup HTML); let BeautifulSoup repair it
+            logger.debug(f"Falling back to BeautifulSoup: {e}")
+            return self._process_html_soup(content)
+
+    def _process_xhtml(self, content: bytes) -> bytes:
+        """Convert text, tails and whitelisted attributes in a single lxml pass."""
+        root = etree.fromstring(content, _XHTML_PARSER)
+        has_cdata = b"<![CDATA[" in content
+
+        nodes = []
+        for node in root.iter():
+            is_element = isinstance(node.tag, str)
+            if node.text and (is_element or node.tag is etree.Comment):
+                if has_cdata and is_element and _text_is_cdata(node):
+                    setter = partial(_set_cdata_text, node)
+                else:
+                    setter = partial(setattr, node, "text")
+                nodes.append((node.text, setter))
+            elif (
+                is_element
+                and node.text is None
+                and len(node) == 0
+                and etree.QName(node).localname not in _VOID_ELEMENTS
+            ):
+                # An empty text keeps lxml from writing the element self-closing
+                node.text = ""
+
+            if node.tail:
+                nodes.append((node.tail, partial(setattr, node, "tail")))
+
+            if is_element:
+                for attr in EPUBConfig.TRANSLATABLE_ATTRIBUTES:
+                    value = node.get(attr)
+                    if value:
+                        nodes.append((value, partial(node.set, attr)))
+        self._convert_nodes(nodes)
+
+        with self.timer.stage("serialize"):
+            return etree.tostring(root.getroottree(), encoding="utf-8", xml_declaration=True)
+
+    def _process_html_soup(self, content: bytes) -> bytes:
+        """Process malformed HTML content files with BeautifulSoup."""
+        soup = BeautifulSoup(content.decode("utf-8"), "html.parser")
+
+        # Collect text nodes
+        nodes = [
+            (str(text_node), text_node.replace_with)
+            for text_node in soup.find_all(string=True)
+            if isinstance(text_node, NavigableString) and text_node.strip()
+        ]
+
+        # Collect attributes
+        for attr in EPUBConfig.TRANSLATABLE_ATTRIBUTES:
+            for tag in soup.find_all(attrs={attr: True}):
+                nodes.append((tag[attr], partial(tag.__setitem__, attr)))
+
+        self._convert_nodes(nodes)
+
+        with self.timer.stage("serialize"):
+            return str(soup).encode("utf-8")
+
+    def _convert_nodes(self, nodes: list[tuple[str, Callable[[str], object]]]):
+        """Convert collected strings in one batch and write back the changed ones.
+
+        Args:
+            nodes: (text, setter) pairs; the setter stores the converted text
+        """
+        with self.timer.stage("convert"):
+            converted = self.converter.convert_many([text for text, _ in nodes])
+        for (text, setter), new_text in zip(nodes, converted, strict=True):
+            if new_text != text:
+                setter(new_text)
+                self.stats["texts_converted"] += 1
+
+    def _process_text_file(self, content: bytes) -> bytes:
         """Process generic text files (CSS, XML)."""
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+        text = content.decode("utf-8")
 
         # Simple text conversion (works for CSS comments and XML text)
-        converted_content = self.converter.convert(content)
-        if converted_content != content:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(converted_content)
+        with self.timer.stage("convert"):
+            converted_text = self.converter.convert(text)
+        if converted_text != text:
             self.stats["texts_converted"] += 1
+            return converted_text.encode("utf-8")
+        return content
 
     def cleanup(self):
         """Clean up temp directory."""
@@ -267,3 +571,122 @@ class EPUBHandler(BaseFormatHandler):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.cleanup()
+
+
+def _has_convertible(content: bytes) -> bool:
+    """Check member bytes for convertible characters without parsing the document."""
+    if content.isascii():
+        return False
+    return has_chinese(content.decode("utf-8", errors="ignore"))
+
+
+def _output_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Create a fresh ZipInfo for a rewritten member, keeping name, date and attributes."""
+    out = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    out.external_attr = info.external_attr
+    out.create_system = info.create_system
+    return out
+
+
+def _can_copy_raw(dst: zipfile.ZipFile) -> bool:
+    """Check that dst has the private zipfile state _copy_raw_member relies on."""
+    return _RAW_COPY_PYTHON and all(hasattr(dst, name) for name in _RAW_COPY_ATTRIBUTES)
+
+
+def _copy_member(src: zipfile.ZipFile, raw, dst: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """Copy an unchanged member: raw when zipfile allows it, else through writestr."""
+    if _can_copy_raw(dst) and not info.flag_bits & 0x1:
+        _copy_raw_member(raw, dst, info)
+    else:
+        dst.writestr(_output_info(info), src.read(info), compress_type=info.compress_type)
+
+
+def _copy_raw_member(raw, dst: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """Copy a member's compressed bytes verbatim, without inflating or deflating them.
+
+    zipfile has no public API for writing pre-compressed data, so this mirrors
+    what ``ZipFile.mkdir`` does: write the local header and payload directly to
+    the archive's file object and register the entry for the central directory.
+    Only call it when _can_copy_raw(dst) holds.
+
+    Args:
+        raw: Binary file object opened on the source archive
+        dst: Output archive opened in write mode
+        info: Source member to copy
+    """
+    if info.flag_bits & 0x1:
+        raise zipfile.BadZipFile(f"Encrypted member not supported: {info.filename}")
+
+    # Locate the payload behind the member's local file header
+    raw.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, raw.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header: {info.filename}")
+    raw.seek(header[10] + header[11], 1)  # skip file name and extra field
+
+    out = copy.copy(info)
+    out.flag_bits &= ~0x08  # sizes and CRC are known, no data descriptor
+    out.extra = zipfile._strip_extra(info.extra, (1,))  # zip64 extra is re-added if needed
+
+    with dst._lock:
+        if dst._seekable:
+            dst.fp.seek(dst.start_dir)
+        out.header_offset = dst.fp.tell()
+        dst._writecheck(out)
+        dst._didModify = True
+
+        dst.fp.write(out.FileHeader(None))
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = raw.read(min(Config.CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member: {info.filename}")
+            dst.fp.write(chunk)
+            remaining -= len(chunk)
+
+        dst.filelist.append(out)
+        dst.NameToInfo[out.filename] = out
+        dst.start_dir = dst.fp.tell()
+
+
+def _is_translatable(info: zipfile.ZipInfo) -> bool:
+    """Check whether a member's extension marks it for conversion."""
+    return PurePosixPath(info.filename).suffix.lower() in EPUBConfig.TRANSLATABLE_EXTENSIONS
+
+
+def _is_ready(pending_entry) -> bool:
+    """Check whether a queued member can be written without blocking."""
+    _, entry = pending_entry
+    return entry is None or not isinstance(entry[0], Future) or entry[0].done()
+
+
+def _write_member(
+    src: zipfile.ZipFile, raw, dst: zipfile.ZipFile, info: zipfile.ZipInfo, converted: bytes | None
+):
+    """Write converted bytes for a member, or copy it unchanged when converted is None."""
+    if converted is None:
+        _copy_member(src, raw, dst, info)
+    else:
+        dst.writestr(_output_info(info), converted, compress_type=zipfile.ZIP_DEFLATED)
+
+
+def _init_member_worker(path: Path, conversion_type: str, engine: str, cache_size: int):
+    """Build the worker's handler and converter once for all members of a book."""
+    global _worker_handler
+    converter = ChineseConverter(conversion_type, cache_size=cache_size, engine=engine)
+    _worker_handler = EPUBHandler(path, converter)
+
+
+def _convert_member_in_worker(name: str, content: bytes) -> tuple[bytes | None, dict, dict]:
+    """Convert one member in a worker process.
+
+    Returns the converted bytes, or None if the member is unchanged, together
+    with the stats and stage timings this member added.
+    """
+    handler = _worker_handler
+    handler.stats = dict.fromkeys(handler.stats, 0)
+    handler.timer = StageTimer()
+    with handler.timer.stage("parse"):
+        converted = handler._convert_member_uncached(name, content)
+    handler.record_converter_stats()
+    return (None if converted is content else converted), handler.stats, handler.timer.totals
@@ -1,31 +1,70 @@
 """Combined TXT handling, processing, and validation."""
 
+import codecs
+import logging
+import mmap
+import os
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
+from chinese_converter.charset import detect_encoding
 from chinese_converter.formats.base_handler import BaseFormatHandler
+from chinese_converter.text_converter import CJK_RE, SEPARATOR_RE, find_convertible_ranges
 from logger_setup import get_logger
 
+from ..config import EPUBConfig
+
 logger = get_logger(__name__, "chinese_converter")
 
+# How many chunks may accumulate without a safe boundary before forcing a cut
+_MAX_CARRY_CHUNKS = 4
+
 
 class TXTHandler(BaseFormatHandler):
     """Handles TXT file processing."""
 
-    def __init__(self, path, converter):
-        super().__init__(path, converter)
+    def __init__(
+        self,
+        path,
+        converter,
+        streaming: bool = False,
+        cache=None,
+        input_encoding: str = EPUBConfig.TXT_INPUT_ENCODING,
+        output_encoding: str = EPUBConfig.TXT_OUTPUT_ENCODING,
+    ):
+        """Initialize with TXT path and text converter.
+
+        input_encoding is a codec name or 'auto' to sniff it from the first
+        TXT_ENCODING_SAMPLE bytes; output_encoding is a codec name or 'input'
+        to write the output in the input's encoding.
+        """
+        super().__init__(path, converter, streaming, cache)
+        self.input_encoding = input_encoding
+        self.output_encoding = output_encoding
+        self.chunk_size = EPUBConfig.TXT_CHUNK_SIZE
+        self._line = 1  # line number of the next text handed to _convert_text
 
     def process_file(self, input_path: Path, output_path: Path) -> bool:
         """Process TXT file with Chinese conversion."""
+        self._line = 1
         try:
-            with open(input_path, encoding="utf-8") as f:
-                content = f.read()
+            if self.streaming:
+                changed = self._process_stream(Path(input_path), Path(output_path))
+            else:
+                with self.timer.stage("read"):
+                    data = Path(input_path).read_bytes()
+                    encoding = self._resolve_input_encoding(data[: EPUBConfig.TXT_ENCODING_SAMPLE])
+                    content = codecs.decode(data, encoding)
+
+                converted_content = self._convert_text(content)
 
-            converted_content = self.converter.convert(content)
+                with self.timer.stage("write"):
+                    output_encoding = self._resolve_output_encoding(encoding)
+                    Path(output_path).write_bytes(codecs.encode(converted_content, output_encoding))
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(converted_content)
+                changed = converted_content != content
 
-            if converted_content != content:
+            if changed:
                 self.stats["texts_converted"] += 1
 
             self.stats["files_processed"] += 1
@@ -36,8 +75,169 @@ class TXTHandler(BaseFormatHandler):
             self.stats["errors"] += 1
             return False
 
+    def _process_stream(self, input_path: Path, output_path: Path) -> bool:
+        """Convert a memory-mapped file in a single incremental decode/encode pass.
+
+        The input is never read into one string: chunk_size bytes at a time
+        are decoded from the mapping, converted and encoded straight into the
+        output. Writing over the input goes through a temporary file, since
+        truncating a mapped file is not safe.
+
+        Returns:
+            True if any chunk was changed by the conversion
+        """
+        in_place = output_path.exists() and os.path.samefile(input_path, output_path)
+        target = output_path.with_name(output_path.name + ".part") if in_place else output_path
+
+        try:
+            with open(input_path, "rb") as src, open(target, "wb") as dst:
+                if os.fstat(src.fileno()).st_size == 0:
+                    changed = False
+                else:
+                    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        encoding = self._resolve_input_encoding(
+                            mapped[: EPUBConfig.TXT_ENCODING_SAMPLE]
+                        )
+                        encoder = codecs.getincrementalencoder(
+                            self._resolve_output_encoding(encoding)
+                        )()
+                        chunks = self._decode_chunks(mapped, encoding)
+                        try:
+                            changed = self._convert_chunks(
+                                chunks, lambda text: dst.write(encoder.encode(text))
+                            )
+                        finally:
+                            chunks.close()  # release the view before the mapping closes
+                        dst.write(encoder.encode("", final=True))
+        except BaseException:
+            if in_place:
+                target.unlink(missing_ok=True)
+            raise
+
+        if in_place:
+            os.replace(target, output_path)
+        return changed
+
+    def _decode_chunks(self, mapped: mmap.mmap, encoding: str) -> Iterator[str]:
+        """Incrementally decode the mapping chunk_size bytes at a time."""
+        decoder = codecs.getincrementaldecoder(encoding)()
+        with memoryview(mapped) as view:
+            for start in range(0, len(view), self.chunk_size):
+                with self.timer.stage("read"):
+                    text = decoder.decode(view[start : start + self.chunk_size])
+                if text:
+                    yield text
+        with self.timer.stage("read"):
+            tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def _convert_chunks(self, chunks: Iterable[str], write: Callable[[str], object]) -> bool:
+        """Convert decoded chunks cut on line boundaries and pass them to write.
+
+        Chunks are cut after the last newline (or, failing that, the last
+        separator OpenCC splits on) so phrase matches never straddle a cut.
+
+        Returns:
+            True if any chunk was changed by the conversion
+        """
+        changed = False
+        carry = ""
+        carried = 0  # chunks held back in carry since the last cut
+
+        for chunk in chunks:
+            buffer = carry + chunk
+            cut = _find_boundary(buffer)
+            if cut == 0:
+                carried += 1
+                if carried < _MAX_CARRY_CHUNKS:
+                    carry = buffer
+                    continue
+                logger.warning(f"No line boundary within {carried} chunks, forcing a cut")
+                cut = _find_forced_cut(buffer)
+
+            carried = 0
+            head, carry = buffer[:cut], buffer[cut:]
+            converted = self._convert_text(head)
+            changed = changed or converted != head
+            with self.timer.stage("write"):
+                write(converted)
+
+        if carry:
+            converted = self._convert_text(carry)
+            changed = changed or converted != carry
+            with self.timer.stage("write"):
+                write(converted)
+
+        return changed
+
+    def _resolve_input_encoding(self, sample: bytes) -> str:
+        """Return the configured input encoding, sniffing it from sample if 'auto'."""
+        if self.input_encoding != "auto":
+            return self.input_encoding
+
+        encoding = detect_encoding(sample)
+        logger.info(f"Detected encoding: {encoding}")
+        return encoding
+
+    def _resolve_output_encoding(self, input_encoding: str) -> str:
+        """Return the output codec, mapping 'input' to the input's encoding."""
+        return input_encoding if self.output_encoding == "input" else self.output_encoding
+
+    def _convert_text(self, text: str) -> str:
+        """Convert only the line ranges that contain convertible characters.
+
+        Line ranges without any are copied verbatim and counted as skipped;
+        the rest are converted together in one batched call.
+        """
+        with self.timer.stage("parse"):
+            ranges = find_convertible_ranges(text)
+        with self.timer.stage("convert"):
+            converted = iter(
+                self.converter.convert_many([text[start:end] for start, end in ranges])
+            )
+
+        with self.timer.stage("serialize"):
+            debug = logger.isEnabledFor(logging.DEBUG)  # skip building messages per gap
+            pieces = []
+            position = 0
+            for start, end in [*ranges, (len(text), len(text))]:
+                if start > position:
+                    gap_lines = text.count("\n", position, start)
+                    if debug:
+                        last_line = self._line + max(gap_lines - 1, 0)
+                        logger.debug(f"Lines {self._line}-{last_line}: no convertible characters")
+                    self.stats["skipped"] += 1
+                    pieces.append(text[position:start])
+                    self._line += gap_lines
+                if end > start:
+                    pieces.append(next(converted))
+                    self._line += text.count("\n", start, end)
+                position = end
+            return "".join(pieces)
+
     def validate_file(self, file_path: Path) -> tuple[bool, list]:
         """Validate TXT file."""
         if file_path.suffix.lower() != ".txt":
             return False, ["Not a TXT file"]
         return True, []
+
+
+def _find_boundary(text: str) -> int:
+    """Return the index just past the last safe cut point in text, or 0 if none."""
+    newline = text.rfind("\n")
+    if newline >= 0:
+        return newline + 1
+
+    return max((match.end() for match in SEPARATOR_RE.finditer(text)), default=0)
+
+
+def _find_forced_cut(text: str) -> int:
+    """Return the index just past the last run of convertible characters.
+
+    Dictionary phrases either are all convertible characters or end in one
+    (e.g. "U盤"), so no phrase continues past the end of a run; text without
+    such a point is cut at its end.
+    """
+    ends = (match.end() for match in CJK_RE.finditer(text))
+    return max((end for end in ends if end < len(text)), default=len(text))
@@ -0,0 +1,75 @@
+"""Optional cProfile / tracemalloc capture around a conversion."""
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+from logger_setup import get_logger
+
+from .config import EPUBConfig
+
+logger = get_logger(__name__, "chinese_converter")
+
+PROFILE_MODES = ["cprofile", "tracemalloc"]
+
+
+@contextmanager
+def profile(mode: str | None, label: str) -> Iterator[None]:
+    """Profile the enclosed block and log the heaviest entries.
+
+    Args:
+        mode: 'cprofile' for CPU time per function, 'tracemalloc' for memory
+            per allocation site, or None to do nothing
+        label: Name used in log lines and in the saved .prof file name
+    """
+    if mode is None:
+        yield
+    elif mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _report_cprofile(profiler, label)
+    elif mode == "tracemalloc":
+        tracemalloc.start()
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _report_tracemalloc(snapshot, peak, label)
+    else:
+        raise ValueError(f"Unknown profile mode: {mode}")
+
+
+def slowest_members(
+    member_timings: dict[str, dict[str, float]], limit: int = EPUBConfig.PROFILE_TOP
+) -> list[tuple[str, float, dict[str, float]]]:
+    """Return (name, total seconds, stage timings) for the slowest members."""
+    totals = [(name, sum(stages.values()), stages) for name, stages in member_timings.items()]
+    return sorted(totals, key=lambda item: item[1], reverse=True)[:limit]
+
+
+def _report_cprofile(profiler: cProfile.Profile, label: str):
+    EPUBConfig.PROFILE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = EPUBConfig.PROFILE_DIRECTORY / f"{label}-{stamp}.prof"
+    profiler.dump_stats(path)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).sort_stats("cumulative")
+    stats.print_stats(EPUBConfig.PROFILE_TOP)
+    logger.info(f"cProfile for {label} saved to {path}\n{stream.getvalue()}")
+
+
+def _report_tracemalloc(snapshot: tracemalloc.Snapshot, peak: int, label: str):
+    logger.info(f"tracemalloc for {label}: peak {peak / 1024 / 1024:.1f} MiB traced")
+    for stat in snapshot.statistics("lineno")[: EPUBConfig.PROFILE_TOP]:
+        logger.info(f"  {stat.size / 1024:.1f} KiB in {stat.count} blocks: {stat.traceback}")
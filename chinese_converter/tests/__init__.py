@@ -0,0 +1 @@
+"""Test package for chinese_converter."""
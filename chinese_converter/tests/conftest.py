@@ -0,0 +1,71 @@
+"""Shared fixtures for chinese_converter tests."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from chinese_converter.config import EPUBConfig
+
+CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+CONTENT_OPF = """<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:title>软件开发</dc:title>
+    <dc:creator>无名氏</dc:creator>
+  </metadata>
+</package>
+"""
+
+TOC_NCX = """<?xml version="1.0" encoding="utf-8"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
+  <navMap>
+    <navPoint id="p1"><navLabel><text>第一章 开始</text></navLabel></navPoint>
+  </navMap>
+</ncx>
+"""
+
+CHAPTER_XHTML = """<?xml version="1.0" encoding="utf-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>第一章 开始</title></head>
+<body>
+<h1 title="简体标题">第一章 开始</h1>
+<p>这是一个关于软件开发的故事。<img src="../images/cover.png" alt="封面图片"/></p>
+<p>Plain English paragraph.</p>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(autouse=True, scope="session")
+def trie_cache_directory(tmp_path_factory) -> Path:
+    """Keep compiled tries out of the user's cache directory during tests."""
+    original = EPUBConfig.TRIE_CACHE_DIRECTORY
+    EPUBConfig.TRIE_CACHE_DIRECTORY = tmp_path_factory.mktemp("opencc_trie")
+    yield EPUBConfig.TRIE_CACHE_DIRECTORY
+    EPUBConfig.TRIE_CACHE_DIRECTORY = original
+
+
+@pytest.fixture
+def sample_epub(tmp_path: Path) -> Path:
+    """Create a small but structurally valid EPUB with simplified Chinese content."""
+    epub_path = tmp_path / "sample.epub"
+    with zipfile.ZipFile(epub_path, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        zf.writestr("META-INF/container.xml", CONTAINER_XML, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/content.opf", CONTENT_OPF, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/toc.ncx", TOC_NCX, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/text/ch1.xhtml", CHAPTER_XHTML, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/style.css", "p { margin: 0; }\n", compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/images/cover.png", bytes(range(256)) * 64)
+        zf.writestr(
+            "OEBPS/fonts/font.ttf", b"\x00\x01\x00\x00" * 512, compress_type=zipfile.ZIP_DEFLATED
+        )
+    return epub_path
@@ -0,0 +1,50 @@
+"""Unit tests for chinese_converter backup strategies."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from chinese_converter.backup import make_backup
+
+
+@pytest.fixture
+def input_file(tmp_path: Path) -> Path:
+    path = tmp_path / "book.txt"
+    path.write_text("简体中文\n", encoding="utf-8")
+    return path
+
+
+class TestMakeBackup:
+    """Tests for make_backup."""
+
+    def test_copy_creates_independent_backup(self, input_file: Path, tmp_path: Path) -> None:
+        """Test that the copy strategy produces an identical, separate file."""
+        backup = make_backup(input_file, tmp_path / "out.txt", "copy")
+
+        assert backup == input_file.with_suffix(".txt.backup")
+        assert backup.read_bytes() == input_file.read_bytes()
+        assert not os.path.samefile(backup, input_file)
+
+    def test_hardlink_when_output_differs(self, input_file: Path, tmp_path: Path) -> None:
+        """Test that the hardlink strategy links instead of copying."""
+        backup = make_backup(input_file, tmp_path / "out.txt", "hardlink")
+
+        assert os.path.samefile(backup, input_file)
+
+    def test_hardlink_copies_when_converting_in_place(self, input_file: Path) -> None:
+        """Test that an in-place conversion still gets a real copy."""
+        backup = make_backup(input_file, input_file, "hardlink")
+
+        assert backup.read_bytes() == input_file.read_bytes()
+        assert not os.path.samefile(backup, input_file)
+
+    def test_skip_when_output_differs(self, input_file: Path, tmp_path: Path) -> None:
+        """Test that the skip strategy creates nothing for a separate output."""
+        assert make_backup(input_file, tmp_path / "out.txt", "skip") is None
+        assert not input_file.with_suffix(".txt.backup").exists()
+
+    def test_unknown_strategy(self, input_file: Path) -> None:
+        """Test that an unknown strategy is rejected."""
+        with pytest.raises(ValueError):
+            make_backup(input_file, input_file, "bogus")
@@ -0,0 +1,69 @@
+"""Unit tests for the chinese_converter benchmark harness."""
+
+import json
+import zipfile
+from pathlib import Path
+
+from chinese_converter.benchmark import _log_result, build_corpus, compare, run_benchmark
+from chinese_converter.formats.epub_handler import EPUBHandler
+from chinese_converter.text_converter import ChineseConverter
+
+
+class TestCorpus:
+    """Tests for synthetic corpus generation."""
+
+    def test_epub_corpus_is_valid_and_deterministic(self, tmp_path: Path) -> None:
+        """Test that generated EPUBs validate and depend only on the seed."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        first = build_corpus("epub_many_small", tmp_path / "a", scale=0.05, seed=1)
+        second = build_corpus("epub_many_small", tmp_path / "b", scale=0.05, seed=1)
+
+        handler = EPUBHandler(Path(first["path"]), ChineseConverter("s2t"))
+        assert handler.validate() == (True, [])
+        assert first["members"] == 502
+        with zipfile.ZipFile(first["path"]) as a, zipfile.ZipFile(second["path"]) as b:
+            assert [a.read(name) for name in a.namelist()] == [b.read(n) for n in b.namelist()]
+
+    def test_txt_corpus_counts_characters(self, tmp_path: Path) -> None:
+        """Test that the TXT corpus reports its length in characters."""
+        corpus = build_corpus("txt_large", tmp_path, scale=0.001)
+
+        assert corpus["chars"] == len(Path(corpus["path"]).read_text(encoding="utf-8"))
+
+
+class TestRunBenchmark:
+    """Tests for running cases and comparing reports."""
+
+    def test_report_is_json_with_stage_split(self, tmp_path: Path) -> None:
+        """Test that every case reports throughput and a per-stage time split."""
+        report = run_benchmark(["txt_large", "epub_few_huge"], ["s2t"], scale=0.001, isolate=False)
+
+        json.dumps(report)
+        txt, epub = report["results"]
+        assert txt["success"] and epub["success"]
+        assert txt["chars_per_sec"] > 0
+        assert {"read", "convert", "write"} <= txt["stages"].keys()
+        assert {"unzip", "parse", "convert", "serialize", "zip"} <= epub["stages"].keys()
+        assert epub["members"] == 7
+
+    def test_compare_reports_relative_change(self) -> None:
+        """Test that matching cases are paired with their baseline throughput."""
+        baseline = {"results": [{"corpus": "c", "conversion_type": "s2t", "chars_per_sec": 100}]}
+        report = {"results": [{"corpus": "c", "conversion_type": "s2t", "chars_per_sec": 150}]}
+
+        assert compare(report, baseline)[0]["change"] == 0.5
+
+    def test_untimed_result_is_logged(self) -> None:
+        """Test that a run too short to time logs n/a instead of failing."""
+        result = {
+            "corpus": "c",
+            "conversion_type": "s2t",
+            "seconds": 0.0,
+            "chars_per_sec": None,
+            "members_per_sec": None,
+            "peak_rss_mb": None,
+            "stages": {},
+        }
+
+        _log_result(result)
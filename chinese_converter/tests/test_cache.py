@@ -0,0 +1,85 @@
+"""Unit tests for chinese_converter persistent conversion cache."""
+
+from pathlib import Path
+
+import pytest
+
+from chinese_converter.cache import ConversionCache
+from chinese_converter.cli import ChineseTextConverter
+from chinese_converter.formats.epub_handler import EPUBHandler
+from chinese_converter.text_converter import ChineseConverter
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    cache = ConversionCache(tmp_path / "cache.sqlite3", max_bytes=1024)
+    yield cache
+    cache.close()
+
+
+class TestConversionCache:
+    """Tests for ConversionCache storage and eviction."""
+
+    def test_get_returns_stored_value(self, cache: ConversionCache) -> None:
+        """Test that a stored value round-trips and unknown keys miss."""
+        cache.put("a", b"value")
+
+        assert cache.get("a") == b"value"
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self, cache: ConversionCache) -> None:
+        """Test that the total size stays under the limit, dropping the oldest entry."""
+        cache.put("a", b"x" * 400)
+        cache.put("b", b"x" * 400)
+        cache.get("a")  # refresh a
+        cache.put("c", b"x" * 400)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_key_depends_on_converter_settings(self) -> None:
+        """Test that different conversion types never share cache keys."""
+        s2t = ChineseConverter("s2t")
+        t2s = ChineseConverter("t2s")
+
+        assert ConversionCache.make_key("abc", ".xhtml", s2t) != ConversionCache.make_key(
+            "abc", ".xhtml", t2s
+        )
+
+
+class TestCachedConversion:
+    """Tests for cache use in handlers and ChineseTextConverter."""
+
+    def test_epub_members_are_served_from_cache(
+        self, sample_epub: Path, tmp_path: Path, cache: ConversionCache
+    ) -> None:
+        """Test that a second conversion reuses every converted member."""
+        cache.max_bytes = 1024 * 1024
+        converter = ChineseConverter("s2t")
+        first = EPUBHandler(sample_epub, converter, streaming=True, cache=cache)
+        second = EPUBHandler(sample_epub, converter, streaming=True, cache=cache)
+
+        assert first.process_file(sample_epub, tmp_path / "first.epub")
+        assert second.process_file(sample_epub, tmp_path / "second.epub")
+
+        assert first.stats["disk_cache_hits"] == 0
+        assert second.stats["disk_cache_hits"] == first.stats["files_processed"]
+        assert (tmp_path / "first.epub").read_bytes() == (tmp_path / "second.epub").read_bytes()
+
+    def test_unchanged_file_is_skipped(self, tmp_path: Path, cache: ConversionCache) -> None:
+        """Test that an unchanged input with intact output is not converted again."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("简体中文\n", encoding="utf-8")
+        output_file = tmp_path / "output.txt"
+        converter = ChineseTextConverter("s2t")
+        converter.cache = cache
+
+        assert converter.convert_file(str(input_file), str(output_file), create_backup=False)
+        assert converter.last_stats["files_processed"] == 1
+        assert converter.convert_file(str(input_file), str(output_file), create_backup=False)
+        assert converter.last_stats == {"skipped": 1, "disk_cache_hits": 1}
+
+        output_file.write_text("tampered", encoding="utf-8")
+        assert converter.convert_file(str(input_file), str(output_file), create_backup=False)
+        assert output_file.read_text(encoding="utf-8") == "簡體中文\n"
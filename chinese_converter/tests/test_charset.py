@@ -0,0 +1,35 @@
+"""Unit tests for chinese_converter encoding detection."""
+
+import pytest
+
+from chinese_converter.charset import detect_encoding
+
+SIMPLIFIED = "这是一个关于软件开发的故事。他们在网络上发布了程序。\n" * 20
+TRADITIONAL = "這是一個關於軟件開發的故事。他們在網絡上發佈了程式。\n" * 20
+
+
+class TestDetectEncoding:
+    """Tests for detect_encoding."""
+
+    @pytest.mark.parametrize(
+        ("text", "encoding"),
+        [
+            (SIMPLIFIED, "utf-8"),
+            (SIMPLIFIED, "gb18030"),
+            (TRADITIONAL, "gb18030"),
+            (TRADITIONAL, "big5"),
+        ],
+    )
+    def test_detects_chinese_encodings(self, text: str, encoding: str) -> None:
+        """Test that GB18030 and Big5 are told apart even though both decode."""
+        assert detect_encoding(text.encode(encoding)[:101]) == encoding
+
+    @pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-32"])
+    def test_byte_order_mark_wins(self, encoding: str) -> None:
+        """Test that a BOM selects its encoding without scoring."""
+        assert detect_encoding(SIMPLIFIED.encode(encoding)) == encoding
+
+    def test_undecodable_sample_raises(self) -> None:
+        """Test that bytes no candidate can decode are rejected."""
+        with pytest.raises(ValueError):
+            detect_encoding(b"\xc3\x28" * 10, ["utf-8"])
@@ -0,0 +1,81 @@
+"""Unit tests for chinese_converter batch conversion."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from chinese_converter.cli import ChineseTextConverter
+
+
+@pytest.fixture
+def library(tmp_path: Path, sample_epub: Path) -> Path:
+    """Create a nested input library with TXT and EPUB files."""
+    root = tmp_path / "library"
+    (root / "series" / "vol2").mkdir(parents=True)
+    (root / "top.txt").write_text("简体中文\n", encoding="utf-8")
+    (root / "series" / "a.txt").write_text("软件开发\n", encoding="utf-8")
+    shutil.copy(sample_epub, root / "series" / "vol2" / "book.epub")
+    return root
+
+
+class TestConvertBatch:
+    """Tests for ChineseTextConverter.convert_batch."""
+
+    def test_top_level_only_by_default(self, library: Path, tmp_path: Path) -> None:
+        """Test that non-recursive mode only converts top-level files."""
+        output = tmp_path / "out"
+
+        results = ChineseTextConverter("s2t").convert_batch(str(library), str(output))
+
+        assert list(results) == [str(library / "top.txt")]
+        assert (output / "top.txt").read_text(encoding="utf-8") == "簡體中文\n"
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_recursive_mirrors_tree(self, library: Path, tmp_path: Path, jobs: int) -> None:
+        """Test that recursive mode mirrors subdirectories and aggregates stats."""
+        output = tmp_path / "out"
+        converter = ChineseTextConverter("s2t")
+
+        results = converter.convert_batch(str(library), str(output), jobs=jobs, recursive=True)
+
+        assert len(results) == 3
+        assert all(results.values())
+        assert (output / "series" / "a.txt").read_text(encoding="utf-8") == "軟件開發\n"
+        assert (output / "series" / "vol2" / "book.epub").exists()
+        assert converter.batch_stats["files"] == 3
+        assert converter.batch_stats["errors"] == 0
+        assert converter.batch_stats["texts"] > 0
+        assert converter.batch_stats["bytes"] > 0
+
+    def test_batch_workers_convert_members_serially(self) -> None:
+        """Test that --jobs workers do not each start a --member-jobs pool."""
+        converter = ChineseTextConverter("s2t", member_jobs=4)
+
+        with converter._worker_pool(2) as executor:
+            assert executor._initargs[5] == 1  # member_jobs
+
+        assert converter.member_jobs == 4
+
+
+class TestProfiling:
+    """Tests for per-stage timings and --profile capture."""
+
+    def test_records_stage_and_member_timings(self, sample_epub: Path, tmp_path: Path) -> None:
+        """Test that a conversion reports validate, per-member and zip timings."""
+        converter = ChineseTextConverter("s2t", streaming=True)
+
+        assert converter.convert_file(str(sample_epub), str(tmp_path / "out.epub"), False)
+
+        assert {"validate", "unzip", "parse", "convert", "zip"} <= converter.last_timings.keys()
+        chapter = converter.last_member_timings["OEBPS/text/ch1.xhtml"]
+        assert {"parse", "convert", "serialize"} <= chapter.keys()
+
+    def test_cprofile_dumps_stats(self, sample_epub: Path, tmp_path: Path, monkeypatch) -> None:
+        """Test that --profile cprofile saves a .prof file per converted file."""
+        monkeypatch.setattr("chinese_converter.config.EPUBConfig.PROFILE_DIRECTORY", tmp_path)
+        converter = ChineseTextConverter("s2t", profile_mode="cprofile")
+
+        assert converter.convert_file(str(sample_epub), str(tmp_path / "out.epub"), False)
+
+        assert len(list(tmp_path.glob("sample-*.prof"))) == 1
@@ -0,0 +1,87 @@
+"""Equivalence tests for the chinese_converter conversion engines."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from chinese_converter.benchmark import generate_text
+from chinese_converter.text_converter import OpenCCEngine, TrieEngine
+
+CORPUS = [
+    "这是一个关于软件开发的故事。",
+    "他们在网络上发布了程序，并且获得了很多用户的支持。",
+    "第一章 开始",
+    "后来，他的头发都白了，皇后站在他的后面。",
+    "我们一起去了图书馆借了几本书，然后在面馆吃了一碗面条。",
+    "乾隆皇帝下江南，干了一杯酒。",
+    "计算机科学与技术专业的学生正在学习数据结构和算法。",
+    "他说：“我们明天见！”她回答：“好的。”",
+    "只有一个人在里面，钟表显示已经十点钟了。",
+    "台湾和香港的繁体字有些差别，例如软件、网络、信息、内存。",
+    "Mixed English text with 中文 and numbers 123 and symbols -*?!",
+    "云里雾里，发财致富，几乎没有什么困难。\n\n新的一段落。",
+    "东西历史",  # forward maximum matching would take 西历 here
+]
+
+# Generated prose mixing simplified and traditional words, as in the benchmark
+GENERATED_SEEDS = range(40)
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("trie_cache")
+
+
+@pytest.mark.parametrize("conversion_type", ["s2t", "s2tw", "s2hk", "t2s"])
+def test_trie_matches_opencc(conversion_type: str, cache_dir: Path) -> None:
+    """Test that the trie engine produces the same output as the reference engine."""
+    reference = OpenCCEngine(conversion_type)
+    trie = TrieEngine(conversion_type, cache_dir=cache_dir)
+
+    corpus = CORPUS
+    if conversion_type == "t2s":
+        to_traditional = OpenCCEngine("s2t")
+        corpus = [to_traditional.convert(text) for text in CORPUS]
+
+    for text in corpus:
+        assert trie.convert(text) == reference.convert(text), text
+
+
+@pytest.mark.parametrize("conversion_type", ["s2t", "s2tw", "s2hk", "t2s"])
+def test_trie_matches_opencc_on_generated_text(conversion_type: str, cache_dir: Path) -> None:
+    """Test engine equivalence on generated text with fixed seeds."""
+    reference = OpenCCEngine(conversion_type)
+    trie = TrieEngine(conversion_type, cache_dir=cache_dir)
+
+    for seed in GENERATED_SEEDS:
+        text = generate_text(random.Random(seed), 2000)
+        assert trie.convert(text) == reference.convert(text), f"seed {seed}"
+
+
+def test_trie_cache_file_is_reused(tmp_path: Path) -> None:
+    """Test that a compiled trie is written once and loaded by later instances."""
+    first = TrieEngine("s2t", cache_dir=tmp_path)
+    cache_files = list(tmp_path.glob("s2t-*.pickle"))
+    assert len(cache_files) == 1
+
+    second = TrieEngine("s2t", cache_dir=tmp_path)
+
+    assert second.version == first.version
+    assert second.convert(CORPUS[0]) == first.convert(CORPUS[0])
+    assert list(tmp_path.glob("s2t-*.pickle")) == cache_files
+
+
+def test_trie_cache_writable_by_others_is_not_loaded(tmp_path: Path, monkeypatch) -> None:
+    """Test that a cache file others could have replaced is never unpickled."""
+    TrieEngine("s2t", cache_dir=tmp_path)
+    (cache_file,) = tmp_path.glob("s2t-*.pickle")
+    cache_file.chmod(0o666)
+    monkeypatch.setattr(
+        "chinese_converter.text_converter.pickle.load",
+        lambda f: pytest.fail("untrusted cache was unpickled"),
+    )
+
+    engine = TrieEngine("s2t", cache_dir=tmp_path)
+
+    assert engine.convert("软件") == OpenCCEngine("s2t").convert("软件")
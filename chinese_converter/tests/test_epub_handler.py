@@ -0,0 +1,273 @@
+"""Unit tests for chinese_converter EPUB handler."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from chinese_converter.formats import epub_handler
+from chinese_converter.formats.epub_handler import EPUBHandler
+from chinese_converter.text_converter import ChineseConverter
+
+
+@pytest.fixture(scope="module")
+def converter() -> ChineseConverter:
+    return ChineseConverter("s2t")
+
+
+def _members(path: Path) -> dict[str, bytes]:
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+class _Unseekable:
+    """Write-only file object, which makes zipfile emit data descriptors."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def write(self, data: bytes) -> int:
+        return self._f.write(data)
+
+    def flush(self):
+        self._f.flush()
+
+
+def _rewrite(source: Path, target: Path, zip64: bool = False, unseekable: bool = False) -> Path:
+    """Copy an EPUB into a zip64 and/or data-descriptor archive with the same members."""
+    with zipfile.ZipFile(source) as src, open(target, "wb") as f:
+        out = _Unseekable(f) if unseekable else f
+        with zipfile.ZipFile(out, "w") as dst:
+            for info in src.infolist():
+                entry = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                entry.compress_type = info.compress_type
+                with dst.open(entry, "w", force_zip64=zip64) as member:
+                    member.write(src.read(info))
+    return target
+
+
+class TestStreamingMode:
+    """Tests for the in-memory streaming conversion path."""
+
+    def test_matches_extract_mode(self, sample_epub: Path, tmp_path: Path, converter) -> None:
+        """Test that streaming output has the same member contents as extract mode."""
+        extracted = tmp_path / "extracted.epub"
+        streamed = tmp_path / "streamed.epub"
+
+        assert EPUBHandler(sample_epub, converter).process_file(sample_epub, extracted)
+        assert EPUBHandler(sample_epub, converter, streaming=True).process_file(
+            sample_epub, streamed
+        )
+
+        assert _members(streamed) == _members(extracted)
+
+    def test_converts_translatable_members(
+        self, sample_epub: Path, tmp_path: Path, converter
+    ) -> None:
+        """Test that chapter, OPF and NCX text is converted."""
+        output = tmp_path / "out.epub"
+        handler = EPUBHandler(sample_epub, converter, streaming=True)
+
+        assert handler.process_file(sample_epub, output)
+
+        members = _members(output)
+        chapter = members["OEBPS/text/ch1.xhtml"].decode("utf-8")
+        assert "這是一個關於軟件開發的故事" in chapter
+        assert 'alt="封面圖片"' in chapter
+        assert "軟件開發" in members["OEBPS/content.opf"].decode("utf-8")
+        assert "第一章 開始" in members["OEBPS/toc.ncx"].decode("utf-8")
+        assert handler.stats["errors"] == 0
+
+    def test_copies_untouched_members_raw(
+        self, sample_epub: Path, tmp_path: Path, converter
+    ) -> None:
+        """Test that binary members keep their original compressed payload."""
+        output = tmp_path / "out.epub"
+
+        assert EPUBHandler(sample_epub, converter, streaming=True).process_file(sample_epub, output)
+
+        with zipfile.ZipFile(sample_epub) as src, zipfile.ZipFile(output) as dst:
+            assert dst.testzip() is None
+            assert dst.namelist()[0] == "mimetype"
+            assert dst.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+            for name in ("OEBPS/images/cover.png", "OEBPS/fonts/font.ttf"):
+                src_info, dst_info = src.getinfo(name), dst.getinfo(name)
+                assert dst_info.compress_type == src_info.compress_type
+                assert dst_info.compress_size == src_info.compress_size
+                assert dst_info.CRC == src_info.CRC
+                assert dst.read(name) == src.read(name)
+
+    @pytest.mark.parametrize(
+        ("zip64", "unseekable"), [(True, False), (False, True)], ids=["zip64", "data-descriptor"]
+    )
+    def test_copies_zip64_and_data_descriptor_members(
+        self, sample_epub: Path, tmp_path: Path, converter, zip64: bool, unseekable: bool
+    ) -> None:
+        """Test that members with zip64 extras or data descriptors are copied intact."""
+        source = _rewrite(sample_epub, tmp_path / "in.epub", zip64=zip64, unseekable=unseekable)
+        with zipfile.ZipFile(source) as zf:
+            flags = zf.getinfo("OEBPS/images/cover.png").flag_bits
+            assert bool(flags & 0x08) == unseekable
+        output = tmp_path / "out.epub"
+
+        assert EPUBHandler(source, converter, streaming=True).process_file(source, output)
+
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(output) as dst:
+            assert dst.testzip() is None
+            for name in ("OEBPS/images/cover.png", "OEBPS/fonts/font.ttf"):
+                assert dst.read(name) == src.read(name)
+                assert not dst.getinfo(name).flag_bits & 0x08
+
+    def test_falls_back_to_writestr(
+        self, sample_epub: Path, tmp_path: Path, converter, monkeypatch
+    ) -> None:
+        """Test that members are still copied when the raw fast path is unavailable."""
+        monkeypatch.setattr(epub_handler, "_RAW_COPY_PYTHON", False)
+        monkeypatch.setattr(
+            epub_handler, "_copy_raw_member", lambda *args: pytest.fail("raw copy used")
+        )
+        output = tmp_path / "out.epub"
+
+        assert EPUBHandler(sample_epub, converter, streaming=True).process_file(sample_epub, output)
+
+        with zipfile.ZipFile(sample_epub) as src, zipfile.ZipFile(output) as dst:
+            assert dst.testzip() is None
+            for name in ("OEBPS/images/cover.png", "OEBPS/fonts/font.ttf"):
+                assert dst.getinfo(name).compress_type == src.getinfo(name).compress_type
+                assert dst.read(name) == src.read(name)
+
+    def test_does_not_create_temp_dir(
+        self, sample_epub: Path, tmp_path: Path, converter, monkeypatch
+    ) -> None:
+        """Test that streaming mode never touches the temp directory."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("temp directory should not be created")
+
+        monkeypatch.setattr("tempfile.mkdtemp", fail)
+        handler = EPUBHandler(sample_epub, converter, streaming=True)
+
+        assert handler.process_file(sample_epub, tmp_path / "out.epub")
+        assert handler.temp_dir is None
+
+
+class TestParallelMembers:
+    """Tests for converting members of one EPUB in a process pool."""
+
+    def test_matches_serial_output_in_order(
+        self, sample_epub: Path, tmp_path: Path, converter
+    ) -> None:
+        """Test that pooled conversion writes the same members in the same order."""
+        serial = tmp_path / "serial.epub"
+        parallel = tmp_path / "parallel.epub"
+
+        assert EPUBHandler(sample_epub, converter, streaming=True).process_file(sample_epub, serial)
+        handler = EPUBHandler(sample_epub, converter, member_jobs=2, max_inflight=1)
+        assert handler.process_file(sample_epub, parallel)
+
+        with zipfile.ZipFile(serial) as a, zipfile.ZipFile(parallel) as b:
+            assert b.namelist() == a.namelist()
+        assert _members(parallel) == _members(serial)
+        assert handler.stats["files_processed"] == 3
+        assert handler.stats["skipped"] == 2
+        assert handler.stats["errors"] == 0
+
+    def test_collects_worker_converter_stats(self, sample_epub: Path, tmp_path: Path) -> None:
+        """Test that engine calls made in workers are reported by the handler."""
+        handler = EPUBHandler(sample_epub, ChineseConverter("s2t"), member_jobs=2)
+
+        assert handler.process_file(sample_epub, tmp_path / "out.epub")
+        handler.record_converter_stats()
+
+        assert handler.stats["engine_calls"] >= 3
+        assert handler.stats["texts_converted"] > 0
+
+    def test_worker_converter_matches_parent_settings(self, sample_epub: Path, monkeypatch) -> None:
+        """Test that the worker initializer builds its converter like the parent's."""
+        monkeypatch.setattr(epub_handler, "_worker_handler", None)  # restored afterwards
+        epub_handler._init_member_worker(sample_epub, "s2tw", "trie", 0)
+        worker = epub_handler._worker_handler.converter
+
+        assert worker.conversion_type == "s2tw"
+        assert worker.engine == "trie"
+        assert worker.cache_size == 0
+
+
+class TestSkipping:
+    """Tests for skipping members without convertible characters."""
+
+    def test_skips_members_without_chinese(
+        self, sample_epub: Path, tmp_path: Path, converter
+    ) -> None:
+        """Test that ASCII-only members are counted as skipped and copied raw."""
+        output = tmp_path / "out.epub"
+        handler = EPUBHandler(sample_epub, converter, streaming=True)
+
+        assert handler.process_file(sample_epub, output)
+
+        # container.xml and style.css contain no Chinese
+        assert handler.stats["skipped"] == 2
+        with zipfile.ZipFile(sample_epub) as src, zipfile.ZipFile(output) as dst:
+            for name in ("META-INF/container.xml", "OEBPS/style.css"):
+                assert dst.getinfo(name).compress_size == src.getinfo(name).compress_size
+
+
+class TestHTMLProcessing:
+    """Tests for the lxml XHTML path and its BeautifulSoup fallback."""
+
+    def test_xhtml_converts_text_tail_and_attributes(self, sample_epub: Path, converter) -> None:
+        """Test that well-formed XHTML is converted in one pass, keeping the doctype."""
+        handler = EPUBHandler(sample_epub, converter)
+        content = (
+            '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE html>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml"><body>'
+            '<p title="简体">软件<b>开发</b>网络<img alt="图片"/></p>'
+            "</body></html>"
+        ).encode()
+
+        result = handler._process_html(content).decode("utf-8")
+
+        assert "<!DOCTYPE html>" in result
+        assert '<p title="簡體">軟件<b>開發</b>網絡<img alt="圖片"/></p>' in result
+        assert handler.stats["texts_converted"] == 5
+
+    def test_xhtml_keeps_empty_elements_and_cdata(self, sample_epub: Path, converter) -> None:
+        """Test that empty elements stay open and CDATA sections survive conversion."""
+        handler = EPUBHandler(sample_epub, converter)
+        content = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml"><head>'
+            '<script src="app.js"></script>'
+            "<script><![CDATA[if (a < b) { x = 1; }]]></script>"
+            "</head><body><div></div><p><![CDATA[简体 & <b>]]></p><br/></body></html>"
+        ).encode()
+
+        result = handler._process_html(content).decode("utf-8")
+
+        assert '<script src="app.js"></script>' in result
+        assert "<script><![CDATA[if (a < b) { x = 1; }]]></script>" in result
+        assert "<div></div>" in result
+        assert "<p><![CDATA[簡體 & <b>]]></p>" in result
+        assert "<br/>" in result
+
+    def test_malformed_html_falls_back_to_beautifulsoup(self, sample_epub: Path, converter) -> None:
+        """Test that tag-soup HTML is still converted via BeautifulSoup."""
+        handler = EPUBHandler(sample_epub, converter)
+        content = "<html><body><p>软件开发<br><img alt=图片></body></html>".encode()
+
+        result = handler._process_html(content).decode("utf-8")
+
+        assert "軟件開發" in result
+        assert 'alt="圖片"' in result
+
+    def test_chapter_is_converted_with_one_engine_call(self, sample_epub: Path) -> None:
+        """Test that all text nodes of a chapter are batched into one engine call."""
+        handler = EPUBHandler(sample_epub, ChineseConverter("s2t", cache_size=0))
+        with zipfile.ZipFile(sample_epub) as zf:
+            chapter = zf.read("OEBPS/text/ch1.xhtml")
+
+        handler._process_html(chapter)
+        handler.record_converter_stats()
+
+        assert handler.stats["texts_converted"] == 5
+        assert handler.stats["engine_calls"] == 1
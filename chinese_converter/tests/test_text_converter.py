@@ -0,0 +1,101 @@
+"""Unit tests for chinese_converter text converter."""
+
+import pytest
+
+from chinese_converter.text_converter import (
+    ChineseConverter,
+    find_convertible_ranges,
+    has_chinese,
+)
+
+
+class TestConversionCache:
+    """Tests for the segment conversion cache."""
+
+    def test_repeated_segment_hits_cache(self) -> None:
+        """Test that converting the same segment twice is served from the cache."""
+        converter = ChineseConverter("s2t", cache_size=8)
+
+        assert converter.convert("第一章 开始") == "第一章 開始"
+        assert converter.convert("第一章 开始") == "第一章 開始"
+
+        assert converter.stats == {"cache_hits": 1, "cache_misses": 1, "engine_calls": 1}
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the cache stays bounded and evicts the oldest entry."""
+        converter = ChineseConverter("s2t", cache_size=2)
+
+        converter.convert("简体")
+        converter.convert("软件")
+        converter.convert("简体")  # refresh
+        converter.convert("开发")  # evicts 软件
+        converter.convert("软件")
+
+        assert len(converter._cache) == 2
+        assert converter.stats == {"cache_hits": 1, "cache_misses": 4, "engine_calls": 4}
+
+    def test_disabled_cache_and_non_chinese_text(self) -> None:
+        """Test that a zero-size cache and non-Chinese text skip the cache entirely."""
+        converter = ChineseConverter("s2t", cache_size=0)
+
+        converter.convert("简体")
+        converter.convert("简体")
+        converter.convert("plain ascii")
+
+        assert converter.stats == {"cache_hits": 0, "cache_misses": 0, "engine_calls": 2}
+
+
+class TestChineseDetection:
+    """Tests for the convertible character classifier."""
+
+    def test_detects_extension_and_compatibility_ideographs(self) -> None:
+        """Test that characters outside the basic CJK block are recognised."""
+        assert has_chinese("㐀")  # Extension A
+        assert has_chinese("𠀀")  # Extension B
+        assert has_chinese("豈")  # Compatibility Ideographs
+        assert not has_chinese("plain ascii, ＡＢＣ and 123")
+
+    def test_find_convertible_ranges_is_line_aligned(self) -> None:
+        """Test that ranges cover whole lines and merge adjacent Chinese lines."""
+        text = "header\n第一行\n第二行\nascii only\nmore ascii\n最后"
+
+        ranges = find_convertible_ranges(text)
+
+        assert [text[start:end] for start, end in ranges] == ["第一行\n第二行\n", "最后"]
+
+    def test_find_convertible_ranges_without_chinese(self) -> None:
+        """Test that ASCII-only text yields no ranges."""
+        assert find_convertible_ranges("line one\nline two\n") == []
+
+
+class TestConvertMany:
+    """Tests for batched segment conversion."""
+
+    def test_matches_individual_conversion(self) -> None:
+        """Test that a batch gives the same results as converting each segment."""
+        texts = ["第一章 开始", "", "plain", "软件开发", "第一章 开始", "网络 "]
+        reference = ChineseConverter("s2t", cache_size=0)
+
+        converter = ChineseConverter("s2t", cache_size=0)
+        result = converter.convert_many(texts)
+
+        assert result == [reference.convert(text) for text in texts]
+        assert converter.stats["engine_calls"] == 1
+
+    @pytest.mark.parametrize("engine", ["opencc", "trie"])
+    def test_phrases_do_not_bleed_across_segments(self, engine: str) -> None:
+        """Test that adjacent segments are not matched as one phrase."""
+        converter = ChineseConverter("s2t", cache_size=0, engine=engine)
+
+        # "头发" is a phrase (頭髮), but 发 alone converts to 發
+        assert converter.convert_many(["头", "发"]) == ["頭", "發"]
+        assert converter.convert("头发") == "頭髮"
+
+    def test_uses_cache_for_repeated_segments(self) -> None:
+        """Test that cached segments are not sent to the engine again."""
+        converter = ChineseConverter("s2t", cache_size=8)
+        converter.convert("第一章")
+
+        assert converter.convert_many(["第一章", "第二章"]) == ["第一章", "第二章"]
+        assert converter.stats["cache_hits"] == 1
+        assert converter.stats["engine_calls"] == 2
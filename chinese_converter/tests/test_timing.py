@@ -0,0 +1,36 @@
+"""Unit tests for chinese_converter stage timing."""
+
+import time
+
+from chinese_converter.timing import StageTimer, format_stages
+
+
+class TestStageTimer:
+    """Tests for StageTimer."""
+
+    def test_nested_stages_are_exclusive(self) -> None:
+        """Test that time in an inner stage is not charged to the outer one."""
+        timer = StageTimer()
+
+        with timer.stage("parse"), timer.stage("convert"):
+            time.sleep(0.05)
+
+        assert timer.totals["convert"] >= 0.05
+        assert timer.totals["parse"] < 0.05
+
+    def test_record_collects_block_delta(self) -> None:
+        """Test that record() yields only the time added inside the block."""
+        timer = StageTimer()
+        with timer.stage("zip"):
+            pass
+
+        with timer.record() as recorded, timer.stage("convert"):
+            pass
+
+        assert list(recorded) == ["convert"]
+
+    def test_format_stages_uses_pipeline_order(self) -> None:
+        """Test that stages are listed in pipeline order, unknown ones last."""
+        totals = {"zip": 1.0, "custom": 0.5, "validate": 0.25}
+
+        assert format_stages(totals) == "validate 0.25s, zip 1.00s, custom 0.50s"
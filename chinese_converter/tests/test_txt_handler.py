@@ -0,0 +1,111 @@
+"""Unit tests for chinese_converter TXT handler."""
+
+from pathlib import Path
+
+import pytest
+
+from chinese_converter.formats.txt_handler import TXTHandler
+from chinese_converter.text_converter import ChineseConverter
+
+SAMPLE_TEXT = "这是一个关于软件开发的故事。\n第一章 开始\n\n他们在网络上发布了程序。\n" * 50
+
+
+@pytest.fixture(scope="module")
+def converter() -> ChineseConverter:
+    return ChineseConverter("s2t")
+
+
+class TestStreamingMode:
+    """Tests for chunked TXT conversion."""
+
+    @pytest.mark.parametrize("chunk_size", [7, 64, 4096])
+    def test_matches_whole_file_mode(self, tmp_path: Path, converter, chunk_size: int) -> None:
+        """Test that chunked output is identical to whole-file conversion."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text(SAMPLE_TEXT, encoding="utf-8")
+
+        whole = tmp_path / "whole.txt"
+        TXTHandler(input_file, converter).process_file(input_file, whole)
+
+        streamed = tmp_path / "streamed.txt"
+        handler = TXTHandler(input_file, converter, streaming=True)
+        handler.chunk_size = chunk_size
+        assert handler.process_file(input_file, streamed)
+
+        assert streamed.read_text(encoding="utf-8") == whole.read_text(encoding="utf-8")
+        assert handler.stats["texts_converted"] == 1
+
+    def test_forces_cut_without_boundaries(self, tmp_path: Path, converter) -> None:
+        """Test that a file with no separators still converts in bounded chunks."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("简体" * 100, encoding="utf-8")
+
+        output = tmp_path / "output.txt"
+        handler = TXTHandler(input_file, converter, streaming=True)
+        handler.chunk_size = 8
+        assert handler.process_file(input_file, output)
+
+        assert output.read_text(encoding="utf-8") == "簡體" * 100
+
+    def test_forced_cut_lands_after_convertible_run(self, tmp_path: Path, converter) -> None:
+        """Test that a long line without separators is cut only where a CJK run ends."""
+        handler = TXTHandler(tmp_path / "input.txt", converter, streaming=True)
+        handler.chunk_size = 8
+        line = "软件开发abc" * 40
+        chunks = [line[start : start + 8] for start in range(0, len(line), 8)]
+
+        written = []
+        assert handler._convert_chunks(chunks, written.append)
+
+        assert len(written) > 1
+        assert "".join(written) == "軟件開發abc" * 40
+        for piece in written[:-1]:
+            assert piece.endswith("發")
+
+
+class TestEncodings:
+    """Tests for encoding detection and output encodings."""
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    @pytest.mark.parametrize("encoding", ["gb18030", "utf-16", "utf-8-sig"])
+    def test_detects_input_encoding(
+        self, tmp_path: Path, converter, encoding: str, streaming: bool
+    ) -> None:
+        """Test that non-UTF-8 input is sniffed and written as UTF-8 by default."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes(SAMPLE_TEXT.encode(encoding))
+        expected = tmp_path / "expected.txt"
+        TXTHandler(input_file, converter).process_file(input_file, expected)
+
+        output = tmp_path / "output.txt"
+        handler = TXTHandler(input_file, converter, streaming=streaming)
+        handler.chunk_size = 33  # odd size splits multi-byte characters
+        assert handler.process_file(input_file, output)
+
+        assert output.read_bytes() == expected.read_bytes()
+        assert "這是一個關於軟件開發的故事" in output.read_text(encoding="utf-8")
+
+    def test_keeps_input_encoding(self, tmp_path: Path) -> None:
+        """Test that output_encoding='input' writes Big5 back as Big5."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes("這是一個關於軟件開發的故事。\n".encode("big5") * 20)
+
+        output = tmp_path / "output.txt"
+        handler = TXTHandler(
+            input_file, ChineseConverter("s2t"), streaming=True, output_encoding="input"
+        )
+        handler.chunk_size = 16
+        assert handler.process_file(input_file, output)
+
+        assert output.read_bytes() == input_file.read_bytes()
+
+    def test_streams_in_place(self, tmp_path: Path, converter) -> None:
+        """Test that converting a file onto itself does not truncate the mapped input."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes("简体中文\r\n".encode("gb18030") * 100)
+
+        handler = TXTHandler(input_file, converter, streaming=True, output_encoding="input")
+        assert handler.process_file(input_file, input_file)
+
+        assert input_file.read_bytes().decode("gb18030") == "簡體中文\r\n" * 100
+        assert not list(tmp_path.glob("*.part"))
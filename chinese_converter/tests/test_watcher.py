@@ -0,0 +1,96 @@
+"""Unit tests for chinese_converter watch mode."""
+
+import threading
+import time
+from pathlib import Path
+
+from chinese_converter.cli import ChineseTextConverter
+from chinese_converter.watcher import DirectoryWatcher
+
+
+def _watcher(directory: Path, **kwargs) -> DirectoryWatcher:
+    return DirectoryWatcher(directory, {".txt", ".epub"}, settle=0, **kwargs)
+
+
+class TestDirectoryWatcher:
+    """Tests for polling and debouncing."""
+
+    def test_reports_file_once_it_is_stable(self, tmp_path: Path) -> None:
+        """Test that a file is reported after an unchanged second poll, and only once."""
+        watcher = _watcher(tmp_path)
+        book = tmp_path / "book.txt"
+        book.write_text("简体", encoding="utf-8")
+
+        assert watcher.poll() == []
+        assert watcher.poll() == [book]
+        assert watcher.poll() == []
+
+    def test_growing_file_is_not_reported(self, tmp_path: Path) -> None:
+        """Test that a file still being written restarts its settle period."""
+        watcher = _watcher(tmp_path)
+        book = tmp_path / "book.txt"
+        book.write_text("简", encoding="utf-8")
+        watcher.poll()
+
+        book.write_text("简体中文", encoding="utf-8")
+        assert watcher.poll() == []
+        assert watcher.poll() == [book]
+
+    def test_ignores_partial_hidden_and_excluded_files(self, tmp_path: Path) -> None:
+        """Test that temp files, dotfiles and the excluded directory are skipped."""
+        output = tmp_path / "out"
+        (output / "nested").mkdir(parents=True)
+        (output / "nested" / "done.txt").write_text("x", encoding="utf-8")
+        (tmp_path / "book.txt.part").write_text("x", encoding="utf-8")
+        (tmp_path / ".book.txt").write_text("x", encoding="utf-8")
+        (tmp_path / "cover.jpg").write_bytes(b"x")
+        watcher = _watcher(tmp_path, exclude=output, recursive=True)
+
+        watcher.poll()
+        assert watcher.poll() == []
+
+    def test_release_reports_file_again(self, tmp_path: Path) -> None:
+        """Test that a released file is handed out on the next poll."""
+        watcher = _watcher(tmp_path)
+        book = tmp_path / "book.txt"
+        book.write_text("简体", encoding="utf-8")
+        watcher.poll()
+        watcher.poll()
+
+        watcher.release(book)
+        assert watcher.poll() == [book]
+
+
+class TestWatchMode:
+    """Tests for ChineseTextConverter.watch."""
+
+    def test_converts_arrivals_until_stopped(self, tmp_path: Path, sample_epub: Path) -> None:
+        """Test that new files are converted with a warm converter and skipped once done."""
+        inbox = tmp_path / "inbox"
+        output = tmp_path / "out"
+        inbox.mkdir()
+        (inbox / "a.txt").write_text("简体中文\n", encoding="utf-8")
+        stop = threading.Event()
+        converter = ChineseTextConverter("s2t")
+        results = {}
+
+        def run():
+            results.update(
+                converter.watch(str(inbox), str(output), interval=0.02, settle=0, stop=stop)
+            )
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 10
+            while not (output / "a.txt").exists() and time.monotonic() < deadline:
+                time.sleep(0.02)
+            sample_epub.rename(inbox / "book.epub")
+            while not (output / "book.epub").exists() and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert (output / "a.txt").read_text(encoding="utf-8") == "簡體中文\n"
+        assert results == {str(inbox / "a.txt"): True, str(inbox / "book.epub"): True}
@@ -1,44 +1,412 @@
-"""Simple OpenCC Chinese text converter."""
+"""Simple OpenCC Chinese text converter with pluggable conversion engines."""
 
+import gc
+import hashlib
+import json
+import os
+import pickle
 import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib import metadata
+from pathlib import Path
 
 import opencc
 
 from logger_setup import get_logger
 
+from .config import EPUBConfig
+
 logger = get_logger(__name__, "chinese_converter")
 
+# Segment separators from OpenCC's PhraseExtract; no dictionary match spans one of these
+SEPARATOR_RE = re.compile(
+    r"[\s\-,.?!*　，。、；：？！…“”‘’『』「」﹁﹂—－（）《》〈〉～．／＼︒︑︔︓︿﹀︹︺︙︐［﹇］﹈︕︖︰︳︴︽︾︵︶｛︷｝︸﹃﹄【︻】︼]"
+)
+
+# Convertible characters: CJK Unified Ideographs (URO, Extensions A-H), the
+# compatibility blocks, and 〇 which appears in OpenCC phrase keys
+CJK_RE = re.compile(
+    "[\u3007\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+    "\U00020000-\U0002ebef\U0002f800-\U0002fa1f\U00030000-\U000323af]+"
+)
+
+# The reimplemented matcher's own splitter (capturing, so separators are kept)
+SPLIT_RE = opencc.OpenCC().split_chars_re
+
+# Joins segments for batched conversion: whitespace to the reimplemented matcher's
+# splitter and absent from every dictionary key, so no phrase can span it
+BATCH_SEPARATOR = "\u2029"
+
+OPENCC_DIR = Path(opencc.__file__).parent
+
+
+def has_chinese(text: str) -> bool:
+    """Check if text contains convertible Chinese characters."""
+    return CJK_RE.search(text) is not None
+
+
+def find_convertible_ranges(text: str) -> list[tuple[int, int]]:
+    """Scan text once for line-aligned ranges that contain convertible characters.
+
+    Everything outside the returned ranges can be copied verbatim: newlines are
+    segment separators, so converting the ranges alone gives the same result as
+    converting the whole text.
+
+    Returns:
+        Sorted, non-overlapping (start, end) offsets covering whole lines
+    """
+    ranges: list[tuple[int, int]] = []
+    for match in CJK_RE.finditer(text):
+        if ranges and match.start() < ranges[-1][1]:
+            continue  # still on a line already covered
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", match.end())
+        end = len(text) if end < 0 else end + 1
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+class ConversionEngine(ABC):
+    """Abstract base class for conversion engines."""
+
+    name = ""
+
+    def __init__(self, conversion_type: str):
+        self.conversion_type = conversion_type
+
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Identify the engine build and its dictionaries."""
+        pass
+
+    @abstractmethod
+    def convert(self, text: str) -> str:
+        """Convert text."""
+        pass
+
+
+class OpenCCEngine(ConversionEngine):
+    """Engine backed by the opencc-python-reimplemented matcher."""
+
+    name = "opencc"
+
+    def __init__(self, conversion_type: str):
+        super().__init__(conversion_type)
+        self._opencc = opencc.OpenCC(conversion_type)
+
+    @property
+    def version(self) -> str:
+        try:
+            return metadata.version("opencc-python-reimplemented")
+        except metadata.PackageNotFoundError:
+            return "unknown"
+
+    def convert(self, text: str) -> str:
+        return self._opencc.convert(text)
+
+
+class TrieEngine(ConversionEngine):
+    """Engine doing the reference engine's phrase matching over precompiled tries.
+
+    The OpenCC dictionaries for the conversion chain are compiled once into
+    one nested-dict trie per dictionary file and pickled under
+    EPUBConfig.TRIE_CACHE_DIRECTORY, so later runs load them without
+    re-parsing. Unpickling runs code, so the directory is created private
+    (0700) and a cache file is only loaded if it and its directory belong to
+    the current user and nobody else can write to them.
+
+    Matching follows the reimplemented matcher exactly: text is split on its
+    separators, and within each segment every dictionary of a chain step
+    replaces the longest (then leftmost) phrase first, recursing into the
+    unmatched text on either side. Later dictionaries of a group only see
+    text the earlier ones left unmatched.
+    """
+
+    name = "trie"
+    FORMAT_VERSION = 2
+    _VALUE = ""  # node key holding the replacement; never a real character
+
+    def __init__(self, conversion_type: str, cache_dir: Path | None = None):
+        super().__init__(conversion_type)
+        self.cache_dir = Path(cache_dir or EPUBConfig.TRIE_CACHE_DIRECTORY)
+        self._chain_files = self._read_chain(conversion_type)
+        self._digest = self._dictionary_digest()
+        self._steps = self._load()
+
+    @property
+    def version(self) -> str:
+        return f"{self.FORMAT_VERSION}-{self._digest}"
+
+    def convert(self, text: str) -> str:
+        parts = SPLIT_RE.split(text)
+        # Even indices are text between separators, odd ones the separators
+        for index in range(0, len(parts), 2):
+            segment = parts[index]
+            if segment:
+                for tries in self._steps:
+                    segment = self._convert_step(segment, tries)
+                parts[index] = segment
+        return "".join(parts)
+
+    def _convert_step(self, segment: str, tries: list[dict]) -> str:
+        """Apply one chain step (a group of dictionaries) to a separator-free segment.
+
+        Taking candidate phrases longest first, leftmost first among equals,
+        and keeping each one that does not overlap an earlier pick gives the
+        same matches as the reference's recursive split around the longest
+        phrase.
+        """
+        value_key = self._VALUE
+        length = len(segment)
+        taken = bytearray(length)
+        matches: dict[int, tuple[int, str]] = {}  # start -> (end, replacement)
+        for root in tries:
+            candidates: dict[int, list[tuple[int, str]]] = {}  # phrase length -> [(start, value)]
+            for i in range(length):
+                if taken[i]:
+                    continue
+                node = root.get(segment[i])
+                j = i
+                while node is not None:
+                    j += 1
+                    value = node.get(value_key)
+                    if value is not None:
+                        candidates.setdefault(j - i, []).append((i, value))
+                    if j == length or taken[j]:
+                        break
+                    node = node.get(segment[j])
+
+            for size in sorted(candidates, reverse=True):
+                for start, value in candidates[size]:
+                    end = start + size
+                    if taken.find(1, start, end) < 0:
+                        taken[start:end] = b"\x01" * size
+                        matches[start] = (end, value)
+
+        if not matches:
+            return segment
+        result = []
+        i = 0
+        while i < length:
+            match = matches.get(i)
+            if match is None:
+                result.append(segment[i])
+                i += 1
+            else:
+                i, value = match
+                result.append(value)
+        return "".join(result)
+
+    @staticmethod
+    def _read_chain(conversion_type: str) -> list[list[Path]]:
+        """Resolve the OpenCC config into dictionary files per chain step."""
+        with open(OPENCC_DIR / "config" / f"{conversion_type}.json", encoding="utf-8") as f:
+            setting = json.load(f)
+
+        def files(dict_config: dict) -> list[Path]:
+            if dict_config.get("type") == "group":
+                return [path for item in dict_config["dicts"] for path in files(item)]
+            return [OPENCC_DIR / "dictionary" / dict_config["file"]]
+
+        return [files(step["dict"]) for step in setting["conversion_chain"]]
+
+    def _dictionary_digest(self) -> str:
+        """Fingerprint the dictionaries so a stale cache file is never reused."""
+        digest = hashlib.sha1(str(self.FORMAT_VERSION).encode())
+        for step in self._chain_files:
+            for path in step:
+                stat = path.stat()
+                digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+            digest.update(b"|")
+        return digest.hexdigest()[:16]
+
+    def _load(self) -> list[list[dict]]:
+        """Load the compiled tries from the cache file, building it if needed."""
+        cache_file = self.cache_dir / f"{self.conversion_type}-{self._digest}.pickle"
+        if cache_file.exists() and not (_is_private(self.cache_dir) and _is_private(cache_file)):
+            logger.warning(f"Not loading trie cache {cache_file}: writable by other users")
+        elif cache_file.exists():
+            # Loading ~100k small dicts is dominated by GC passes; pause it meanwhile
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with open(cache_file, "rb") as f:
+                    return pickle.load(f)
+            except (EOFError, pickle.UnpicklingError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable trie cache {cache_file}: {e}")
+            finally:
+                if gc_enabled:
+                    gc.enable()
+
+        steps = [[self._build_trie(path) for path in files] for files in self._chain_files]
+
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if _is_private(self.cache_dir):
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_file, "wb", opener=_private_opener) as f:
+                    pickle.dump(steps, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+                logger.info(f"Compiled trie cache: {cache_file}")
+        except OSError as e:
+            logger.warning(f"Could not write trie cache: {e}")
+        return steps
+
+    def _build_trie(self, path: Path) -> dict:
+        """Compile one dictionary file into a trie; like the reference, later lines win."""
+        root: dict = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.strip().partition("\t")
+                if not key:
+                    continue
+                node = root
+                for char in key:
+                    node = node.setdefault(char, {})
+                # Multiple candidates are space separated; use the first one
+                node[self._VALUE] = value.split(" ")[0]
+        return root
+
+
+def _is_private(path: Path) -> bool:
+    """Whether path belongs to the current user and no one else can write to it."""
+    if os.name != "posix":
+        return True  # per-user profile directories are private by default ACLs
+    stat = path.stat()
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _private_opener(path: str, flags: int) -> int:
+    return os.open(path, flags, 0o600)
+
+
+ENGINES = {engine.name: engine for engine in (OpenCCEngine, TrieEngine)}
+
 
 class ChineseConverter:
     """Simple Chinese text converter using OpenCC."""
 
-    def __init__(self, conversion_type: str = "s2t"):
+    def __init__(
+        self,
+        conversion_type: str = "s2t",
+        cache_size: int = EPUBConfig.CACHE_SIZE,
+        engine: str = EPUBConfig.ENGINE,
+    ):
         """
         Initialize converter.
 
         Args:
             conversion_type: Conversion type ('s2t', 's2tw', 's2hk', 't2s')
+            cache_size: Maximum number of converted segments to memoize (0 disables)
+            engine: Conversion engine name ('opencc', 'trie')
         """
         self.conversion_type = conversion_type
+        self.engine = engine
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self.stats = {"cache_hits": 0, "cache_misses": 0, "engine_calls": 0}
 
         try:
-            self.converter = opencc.OpenCC(self.conversion_type)
-            logger.info(f"Initialized converter: {conversion_type}")
+            self.converter = ENGINES[engine](self.conversion_type)
+            self.engine_version = f"{engine}-{self.converter.version}"
+            logger.info(f"Initialized converter: {conversion_type} ({engine} engine)")
         except Exception as e:
             logger.error(f"Failed to initialize converter: {e}")
             raise
 
     def convert(self, text: str) -> str:
         """Convert Chinese text if it contains Chinese characters."""
-        if not text or not self._has_chinese(text):
+        if not text or not has_chinese(text):
             return text
 
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        converted = self._engine_convert(text)
+        if converted is None:
+            return text
+        self._cache_put(text, converted)
+        return converted
+
+    def convert_many(self, texts: list[str]) -> list[str]:
+        """Convert many segments with a single engine call.
+
+        Segments without Chinese or already cached are resolved first. The
+        rest are deduplicated, joined with BATCH_SEPARATOR, converted together
+        and split back. The separator is a segment boundary for every engine,
+        so phrases never match across neighbouring segments.
+
+        Args:
+            texts: Segments to convert, e.g. every text node of a document
+
+        Returns:
+            Converted segments, in the same order as texts
+        """
+        results = list(texts)
+        pending: dict[str, list[int]] = {}
+        for index, text in enumerate(texts):
+            if not text or not has_chinese(text):
+                continue
+            cached = self._cache_get(text)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(text, []).append(index)
+
+        if not pending:
+            return results
+
+        segments = list(pending)
+        converted = None
+        if len(segments) > 1 and not any(BATCH_SEPARATOR in text for text in segments):
+            joined = self._engine_convert(BATCH_SEPARATOR.join(segments))
+            if joined is not None:
+                converted = joined.split(BATCH_SEPARATOR)
+        if converted is None or len(converted) != len(segments):
+            converted = [self._engine_convert(text) for text in segments]
+
+        for text, result in zip(segments, converted, strict=True):
+            if result is None:
+                continue
+            self._cache_put(text, result)
+            for index in pending[text]:
+                results[index] = result
+        return results
+
+    def _engine_convert(self, text: str) -> str | None:
+        """Run the engine once, returning None if it fails."""
+        self.stats["engine_calls"] += 1
         try:
             return self.converter.convert(text)
         except Exception as e:
             logger.error(f"Conversion error: {e}")
-            return text
+            return None
+
+    def _cache_get(self, text: str) -> str | None:
+        """Look up a converted segment, counting hits and misses."""
+        if not self._cacheable(text):
+            return None
+        cached = self._cache.get(text)
+        if cached is None:
+            self.stats["cache_misses"] += 1
+            return None
+        self._cache.move_to_end(text)
+        self.stats["cache_hits"] += 1
+        return cached
+
+    def _cache_put(self, text: str, converted: str):
+        """Store a converted segment, evicting the least recently used one."""
+        if not self._cacheable(text):
+            return
+        self._cache[text] = converted
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
-    def _has_chinese(self, text: str) -> bool:
-        """Check if text contains Chinese characters."""
-        return bool(re.search(r"[\u4e00-\u9fff]+", text))
+    def _cacheable(self, text: str) -> bool:
+        return self.cache_size > 0 and len(text) <= EPUBConfig.CACHE_MAX_TEXT_LENGTH
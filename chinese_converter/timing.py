@@ -0,0 +1,65 @@
+"""Wall-clock accounting for the stages of a conversion pipeline."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Pipeline stages in the order they run; format_stages lists unknown stages last
+STAGES = ("validate", "read", "unzip", "parse", "convert", "serialize", "write", "zip")
+
+
+class StageTimer:
+    """Accumulates exclusive wall-clock seconds per named stage.
+
+    Stages may nest; time spent in an inner stage is charged to it alone and
+    paused on the outer one, so the totals never double count and add up to
+    the instrumented time.
+    """
+
+    def __init__(self):
+        self.totals: dict[str, float] = {}
+        self._stack: list[list] = []  # [name, start of the current slice]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block under name."""
+        now = time.perf_counter()
+        if self._stack:
+            self._charge(self._stack[-1], now)
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._charge(self._stack.pop(), now)
+            if self._stack:
+                self._stack[-1][1] = now
+
+    @contextmanager
+    def record(self) -> Iterator[dict[str, float]]:
+        """Collect the stage time added within the block into the yielded dict."""
+        before = dict(self.totals)
+        recorded: dict[str, float] = {}
+        try:
+            yield recorded
+        finally:
+            for name, seconds in self.totals.items():
+                delta = seconds - before.get(name, 0.0)
+                if delta > 0:
+                    recorded[name] = delta
+
+    def merge(self, totals: dict[str, float]):
+        """Add totals recorded elsewhere, e.g. by a worker process."""
+        for name, seconds in totals.items():
+            self.totals[name] = self.totals.get(name, 0.0) + seconds
+
+    def _charge(self, frame: list, now: float):
+        name, start = frame
+        self.totals[name] = self.totals.get(name, 0.0) + now - start
+
+
+def format_stages(totals: dict[str, float]) -> str:
+    """Render stage totals as 'name 0.12s, ...' in pipeline order."""
+    order = {name: index for index, name in enumerate(STAGES)}
+    names = sorted(totals, key=lambda name: order.get(name, len(STAGES)))
+    return ", ".join(f"{name} {totals[name]:.2f}s" for name in names)
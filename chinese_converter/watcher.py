@@ -0,0 +1,93 @@
+"""Polling directory watcher that reports files once they stop changing."""
+
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from .config import EPUBConfig
+
+# Suffixes left by downloaders and editors while a file is still being written
+_PARTIAL_SUFFIXES = (".part", ".crdownload", ".download", ".tmp", "~")
+
+
+class DirectoryWatcher:
+    """Polls a directory with os.scandir and hands out new or changed files.
+
+    A file is ready once its size and mtime have stayed the same for `settle`
+    seconds across polls, so files still being copied into the directory are
+    not picked up half-written. Each version of a file is handed out once.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        suffixes: set[str],
+        exclude: Path | None = None,
+        recursive: bool = False,
+        settle: float = EPUBConfig.WATCH_SETTLE,
+    ):
+        """
+        Args:
+            directory: Directory to watch
+            suffixes: Lower-case file suffixes to report, e.g. {'.epub', '.txt'}
+            exclude: Directory to ignore (e.g. an output directory inside the inbox)
+            recursive: Also watch subdirectories
+            settle: Seconds a file must stay unchanged before it is reported
+        """
+        self.directory = Path(directory)
+        self.suffixes = suffixes
+        self.exclude = Path(exclude).resolve() if exclude else None
+        self.recursive = recursive
+        self.settle = settle
+        self._signatures: dict[Path, tuple[int, int]] = {}  # last seen (size, mtime_ns)
+        self._stable_since: dict[Path, float] = {}
+        self._handled: dict[Path, tuple[int, int]] = {}  # signature when handed out
+
+    def poll(self) -> list[Path]:
+        """Scan once and return files that are new or changed and have settled."""
+        now = time.monotonic()
+        current = dict(self._scan(self.directory))
+
+        ready = []
+        for path, signature in current.items():
+            if self._handled.get(path) == signature:
+                continue
+            if self._signatures.get(path) != signature:
+                self._signatures[path] = signature
+                self._stable_since[path] = now
+                continue
+            if now - self._stable_since[path] >= self.settle:
+                self._handled[path] = signature
+                ready.append(path)
+
+        for path in self._signatures.keys() - current.keys():
+            self._signatures.pop(path)
+            self._stable_since.pop(path, None)
+            self._handled.pop(path, None)
+
+        return sorted(ready)
+
+    def release(self, path: Path):
+        """Forget that path was handed out, so the next poll reports it again."""
+        self._handled.pop(path, None)
+
+    def _scan(self, directory: Path) -> Iterator[tuple[Path, tuple[int, int]]]:
+        """Yield (path, (size, mtime_ns)) for matching files under directory."""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name.endswith(_PARTIAL_SUFFIXES):
+                continue
+            try:
+                if entry.is_dir():
+                    if self.recursive and Path(entry.path).resolve() != self.exclude:
+                        yield from self._scan(Path(entry.path))
+                elif entry.is_file() and Path(entry.name).suffix.lower() in self.suffixes:
+                    stat = entry.stat()
+                    yield Path(entry.path), (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                continue  # removed between scandir and stat
@@ -0,0 +1,390 @@
+"""
+Append-only JSONL history with an indexed SQLite sidecar.
+
+The JSONL file stays the source of truth, so existing history files, older
+versions of the tools appending to them, and plain-text inspection all keep
+working. Next to it, `<name>.jsonl.idx.sqlite` (WAL mode) stores the key of
+every entry plus how many bytes of the JSONL are already indexed. Opening a
+store therefore only parses lines appended since the last run, and membership
+checks are index lookups rather than a full parse of the file.
+
+Usage:
+    python -m utils.history_store import HISTORY.jsonl OLD.jsonl --key id
+    python -m utils.history_store export HISTORY.jsonl CLEAN.jsonl --key id
+    python -m utils.history_store reindex HISTORY.jsonl --key title
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from logger_setup import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = get_logger(__name__, "history_store")
+
+INDEX_SUFFIX = ".idx.sqlite"
+
+# Bytes hashed from the start of the JSONL to notice it was replaced, not appended to
+_FINGERPRINT_BYTES = 4096
+
+# HistoryWriter queue markers
+_FLUSH = object()
+_STOP = object()
+
+
+class HistoryStore:
+    """Keyed, append-only history of JSON entries with O(1) membership checks."""
+
+    def __init__(self, path: Path, key: str, create_index: bool = True):
+        """
+        Args:
+            path: JSONL history file (created on first append)
+            key: Entry field that identifies an entry, e.g. 'id' or 'title'
+            create_index: Create the sidecar index if it is missing; if False,
+                a missing index is built in memory instead (e.g. for dry runs)
+        """
+        self.path = Path(path)
+        self.key = key
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.create_index = create_index
+        self._lock = threading.Lock()
+        # Without a history file there is nothing to index until the first append
+        self._db: sqlite3.Connection | None = None
+        if self.path.exists() or self.index_path.exists():
+            self._db = self._connect()
+            self._sync()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, value: object) -> bool:
+        if self._db is None:
+            return False
+        with self._lock:
+            row = self._db.execute("SELECT 1 FROM keys WHERE key = ?", (value,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        if self._db is None:
+            return 0
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM keys").fetchone()[0]
+
+    def keys(self) -> set[str]:
+        """All keys in the history."""
+        if self._db is None:
+            return set()
+        with self._lock:
+            return {row[0] for row in self._db.execute("SELECT key FROM keys")}
+
+    def append(self, entry: dict):
+        """Append one entry; see append_many."""
+        self.append_many([entry])
+
+    def append_many(self, entries: Iterable[dict], fsync: bool = False) -> int:
+        """Append entries with a single write and a single index transaction.
+
+        Args:
+            entries: Entries to append
+            fsync: Force the write to disk before indexing it
+
+        Returns:
+            Number of entries written
+        """
+        entries = list(entries)
+        if not entries:
+            return 0
+        data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+
+        with self._lock:
+            if self._db is None:
+                self._db = self._connect()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                _lock_file(f)  # held until f is closed, so no line lands unindexed
+                self._sync_locked()  # pick up lines other writers appended meanwhile
+                synced = self._meta("offset")
+                payload = data.encode("utf-8")
+                start = f.seek(0, os.SEEK_END)
+                if start and not self._ends_with_newline():
+                    payload = b"\n" + payload  # a torn last line must not swallow ours
+                f.write(payload)
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+                offset = f.tell()
+                if start != synced or offset - start != len(payload):
+                    # A writer without the lock (e.g. an older tool) appended too:
+                    # index only what was synced and parse the rest next time
+                    offset = synced
+                keys = [(entry[self.key],) for entry in entries if self.key in entry]
+                with self._db:
+                    self._db.executemany("INSERT OR IGNORE INTO keys VALUES (?)", keys)
+                    self._set_offset(offset)
+        return len(entries)
+
+    def entries(self) -> Iterator[dict]:
+        """Yield every parseable entry in file order."""
+        if self.path.exists():
+            yield from self._read_jsonl(self.path)
+
+    def import_jsonl(self, source: Path) -> int:
+        """Append entries from another JSONL history whose keys are not present yet.
+
+        Returns:
+            Number of entries imported
+        """
+        known = self.keys()
+        new = []
+        for entry in self._read_jsonl(Path(source)):
+            value = entry.get(self.key)
+            if value is not None and value not in known:
+                known.add(value)
+                new.append(entry)
+        return self.append_many(new)
+
+    def export_jsonl(self, destination: Path) -> int:
+        """Write every parseable entry to a clean JSONL file.
+
+        Returns:
+            Number of entries exported
+        """
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with self._lock, open(destination, "w", encoding="utf-8") as f:
+            for entry in self.entries():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def reindex(self):
+        """Rebuild the index from the whole JSONL file."""
+        if self._db is None:
+            return
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM keys")
+            self._set_offset(0)
+        self._sync()
+
+    def close(self):
+        """Close the index database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            if not self.create_index and not self.index_path.exists():
+                db = sqlite3.connect(":memory:", check_same_thread=False)
+            else:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self.index_path, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Cannot use history index {self.index_path} ({e}), indexing in memory")
+            db = sqlite3.connect(":memory:", check_same_thread=False)
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS keys (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value)")
+        return db
+
+    def _meta(self, name: str):
+        row = self._db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_offset(self, offset: int):
+        self._db.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [("key", self.key), ("offset", offset), ("fingerprint", self._fingerprint(offset))],
+        )
+
+    def _fingerprint(self, offset: int) -> str:
+        if not offset or not self.path.exists():
+            return ""
+        with open(self.path, "rb") as f:
+            return hashlib.sha1(f.read(min(offset, _FINGERPRINT_BYTES))).hexdigest()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    def _sync(self):
+        with self._lock:
+            if not self.path.exists():
+                self._sync_locked()
+                return
+            with open(self.path, "rb") as f:
+                _lock_file(f)  # wait for appends from other processes to finish
+                self._sync_locked()
+
+    def _sync_locked(self):
+        """Index lines appended since the last sync, rebuilding if the file was replaced."""
+        size = self.path.stat().st_size if self.path.exists() else 0
+        indexed = self._meta("offset")
+        offset = indexed or 0
+        if indexed is not None and (
+            self._meta("key") != self.key
+            or offset > size
+            or self._meta("fingerprint") != self._fingerprint(offset)
+        ):
+            logger.info(f"History {self.path} changed outside the index, rebuilding")
+            with self._db:
+                self._db.execute("DELETE FROM keys")
+            indexed, offset = None, 0
+        if indexed is not None and size == offset:
+            return
+
+        keys = []
+        if size > offset:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # torn last line: index it once it is complete
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        value = json.loads(line).get(self.key)
+                    except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                        logger.warning(f"Could not parse a line in {self.path}, skipping it")
+                        continue
+                    if value is not None:
+                        keys.append((value,))
+
+        with self._db:
+            self._db.executemany("INSERT OR IGNORE INTO keys VALUES (?)", keys)
+            self._set_offset(offset)
+
+    @staticmethod
+    def _read_jsonl(path: Path) -> Iterator[dict]:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Could not parse line {number} in {path}")
+
+
+def _lock_file(f):
+    """Take an exclusive lock on f, released when f is closed.
+
+    Stores in other processes take the same lock before syncing or appending.
+    Without fcntl (Windows) only threads sharing one store are serialized.
+    """
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+class HistoryWriter:
+    """Background thread that group-commits history entries from many threads.
+
+    Producers call put() and never touch the file. The writer thread collects
+    whatever is queued (up to max_batch entries, waiting at most max_delay
+    seconds for more) and writes it with one append_many and one fsync, so
+    concurrent downloads can neither interleave lines nor pay an fsync each.
+    """
+
+    def __init__(self, store: HistoryStore, max_batch: int = 100, max_delay: float = 0.5):
+        """
+        Args:
+            store: History store to append to
+            max_batch: Most entries written per batch
+            max_delay: Seconds to wait for more entries before writing a batch
+        """
+        self.store = store
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "HistoryWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def put(self, entry: dict):
+        """Queue an entry for the next batch."""
+        self._queue.put(entry)
+
+    def flush(self):
+        """Block until every entry queued so far is on disk."""
+        if self._thread.is_alive():
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self):
+        """Write any queued entries and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            while batch[-1] not in (_FLUSH, _STOP) and len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            entries = [item for item in batch if item is not _FLUSH and item is not _STOP]
+            try:
+                self.store.append_many(entries, fsync=True)
+            except Exception as e:
+                logger.error(f"Failed to write {len(entries)} entries to {self.store.path}: {e}")
+            for _ in batch:
+                self._queue.task_done()
+            if batch[-1] is _STOP:
+                return
+
+
+def main():
+    """Command-line entry point for importing, exporting and reindexing histories."""
+    parser = argparse.ArgumentParser(description="Manage indexed JSONL download histories")
+    parser.add_argument("action", choices=["import", "export", "reindex"])
+    parser.add_argument("history", type=Path, help="History JSONL file")
+    parser.add_argument(
+        "other", type=Path, nargs="?", help="JSONL file to import from or export to"
+    )
+    parser.add_argument(
+        "--key", default="id", help="Entry field used as the key (default: id; anime1 uses title)"
+    )
+    args = parser.parse_args()
+
+    if args.action != "reindex" and args.other is None:
+        parser.error(f"{args.action} needs a second JSONL file")
+
+    with HistoryStore(args.history, key=args.key) as store:
+        if args.action == "import":
+            logger.info(f"Imported {store.import_jsonl(args.other)} entries into {args.history}")
+        elif args.action == "export":
+            logger.info(f"Exported {store.export_jsonl(args.other)} entries to {args.other}")
+        else:
+            store.reindex()
+            logger.info(f"Indexed {len(store)} keys in {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Unit tests for utils.history_store module."""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from utils.history_store import INDEX_SUFFIX, HistoryStore, HistoryWriter
+
+
+def _write(path: Path, *entries: dict, tail: str = "") -> None:
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries) + tail, encoding="utf-8")
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore class."""
+
+    def test_indexes_existing_jsonl(self, tmp_path: Path) -> None:
+        """Test that an existing history is indexed on first open."""
+        history = tmp_path / "history.jsonl"
+        _write(history, {"id": "a"}, {"id": "b"}, {"other": 1})
+
+        with HistoryStore(history, key="id") as store:
+            assert "a" in store
+            assert "c" not in store
+            assert store.keys() == {"a", "b"}
+        assert (tmp_path / ("history.jsonl" + INDEX_SUFFIX)).exists()
+
+    def test_index_is_created_lazily(self, tmp_path: Path) -> None:
+        """Test that no sidecar appears without a history file or with create_index off."""
+        history = tmp_path / "history.jsonl"
+        index = tmp_path / ("history.jsonl" + INDEX_SUFFIX)
+
+        with HistoryStore(history, key="id") as store:
+            assert "a" not in store
+            assert len(store) == 0
+        assert not index.exists()
+
+        _write(history, {"id": "a"})
+        with HistoryStore(history, key="id", create_index=False) as store:
+            assert "a" in store
+        assert not index.exists()
+
+        with HistoryStore(history, key="id") as store:
+            store.append({"id": "b"})
+        assert index.exists()
+
+    def test_only_new_lines_are_parsed(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that lines appended by other writers are picked up incrementally."""
+        history = tmp_path / "history.jsonl"
+        _write(history, {"id": "a"})
+        HistoryStore(history, key="id").close()
+        with open(history, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"id": "b"}) + "\n")
+
+        parsed = []
+        real_loads = json.loads
+        monkeypatch.setattr(json, "loads", lambda s: parsed.append(s) or real_loads(s))
+        with HistoryStore(history, key="id") as store:
+            assert store.keys() == {"a", "b"}
+        assert len(parsed) == 1
+
+    def test_replaced_file_is_reindexed(self, tmp_path: Path) -> None:
+        """Test that a rewritten history does not keep stale keys."""
+        history = tmp_path / "history.jsonl"
+        _write(history, {"id": "a"}, {"id": "b"})
+        HistoryStore(history, key="id").close()
+        _write(history, {"id": "zz"})
+
+        with HistoryStore(history, key="id") as store:
+            assert store.keys() == {"zz"}
+
+    def test_append_many_is_one_batch(self, tmp_path: Path) -> None:
+        """Test that batched appends land in the file and the index."""
+        history = tmp_path / "nested" / "history.jsonl"
+
+        with HistoryStore(history, key="title") as store:
+            assert store.append_many([{"title": "A [01]"}, {"title": "A [02]"}]) == 2
+            store.append({"title": "A [03]"})
+            assert len(store) == 3
+
+        lines = history.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["A [01]", "A [02]", "A [03]"]
+
+    def test_torn_last_line(self, tmp_path: Path) -> None:
+        """Test that a half-written line is skipped and does not corrupt the next append."""
+        history = tmp_path / "history.jsonl"
+        _write(history, {"id": "a"}, tail='{"id": "b')
+
+        with HistoryStore(history, key="id") as store:
+            store.append({"id": "c"})
+            assert store.keys() == {"a", "c"}
+
+        with HistoryStore(history, key="id") as store:
+            assert store.keys() == {"a", "c"}
+
+    def test_import_and_export(self, tmp_path: Path) -> None:
+        """Test importing only new keys and exporting only parseable entries."""
+        history = tmp_path / "history.jsonl"
+        _write(history, {"id": "a"}, tail="not json\n")
+        old = tmp_path / "old.jsonl"
+        _write(old, {"id": "a"}, {"id": "b"}, {"id": "b"})
+
+        with HistoryStore(history, key="id") as store:
+            assert store.import_jsonl(old) == 1
+            assert store.export_jsonl(tmp_path / "clean.jsonl") == 2
+
+        exported = (tmp_path / "clean.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in exported] == ["a", "b"]
+
+    def test_two_writers_on_one_file(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a store never skips lines another store appends to its file."""
+        history = tmp_path / "history.jsonl"
+        # Separate stores share no thread lock, like two processes on one history
+        first = HistoryStore(history, key="id")
+        second = HistoryStore(history, key="id")
+        sync = first._sync_locked
+
+        def sync_then_race() -> None:
+            sync()
+            # The other writer appends between our sync and our write
+            racer = threading.Thread(target=second.append, args=({"id": "second"},))
+            racer.start()
+            racer.join(timeout=0.2)
+            with open(history, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"id": "unlocked"}) + "\n")  # e.g. an older tool
+
+        monkeypatch.setattr(first, "_sync_locked", sync_then_race)
+        first.append({"id": "first"})
+        monkeypatch.undo()
+        second.append({"id": "third"})
+        first.close()
+        second.close()
+
+        with HistoryStore(history, key="id") as store:
+            assert store.keys() == {"first", "second", "third", "unlocked"}
+        assert len(history.read_text(encoding="utf-8").splitlines()) == 4
+
+
+class TestHistoryWriter:
+    """Tests for HistoryWriter class."""
+
+    def test_concurrent_puts_do_not_interleave(self, tmp_path: Path) -> None:
+        """Test that entries from many threads end up as whole, distinct lines."""
+        history = tmp_path / "history.jsonl"
+        with HistoryStore(history, key="title") as store:
+            with HistoryWriter(store) as writer:
+
+                def produce(thread: int) -> None:
+                    for n in range(50):
+                        writer.put({"title": f"T{thread} [{n:02}]", "pad": "x" * 500})
+
+                threads = [threading.Thread(target=produce, args=(t,)) for t in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+            assert len(store) == 400
+
+        lines = history.read_text(encoding="utf-8").splitlines()
+        assert len({json.loads(line)["title"] for line in lines}) == 400
+
+    def test_entries_are_group_committed(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that queued entries are written in batches with one fsync each."""
+        fsyncs = []
+        monkeypatch.setattr(os, "fsync", fsyncs.append)
+
+        with HistoryStore(tmp_path / "history.jsonl", key="id") as store:
+            writer = HistoryWriter(store, max_batch=10, max_delay=10)
+            for n in range(25):
+                writer.put({"id": str(n)})
+            writer.close()
+
+            assert len(store) == 25
+        assert len(fsyncs) == 3
+
+    def test_flush(self, tmp_path: Path) -> None:
+        """Test that flush returns once queued entries are on disk, without waiting max_delay."""
+        store = HistoryStore(tmp_path / "history.jsonl", key="id")
+        with store, HistoryWriter(store, max_delay=60) as writer:
+            writer.put({"id": "a"})
+            writer.flush()
+
+            assert "a" in store
@@ -108,6 +108,24 @@ def main():
         action="store_true",
         help="Automatically download any songs found in backup but not in the history file.",
     )
+    verify_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=YTMusicDLConfig.VERIFY_JOBS,
+        help=f"Processes reading audio tags in parallel (default: {YTMusicDLConfig.VERIFY_JOBS})",
+    )
+    verify_parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=YTMusicDLConfig.VERIFY_CHUNKSIZE,
+        help=f"Files handed to a worker process per batch (default: {YTMusicDLConfig.VERIFY_CHUNKSIZE})",
+    )
+    verify_parser.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Ignore cached IDs and read the tags of every file again.",
+    )
     verify_parser.set_defaults(func=verify_command)
 
     # --- Metadata Command (Extract ID) ---
@@ -115,6 +133,11 @@ def main():
         "extract-id", help="Extract YouTube ID from an audio file"
     )
     metadata_parser.add_argument("file_path", type=Path, help="Path to the audio file.")
+    metadata_parser.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Ignore the cached ID and read the file's tags again.",
+    )
     metadata_parser.set_defaults(func=metadata_command)
 
     # --- Migrate Command (Redownload from TXT) ---
@@ -1,4 +1,3 @@
-import json
 import logging
 import sys
 from datetime import datetime, timedelta
@@ -7,55 +6,16 @@ from zoneinfo import ZoneInfo
 
 import yt_dlp
 
+from utils.history_store import HistoryStore
 from ytmusic_dl.common.logger import logger
 from ytmusic_dl.common.utils import extract_artist
 
 HONG_KONG_TZ = ZoneInfo("Asia/Hong_Kong")
 
 
-def load_history(history_path: Path) -> set[str]:
-    """
-    Load previously downloaded video IDs from JSONL history file.
-
-    Args:
-        history_path: Path to JSONL history file
-
-    Returns:
-        Set of video IDs that have been downloaded
-    """
-    downloaded_ids = set()
-
-    if not history_path.exists():
-        return downloaded_ids
-
-    try:
-        with open(history_path, encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    entry = json.loads(line)
-                    downloaded_ids.add(entry["id"])
-    except Exception as e:
-        logger.warning(f"Error loading history file: {e}")
-
-    return downloaded_ids
-
-
-def append_to_history(history_path: Path, entry: dict):
-    """
-    Append a new download entry to JSONL history file.
-
-    Args:
-        history_path: Path to JSONL history file
-        entry: Dictionary containing download metadata
-    """
-    # Ensure directory exists
-    history_path.parent.mkdir(parents=True, exist_ok=True)
-
-    try:
-        with open(history_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-    except Exception as e:
-        logger.error(f"Failed to write to history file: {e}")
+def open_history(history_path: Path, create_index: bool = True) -> HistoryStore:
+    """Open the indexed history store for a JSONL history file, keyed by video ID."""
+    return HistoryStore(history_path, key="id", create_index=create_index)
 
 
 def get_video_info(url: str) -> list[dict]:
@@ -98,11 +58,17 @@ def download_command(args):
     # Ensure output directory exists
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Load history
+    # Load history; membership checks and appends go through its index
     logger.info(f"Loading history from {history_path}")
-    downloaded_ids = load_history(history_path)
-    if downloaded_ids:
-        logger.info(f"Found {len(downloaded_ids)} previously downloaded tracks")
+    with open_history(history_path, create_index=not args.dry_run) as history:
+        if len(history):
+            logger.info(f"Found {len(history)} previously downloaded tracks")
+        _download_videos(args, history)
+
+
+def _download_videos(args, history: HistoryStore):
+    """Resolve the URLs in args and download every video not yet in history."""
+    output_path = args.output
 
     # Get video information from all URLs
     all_videos = []
@@ -214,7 +180,7 @@ def download_command(args):
             title = video.get("title", "Unknown")
 
             # Check if already downloaded
-            if not args.force and video_id in downloaded_ids:
+            if not args.force and video_id in history:
                 logger.info(
                     f"[{idx}/{len(videos)}] Already downloaded, skipping: {artist} - {title}"
                 )
@@ -252,13 +218,6 @@ def download_command(args):
                     "upload_date": info.get("upload_date"),
                 }
 
-                # Append to history
-                append_to_history(history_path, entry)
-                downloaded_ids.add(video_id)
-
-                logger.info(f"✓ Downloaded: {artist} - {title}")
-                downloaded_count += 1
-
             except Exception as e:
                 logger.error(f"✗ Failed to download {video_id}: {e}")
                 failed_count += 1
@@ -267,6 +226,16 @@ def download_command(args):
                 # Exit immediately for single video
                 if not is_playlist:
                     sys.exit(1)
+                continue
+
+            # Append to history; a failed write does not undo the download
+            try:
+                history.append(entry)
+            except Exception as e:
+                logger.error(f"Failed to write to history file: {e}")
+
+            logger.info(f"✓ Downloaded: {artist} - {title}")
+            downloaded_count += 1
 
         # Print summary for playlists or dry-run
         if is_playlist or args.dry_run:
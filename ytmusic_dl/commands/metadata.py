@@ -1,12 +1,32 @@
+import sqlite3
 import sys
+from pathlib import Path
 
 from ytmusic_dl.commands.verify import extract_id_from_file
+from ytmusic_dl.common.id_cache import IDCache, file_signature
 from ytmusic_dl.common.logger import logger
 
 
+def _cached_id(file_path: Path, rebuild: bool) -> str | None:
+    """Look the file up in the ID cache, reading and caching its tags on a miss."""
+    path = file_path.resolve()
+    signature = file_signature(path)
+    with IDCache() as cache:
+        hit, video_id = cache.get(path, signature, scan_all=False)
+        if hit and not rebuild:
+            return video_id
+        video_id = extract_id_from_file(file_path, scan_all=False)
+        cache.put_many([(path, signature, video_id)], scan_all=False)
+    return video_id
+
+
 def metadata_command(args):
     """Main logic for the metadata command (extract-id)."""
-    video_id = extract_id_from_file(args.file_path, scan_all=False)
+    try:
+        video_id = _cached_id(args.file_path, args.rebuild_cache)
+    except (OSError, sqlite3.Error) as e:
+        logger.debug(f"ID cache not used for '{args.file_path}': {e}")
+        video_id = extract_id_from_file(args.file_path, scan_all=False)
 
     if video_id:
         logger.info("Success: Found YouTube ID.")
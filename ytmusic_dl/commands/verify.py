@@ -1,13 +1,28 @@
-import json
 import os
 import subprocess
 import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from mutagen import File as MutagenFile
 
+from ytmusic_dl.commands.download import open_history
+from ytmusic_dl.common.id_cache import IDCache, Signature
 from ytmusic_dl.common.logger import logger
+from ytmusic_dl.common.tag_reader import read_id_tags
 from ytmusic_dl.common.utils import YOUTUBE_ID_REGEX
+from ytmusic_dl.config import YTMusicDLConfig
+
+AUDIO_SUFFIXES = (".mp3", ".m4a")
+
+# Seconds between progress line updates
+PROGRESS_INTERVAL = 0.2
+
+# Results written to the ID cache per transaction, so an interrupted scan keeps its progress
+CACHE_BATCH = 500
 
 # --- List of keys to check for the ID, in order of priority ---
 ID_METADATA_KEYS = [
@@ -17,67 +32,84 @@ ID_METADATA_KEYS = [
     ("TXXX:comment", True),  # MP3 comment tag
     ("©cmt", True),  # M4A comment tag
 ]
+PRIORITY_KEYS = {key for key, _ in ID_METADATA_KEYS}
 
 
 def load_history_ids(history_path: Path) -> set[str]:
-    """Loads all video IDs from the JSONL history file into a set."""
-    downloaded_ids = set()
+    """Loads all video IDs from the JSONL history file (via its index) into a set."""
     if not history_path.exists():
         logger.warning(f"History file not found at '{history_path}'")
-        return downloaded_ids
-
-    with open(history_path, encoding="utf-8") as f:
-        for i, line in enumerate(f, 1):
-            if line.strip():
-                try:
-                    entry = json.loads(line)
-                    if "id" in entry:
-                        downloaded_ids.add(entry["id"])
-                except json.JSONDecodeError:
-                    logger.warning(f"Could not parse line {i} in history file.")
+        return set()
+
+    with open_history(history_path) as store:
+        downloaded_ids = store.keys()
     logger.info(f"Loaded {len(downloaded_ids)} unique IDs from history file.")
     return downloaded_ids
 
 
+def _tag_text(value) -> str:
+    """Text of a tag value; MP4 freeform values are bytes and must be decoded."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+def _id_from_priority_tags(tags) -> str | None:
+    """Look up ID_METADATA_KEYS, in order, in a mapping of tag key to value(s)."""
+    for key, use_regex in ID_METADATA_KEYS:
+        if key in tags:
+            value = tags[key]
+            text_content = _tag_text(value[0] if isinstance(value, list) else value)
+
+            if not use_regex:
+                # The tag directly contains the ID
+                return text_content.strip()
+
+            # The tag contains a URL that needs to be parsed
+            match = YOUTUBE_ID_REGEX.search(text_content)
+            if match:
+                return match.group(1)
+    return None
+
+
 def extract_id_from_file(file_path: Path, scan_all: bool) -> str | None:
     """
     Extracts a YouTube video ID from an audio file's metadata.
 
-    It first checks a prioritized list of common tags. If no ID is found,
-    and 'scan_all' is True, it performs a deep scan of all metadata tags.
+    It first checks a prioritized list of common tags, reading only those
+    tags (and skipping cover art) when the file allows it. If no ID is found,
+    and 'scan_all' is True, it performs a deep scan of all metadata tags
+    with mutagen.
     """
+    # 0. Fast path: read just the priority tags
+    tags = read_id_tags(file_path, PRIORITY_KEYS)
+    if tags is not None:
+        video_id = _id_from_priority_tags(tags)
+        if video_id or not scan_all:
+            return video_id
+
     try:
         audio_file = MutagenFile(file_path)
         if audio_file is None:
             return None
 
         # 1. Prioritized Scan
-        for key, use_regex in ID_METADATA_KEYS:
-            if key in audio_file:
-                value = audio_file[key]
-                text_content = str(value[0] if isinstance(value, list) else value)
-
-                if not use_regex:
-                    # The tag directly contains the ID
-                    return text_content.strip()
-
-                # The tag contains a URL that needs to be parsed
-                match = YOUTUBE_ID_REGEX.search(text_content)
-                if match:
-                    return match.group(1)
+        video_id = _id_from_priority_tags(audio_file)
+        if video_id:
+            return video_id
 
         # 2. Full Scan (if enabled and necessary)
         if scan_all:
             for key in audio_file:
                 # Skip keys we've already checked
-                if key in [k[0] for k in ID_METADATA_KEYS]:
+                if key in PRIORITY_KEYS:
                     continue
 
                 values = audio_file[key]
                 if not isinstance(values, list):
                     values = [values]
                 for value in values:
-                    text_content = str(value)
+                    text_content = _tag_text(value)
                     match = YOUTUBE_ID_REGEX.search(text_content)
                     if match:
                         return match.group(1)
@@ -88,6 +120,72 @@ def extract_id_from_file(file_path: Path, scan_all: bool) -> str | None:
     return None
 
 
+def scan_audio_files(root: Path, suffixes: tuple[str, ...] = AUDIO_SUFFIXES) -> list[Path]:
+    """Walk root once with os.scandir and return audio files with the given suffixes."""
+    found = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError as e:
+            logger.warning(f"Cannot scan '{directory}': {e}")
+    return sorted(found)
+
+
+def scan_ids(
+    files: list[Path],
+    scan_all: bool,
+    jobs: int = 1,
+    chunksize: int = YTMusicDLConfig.VERIFY_CHUNKSIZE,
+) -> Iterator[tuple[Path, str | None]]:
+    """
+    Yields (file, embedded ID or None) for every file, in order.
+
+    With jobs > 1 the mutagen parsing runs in a process pool; files are sent
+    to the workers in chunks of `chunksize` to keep the IPC overhead low.
+    """
+    extract = partial(extract_id_from_file, scan_all=scan_all)
+    if jobs <= 1:
+        yield from zip(files, map(extract, files), strict=True)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from zip(files, executor.map(extract, files, chunksize=chunksize), strict=True)
+
+
+def _read_ids(
+    stale: list[tuple[Path, Signature]], cache: IDCache, scan_all: bool, jobs: int, chunksize: int
+) -> dict[Path, str | None]:
+    """Read the tags of new or changed files, caching results in batches as they arrive."""
+    results = {}
+    batch = []
+    start = last_report = time.monotonic()
+    signatures = dict(stale)
+    for i, (file, embedded_id) in enumerate(
+        scan_ids(list(signatures), scan_all, jobs=jobs, chunksize=chunksize), 1
+    ):
+        results[file] = embedded_id
+        batch.append((file, signatures[file], embedded_id))
+        if len(batch) >= CACHE_BATCH:
+            cache.put_many(batch, scan_all)
+            batch.clear()
+
+        now = time.monotonic()
+        if now - last_report >= PROGRESS_INTERVAL or i == len(stale):
+            last_report = now
+            rate = i / max(now - start, 1e-9)
+            print(f"\rProcessed {i}/{len(stale)} files ({rate:.0f} files/s)", end="")
+
+    cache.put_many(batch, scan_all)
+    return results
+
+
 def download_missing_songs(missing_ids: list[str]):
     """
     Calls the download command to download a list of missing video IDs.
@@ -152,21 +250,36 @@ def verify_command(args):
         sys.exit(1)
 
     logger.info(f"Scanning for .mp3 and .m4a files in '{args.backup_dir}'...")
-    audio_files = list(args.backup_dir.glob("**/*.mp3")) + list(args.backup_dir.glob("**/*.m4a"))
+    backup_dir = args.backup_dir.resolve()  # absolute paths keep cache keys stable
+    audio_files = scan_audio_files(backup_dir)
 
     if not audio_files:
         logger.warning("No .mp3 or .m4a files found in the backup directory.")
         sys.exit(0)
 
+    jobs = max(1, args.jobs)
     logger.info(f"Found {len(audio_files)} audio files to check.")
 
+    start = time.monotonic()
+    with IDCache() as cache:
+        if args.rebuild_cache:
+            logger.info("Rebuilding the ID cache, every file will be read.")
+            cache.clear()
+        embedded_ids, stale = cache.partition(audio_files, args.scan_all)
+        logger.info(
+            f"{len(embedded_ids)} files unchanged since the last run, "
+            f"reading tags of {len(stale)} with {jobs} job(s)."
+        )
+        embedded_ids.update(_read_ids(stale, cache, args.scan_all, jobs, args.chunksize))
+        cache.prune(backup_dir, audio_files)
+
     missing_files = {}
     files_without_id = []
 
-    for i, file in enumerate(audio_files, 1):
-        print(f"\rProcessing file {i}/{len(audio_files)}: {file.name.ljust(80)}", end="")
-        embedded_id = extract_id_from_file(file, args.scan_all)
-
+    for file in audio_files:
+        if file not in embedded_ids:
+            continue  # removed during the scan
+        embedded_id = embedded_ids[file]
         if embedded_id:
             if embedded_id not in history_ids:
                 missing_files[embedded_id] = file.name
@@ -176,7 +289,7 @@ def verify_command(args):
     # Final summary
     print("\r" + " " * 120 + "\r", end="")
     logger.info("=" * 50)
-    logger.info("Verification Complete.")
+    logger.info(f"Verification Complete in {time.monotonic() - start:.1f}s.")
     logger.info("=" * 50)
 
     if missing_files:
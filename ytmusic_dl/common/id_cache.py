@@ -0,0 +1,159 @@
+"""Persistent cache of YouTube IDs extracted from audio files."""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from ytmusic_dl.config import YTMusicDLConfig
+
+# (size, mtime_ns, inode): any change means the tags must be read again
+Signature = tuple[int, int, int]
+
+
+def file_signature(path: Path) -> Signature:
+    """Return the (size, mtime_ns, inode) signature of a file."""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+class IDCache:
+    """SQLite-backed map of (path, size, mtime, inode) to the embedded YouTube ID.
+
+    "No ID" results are cached too. Because a deep scan (--scan-all) can find
+    an ID that the quick scan missed, a cached "no ID" from a quick scan does
+    not answer a deep scan; a cached ID answers both.
+
+    The database is only created on the first write, so lookups against a
+    cache that does not exist yet leave nothing behind.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Open the cache database, if it exists; it is created on the first write.
+
+        Args:
+            path: SQLite file (default: YTMUSIC_DL_ID_CACHE, under TEMP_DIRECTORY)
+        """
+        self.path = Path(path or YTMusicDLConfig.ID_CACHE_FILE)
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+    def __enter__(self) -> "IDCache":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, path: Path, signature: Signature, scan_all: bool) -> tuple[bool, str | None]:
+        """Return (hit, video_id) for a file with the given signature."""
+        rows = self._select(
+            "SELECT size, mtime_ns, inode, scan_all, video_id FROM files WHERE path = ?",
+            (str(path),),
+        )
+        return self._answer(rows[0] if rows else None, signature, scan_all)
+
+    def partition(
+        self, files: Iterable[Path], scan_all: bool
+    ) -> tuple[dict[Path, str | None], list[tuple[Path, Signature]]]:
+        """Split files into cached results and (file, signature) pairs that must be read.
+
+        Returns:
+            ({file: cached ID or None}, [(file, signature), ...] for new or changed files)
+        """
+        rows = {
+            row[0]: row[1:]
+            for row in self._select(
+                "SELECT path, size, mtime_ns, inode, scan_all, video_id FROM files"
+            )
+        }
+
+        cached, stale = {}, []
+        for file in files:
+            try:
+                signature = file_signature(file)
+            except OSError:
+                continue  # removed since the directory walk
+            hit, video_id = self._answer(rows.get(str(file)), signature, scan_all)
+            if hit:
+                cached[file] = video_id
+            else:
+                stale.append((file, signature))
+        return cached, stale
+
+    def put_many(self, results: Iterable[tuple[Path, Signature, str | None]], scan_all: bool):
+        """Store (file, signature, video_id or None) results in one transaction."""
+        rows = [
+            (str(file), *signature, int(scan_all), video_id)
+            for file, signature, video_id in results
+        ]
+        if not rows:
+            return
+        with self._lock:
+            db = self._connect(create=True)
+            with db:
+                db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def prune(self, root: Path, keep: Iterable[Path]):
+        """Forget cached files under root that are not in keep (deleted or renamed)."""
+        prefix = os.path.join(str(root), "")
+        keep = {str(file) for file in keep}
+        with self._lock:
+            db = self._connect(create=False)
+            if db is None:
+                return
+            with db:
+                gone = [
+                    (path,)
+                    for (path,) in db.execute(
+                        "SELECT path FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+                    )
+                    if path not in keep
+                ]
+                db.executemany("DELETE FROM files WHERE path = ?", gone)
+
+    def clear(self):
+        """Drop every cached result (--rebuild-cache)."""
+        with self._lock:
+            db = self._connect(create=False)
+            if db is not None:
+                with db:
+                    db.execute("DELETE FROM files")
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _select(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a query, returning no rows if the database does not exist yet."""
+        with self._lock:
+            db = self._connect(create=False)
+            return db.execute(sql, params).fetchall() if db else []
+
+    def _connect(self, create: bool) -> sqlite3.Connection | None:
+        """Return the open database, opening it if it exists or create is set."""
+        if self._db is None and (create or self.path.exists()):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+                "inode INTEGER NOT NULL, scan_all INTEGER NOT NULL, video_id TEXT)"
+            )
+            db.commit()
+            self._db = db
+        return self._db
+
+    @staticmethod
+    def _answer(row, signature: Signature, scan_all: bool) -> tuple[bool, str | None]:
+        if row is None or tuple(row[:3]) != signature:
+            return False, None
+        cached_scan_all, video_id = row[3:]
+        if video_id is None and scan_all and not cached_scan_all:
+            return False, None
+        return True, video_id
@@ -0,0 +1,212 @@
+"""
+Minimal-read tag extraction for the ID keys in verify.ID_METADATA_KEYS.
+
+mutagen parses every tag in a file, including the embedded thumbnail that
+yt-dlp's EmbedThumbnail adds (often hundreds of KB). To find a YouTube ID
+we only need a few text tags, so this module walks the ID3v2 frame headers
+or the MP4 box tree with seeks, reads just the TXXX frames or the ilst items
+of interest, and skips APIC/covr payloads without reading them.
+
+Anything unusual (ID3v2.2, unsynchronised or compressed frames, files that
+are neither ID3-tagged MP3 nor MP4) makes read_id_tags return None, and the
+caller falls back to mutagen.
+"""
+
+import struct
+from typing import BinaryIO
+
+# ID3 text encodings: (codec, terminator)
+_ID3_ENCODINGS = {
+    0: ("latin-1", b"\x00"),
+    1: ("utf-16", b"\x00\x00"),
+    2: ("utf-16-be", b"\x00\x00"),
+    3: ("utf-8", b"\x00"),
+}
+
+# MP4 boxes on the path to the iTunes metadata list
+_MP4_PATH = (b"moov", b"udta", b"meta", b"ilst")
+
+# Largest TXXX frame or ilst item read into memory; ID tags are tiny
+_MAX_TAG_BYTES = 64 * 1024
+
+
+class _Unsupported(Exception):
+    """The file needs the full mutagen parser."""
+
+
+def read_id_tags(path, keys: set[str]) -> dict[str, str] | None:
+    """Read the text of the given mutagen-style keys from an MP3 or M4A file.
+
+    Args:
+        path: Audio file
+        keys: mutagen keys to look for, e.g. {'TXXX:youtube_id', '©cmt',
+            '----:com.apple.iTunes:youtube_id'}
+
+    Returns:
+        {key: text} for the keys present (empty if none are), or None if the
+        file cannot be handled here and mutagen should be used instead
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(12)
+            if head[:3] == b"ID3":
+                return _read_id3(f, keys)
+            if head[4:8] == b"ftyp":
+                return _read_mp4(f, keys)
+    except (OSError, struct.error, UnicodeDecodeError, _Unsupported):
+        pass
+    return None
+
+
+def _syncsafe(data: bytes) -> int:
+    if any(byte & 0x80 for byte in data):
+        raise _Unsupported("not a syncsafe integer")
+    return data[0] << 21 | data[1] << 14 | data[2] << 7 | data[3]
+
+
+def _read_id3(f: BinaryIO, keys: set[str]) -> dict[str, str]:
+    f.seek(0)
+    header = f.read(10)
+    major, flags = header[3], header[5]
+    if major not in (3, 4) or flags & 0x80:  # v2.2 or whole-tag unsynchronisation
+        raise _Unsupported(f"ID3v2.{major} flags {flags:#x}")
+    end = 10 + _syncsafe(header[6:10])
+
+    if flags & 0x40:  # extended header
+        size = f.read(4)
+        f.seek(struct.unpack(">I", size)[0] if major == 3 else _syncsafe(size) - 4, 1)
+
+    wanted = {key[len("TXXX:") :] for key in keys if key.startswith("TXXX:")}
+    found = {}
+    while f.tell() + 10 <= end:
+        frame_header = f.read(10)
+        frame_id = frame_header[:4]
+        if frame_id == b"\x00\x00\x00\x00":
+            break  # padding
+        if not frame_id.isalnum():
+            raise _Unsupported(f"bad frame id {frame_id!r}")
+        size_bytes = frame_header[4:8]
+        size = _syncsafe(size_bytes) if major == 4 else struct.unpack(">I", size_bytes)[0]
+        if f.tell() + size > end:
+            raise _Unsupported("frame overruns the tag")
+
+        if frame_id != b"TXXX" or not wanted or size > _MAX_TAG_BYTES:
+            f.seek(size, 1)  # APIC and everything else are skipped unread
+            continue
+
+        format_flags = frame_header[9]
+        # grouping, compression, encryption, unsynchronisation or a data length indicator
+        if format_flags & (0x4F if major == 4 else 0xE0):
+            raise _Unsupported("encoded TXXX frame")
+        description, text = _parse_txxx(f.read(size))
+        if description in wanted and f"TXXX:{description}" not in found:
+            found[f"TXXX:{description}"] = text
+    return found
+
+
+def _parse_txxx(data: bytes) -> tuple[str, str]:
+    """Return (description, text) of a TXXX frame body, values joined like mutagen."""
+    codec, terminator = _ID3_ENCODINGS.get(data[0], (None, None))
+    if codec is None:
+        raise _Unsupported(f"unknown text encoding {data[0]}")
+    parts = _split(data[1:], terminator)
+    description = parts[0].decode(codec) if parts else ""
+    values = [part.decode(codec) for part in parts[1:]]
+    return description, "\x00".join(values)
+
+
+def _split(data: bytes, terminator: bytes) -> list[bytes]:
+    """Split on a terminator that, for UTF-16, must sit on a character boundary."""
+    step = len(terminator)
+    parts, start = [], 0
+    index = data.find(terminator)
+    while index != -1:
+        if (index - start) % step:
+            index = data.find(terminator, index + 1)
+            continue
+        parts.append(data[start:index])
+        start = index + step
+        index = data.find(terminator, start)
+    if start < len(data):
+        parts.append(data[start:])
+    return parts
+
+
+def _boxes(f: BinaryIO, end: int):
+    """Yield (type, payload start, box end) for the boxes between f.tell() and end."""
+    while f.tell() + 8 <= end:
+        start = f.tell()
+        size, box_type = struct.unpack(">I4s", f.read(8))
+        payload = start + 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            payload += 8
+        elif size == 0:
+            size = end - start
+        if size < payload - start or start + size > end:
+            raise _Unsupported(f"bad {box_type!r} box size")
+        yield box_type, payload, start + size
+        f.seek(start + size)
+
+
+def _find_box(f: BinaryIO, box_type: bytes, end: int) -> tuple[int, int] | None:
+    for found_type, payload, box_end in _boxes(f, end):
+        if found_type == box_type:
+            return payload, box_end
+    return None
+
+
+def _read_mp4(f: BinaryIO, keys: set[str]) -> dict[str, str]:
+    f.seek(0, 2)
+    end = f.tell()
+    f.seek(0)
+    for box_type in _MP4_PATH:
+        span = _find_box(f, box_type, end)
+        if span is None:
+            return {}
+        start, end = span
+        f.seek(start)
+        if box_type == b"meta" and f.read(8)[4:8] != b"hdlr":
+            start += 4  # iTunes meta is a full box; QuickTime's has no version/flags
+        f.seek(start)
+
+    found = {}
+    for item_type, payload, item_end in _boxes(f, end):
+        if item_type == b"covr" or item_end - payload > _MAX_TAG_BYTES:
+            continue  # cover art (and anything large) is skipped unread
+        if item_type == b"----":
+            key, value = _read_freeform(f, payload, item_end)
+        else:
+            key = item_type.decode("latin-1")
+            value = _read_data(f, payload, item_end)
+        if key in keys and value is not None and key not in found:
+            found[key] = value
+    return found
+
+
+def _read_freeform(f: BinaryIO, start: int, end: int) -> tuple[str, str | None]:
+    """Read a '----' item as ('----:mean:name', first data value)."""
+    f.seek(start)
+    names, value = {}, None
+    for box_type, payload, box_end in _boxes(f, end):
+        f.seek(payload + 4)  # version and flags
+        if box_type in (b"mean", b"name"):
+            names[box_type] = f.read(box_end - payload - 4).decode("utf-8")
+        elif box_type == b"data" and value is None:
+            f.seek(payload + 8)  # type indicator and locale
+            value = f.read(box_end - payload - 8).decode("utf-8")
+    return f"----:{names.get(b'mean', '')}:{names.get(b'name', '')}", value
+
+
+def _read_data(f: BinaryIO, start: int, end: int) -> str | None:
+    """Read the first UTF-8 'data' value of an ilst item."""
+    f.seek(start)
+    for box_type, payload, box_end in _boxes(f, end):
+        if box_type == b"data":
+            f.seek(payload)
+            type_indicator = struct.unpack(">I", f.read(4))[0] & 0xFFFFFF
+            if type_indicator != 1:
+                return None  # not UTF-8 text
+            f.seek(payload + 8)
+            return f.read(box_end - payload - 8).decode("utf-8")
+    return None
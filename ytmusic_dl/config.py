@@ -15,3 +15,12 @@ class YTMusicDLConfig(BaseConfig):
             "/mnt/e/jerry/Documents/PythonScripts/yt-dlp_related/ytmusic_downloaded.jsonl",
         )
     )
+
+    # verify: processes reading tags, and files sent to a process per batch
+    VERIFY_JOBS = int(os.getenv("YTMUSIC_DL_VERIFY_JOBS", os.cpu_count() or 1))
+    VERIFY_CHUNKSIZE = int(os.getenv("YTMUSIC_DL_VERIFY_CHUNKSIZE", 64))
+
+    # Cache of IDs read from audio tags, keyed by path, size, mtime and inode
+    ID_CACHE_FILE = Path(
+        os.getenv("YTMUSIC_DL_ID_CACHE", BaseConfig.TEMP_DIRECTORY / "ytmusic_dl_id_cache.sqlite3")
+    )
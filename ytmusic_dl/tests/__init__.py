@@ -0,0 +1 @@
+"""Test package for ytmusic_dl."""
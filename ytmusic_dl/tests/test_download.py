@@ -0,0 +1,68 @@
+"""Unit tests for ytmusic_dl download command."""
+
+from argparse import Namespace
+from pathlib import Path
+
+from utils.history_store import INDEX_SUFFIX, HistoryStore
+from ytmusic_dl.commands import download
+
+
+class FakeYoutubeDL:
+    """Stand-in for yt_dlp.YoutubeDL that 'downloads' without the network."""
+
+    def __init__(self, options: dict):
+        self.options = options
+
+    def __enter__(self) -> "FakeYoutubeDL":
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def extract_info(self, url: str, download: bool = True) -> dict:
+        if not download:
+            return {"id": "dQw4w9WgXcQ", "title": "Song", "artist": "Artist"}
+        return {"requested_downloads": [{"filepath": "Artist - Song.m4a"}], "duration": 60}
+
+
+def _args(tmp_path: Path, **overrides) -> Namespace:
+    args = Namespace(
+        urls=["https://music.youtube.com/watch?v=dQw4w9WgXcQ"],
+        output=tmp_path / "music",
+        history=tmp_path / "history.jsonl",
+        audio_format="best",
+        quality="bestaudio",
+        no_thumbnail=True,
+        no_metadata=True,
+        force=False,
+        dry_run=False,
+    )
+    vars(args).update(overrides)
+    return args
+
+
+class TestDownloadCommand:
+    """Tests for download_command function."""
+
+    def test_history_write_failure_is_not_a_failed_download(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test that a failed history append is logged and the download still counts."""
+        monkeypatch.setattr(download.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+
+        def fail(self, entry):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(HistoryStore, "append", fail)
+
+        download.download_command(_args(tmp_path))  # would sys.exit(1) on failure
+
+    def test_dry_run_creates_no_index(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that --dry-run reads the history without creating its sidecar index."""
+        monkeypatch.setattr(download.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+        history = tmp_path / "history.jsonl"
+        history.write_text('{"id": "other"}\n', encoding="utf-8")
+
+        download.download_command(_args(tmp_path, dry_run=True))
+
+        assert not (tmp_path / ("history.jsonl" + INDEX_SUFFIX)).exists()
@@ -0,0 +1,140 @@
+"""Unit tests for ytmusic_dl ID cache."""
+
+import os
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from ytmusic_dl.commands import metadata, verify
+from ytmusic_dl.common.id_cache import IDCache, file_signature
+from ytmusic_dl.config import YTMusicDLConfig
+from ytmusic_dl.tests.test_verify import _mp3
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    with IDCache(tmp_path / "ids.sqlite3") as cache:
+        yield cache
+
+
+class TestIDCache:
+    """Tests for IDCache class."""
+
+    def test_changed_file_misses(self, tmp_path: Path, cache: IDCache) -> None:
+        """Test that a cached result only holds while size, mtime and inode are unchanged."""
+        song = _mp3(tmp_path / "song.mp3", "dQw4w9WgXcQ")
+        cache.put_many([(song, file_signature(song), "dQw4w9WgXcQ")], scan_all=False)
+
+        assert cache.get(song, file_signature(song), scan_all=False) == (True, "dQw4w9WgXcQ")
+
+        stat = song.stat()
+        os.utime(song, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.get(song, file_signature(song), scan_all=False) == (False, None)
+
+    def test_quick_scan_miss_does_not_answer_deep_scan(
+        self, tmp_path: Path, cache: IDCache
+    ) -> None:
+        """Test that "no ID" from a quick scan is re-read for --scan-all, but not vice versa."""
+        song = _mp3(tmp_path / "song.mp3")
+        signature = file_signature(song)
+        cache.put_many([(song, signature, None)], scan_all=False)
+
+        assert cache.get(song, signature, scan_all=False) == (True, None)
+        assert cache.get(song, signature, scan_all=True) == (False, None)
+
+        cache.put_many([(song, signature, None)], scan_all=True)
+        assert cache.get(song, signature, scan_all=False) == (True, None)
+
+    def test_prune_forgets_removed_files(self, tmp_path: Path, cache: IDCache) -> None:
+        """Test that prune drops entries under root that no longer exist."""
+        kept, removed = _mp3(tmp_path / "a.mp3"), _mp3(tmp_path / "b.mp3")
+        cache.put_many(
+            [(kept, file_signature(kept), None), (removed, file_signature(removed), None)],
+            scan_all=False,
+        )
+
+        cache.prune(tmp_path, [kept])
+
+        cached, stale = cache.partition([kept, removed], scan_all=False)
+        assert list(cached) == [kept]
+        assert [file for file, _ in stale] == [removed]
+
+    def test_lookups_do_not_create_database(self, tmp_path: Path) -> None:
+        """Test that the database file only appears on the first write."""
+        song = _mp3(tmp_path / "song.mp3", "dQw4w9WgXcQ")
+        with IDCache(tmp_path / "ids.sqlite3") as cache:
+            assert cache.get(song, file_signature(song), scan_all=False) == (False, None)
+            assert cache.partition([song], scan_all=False) == ({}, [(song, file_signature(song))])
+            cache.prune(tmp_path, [])
+            assert not cache.path.exists()
+
+            cache.put_many([(song, file_signature(song), "dQw4w9WgXcQ")], scan_all=False)
+            assert cache.path.exists()
+
+
+class TestMetadataCommand:
+    """Tests for extract-id with the ID cache."""
+
+    def test_missing_file_exits_with_error(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a missing file is reported as having no ID, without creating the cache."""
+        monkeypatch.setattr(YTMusicDLConfig, "ID_CACHE_FILE", tmp_path / "ids.sqlite3")
+
+        with pytest.raises(SystemExit) as exc:
+            metadata.metadata_command(
+                Namespace(file_path=tmp_path / "missing.mp3", rebuild_cache=False)
+            )
+
+        assert exc.value.code == 1
+        assert not (tmp_path / "ids.sqlite3").exists()
+
+    def test_found_id_is_cached(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a second lookup is answered from the cache."""
+        monkeypatch.setattr(YTMusicDLConfig, "ID_CACHE_FILE", tmp_path / "ids.sqlite3")
+        song = _mp3(tmp_path / "song.mp3", "dQw4w9WgXcQ")
+        args = Namespace(file_path=song, rebuild_cache=False)
+
+        metadata.metadata_command(args)
+        monkeypatch.setattr(metadata, "extract_id_from_file", lambda *_: None)
+        metadata.metadata_command(args)
+
+
+class TestVerifyUsesCache:
+    """Tests that verify only reads new or changed files."""
+
+    def test_second_run_reads_nothing(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that an unchanged library is answered from the cache, and --rebuild-cache reads all."""
+        backup = tmp_path / "backup"
+        for n in range(5):
+            _mp3(backup / f"{n}.mp3", f"id{n:09}")
+        monkeypatch.setattr(YTMusicDLConfig, "ID_CACHE_FILE", tmp_path / "ids.sqlite3")
+
+        reads = []
+        real_extract = verify.extract_id_from_file
+        monkeypatch.setattr(
+            verify,
+            "extract_id_from_file",
+            lambda f, scan_all: reads.append(f) or real_extract(f, scan_all),
+        )
+        args = Namespace(
+            history=tmp_path / "history.jsonl",
+            backup_dir=backup,
+            scan_all=False,
+            jobs=1,
+            chunksize=4,
+            rebuild_cache=False,
+            download_missing=False,
+        )
+
+        verify.verify_command(args)
+        assert len(reads) == 5
+
+        reads.clear()
+        _mp3(backup / "new.mp3", "idnew000001")
+        verify.verify_command(args)
+        assert reads == [(backup / "new.mp3").resolve()]
+
+        reads.clear()
+        args.rebuild_cache = True
+        verify.verify_command(args)
+        assert len(reads) == 6
@@ -0,0 +1,111 @@
+"""Unit tests for ytmusic_dl minimal-read tag extraction."""
+
+import struct
+from pathlib import Path
+
+from mutagen.id3 import APIC, ID3, TIT2, TXXX
+
+from ytmusic_dl.commands.verify import PRIORITY_KEYS, extract_id_from_file
+from ytmusic_dl.common.tag_reader import read_id_tags
+
+from .test_verify import _mp3
+
+COVER = b"\xff\xd8" + b"\x00" * 300_000
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _data(value: bytes, type_indicator: int = 1) -> bytes:
+    return _box(b"data", struct.pack(">II", type_indicator, 0) + value)
+
+
+def _m4a(path: Path, items: list[bytes]) -> Path:
+    """Write an M4A skeleton whose moov/udta/meta/ilst holds the given items."""
+    ilst = _box(b"ilst", b"".join(items))
+    meta = _box(b"meta", b"\x00\x00\x00\x00" + _box(b"hdlr", b"\x00" * 25) + ilst)
+    moov = _box(b"moov", _box(b"mvhd", b"\x00" * 100) + _box(b"udta", meta))
+    path.write_bytes(_box(b"ftyp", b"M4A \x00\x00\x00\x00") + moov + _box(b"mdat", b"\x00" * 64))
+    return path
+
+
+def _freeform(name: str, value: str) -> bytes:
+    return _box(
+        b"----",
+        _box(b"mean", b"\x00" * 4 + b"com.apple.iTunes")
+        + _box(b"name", b"\x00" * 4 + name.encode())
+        + _data(value.encode()),
+    )
+
+
+class TestReadIdTags:
+    """Tests for read_id_tags function."""
+
+    def test_mp3_skips_cover_art(self, tmp_path: Path) -> None:
+        """Test that TXXX frames after a large APIC are read and match mutagen."""
+        path = _mp3(tmp_path / "song.mp3")
+        tags = ID3()
+        tags.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="", data=COVER))
+        tags.add(TIT2(encoding=3, text=["Title"]))
+        tags.add(TXXX(encoding=1, desc="youtube_id", text=["dQw4w9WgXcQ"]))
+        tags.save(path)
+
+        found = read_id_tags(path, PRIORITY_KEYS)
+
+        assert found == {"TXXX:youtube_id": "dQw4w9WgXcQ"}
+        assert found["TXXX:youtube_id"] == str(ID3(path)["TXXX:youtube_id"])
+
+    def test_mp3_without_id_tags(self, tmp_path: Path) -> None:
+        """Test that an ID3 tag without the keys yields an empty result, not a fallback."""
+        path = _mp3(tmp_path / "song.mp3")
+        tags = ID3()
+        tags.add(TIT2(encoding=3, text=["Title"]))
+        tags.save(path)
+
+        assert read_id_tags(path, PRIORITY_KEYS) == {}
+
+    def test_m4a_freeform_and_comment(self, tmp_path: Path) -> None:
+        """Test that ilst freeform and ©cmt items are read while covr is skipped."""
+        path = _m4a(
+            tmp_path / "song.m4a",
+            [
+                _box(b"covr", _data(COVER, type_indicator=13)),
+                _box(b"\xa9cmt", _data(b"https://www.youtube.com/watch?v=dQw4w9WgXcQ")),
+                _freeform("youtube_id", "dQw4w9WgXcQ"),
+            ],
+        )
+
+        assert read_id_tags(path, PRIORITY_KEYS) == {
+            "----:com.apple.iTunes:youtube_id": "dQw4w9WgXcQ",
+            "©cmt": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        }
+
+    def test_unsupported_files_fall_back(self, tmp_path: Path) -> None:
+        """Test that untagged or unknown files return None so mutagen is used."""
+        untagged = _mp3(tmp_path / "untagged.mp3")
+        (tmp_path / "junk.mp3").write_bytes(b"not audio")
+
+        assert read_id_tags(untagged, PRIORITY_KEYS) is None
+        assert read_id_tags(tmp_path / "junk.mp3", PRIORITY_KEYS) is None
+        assert read_id_tags(tmp_path / "missing.mp3", PRIORITY_KEYS) is None
+
+
+class TestExtractIdFromFile:
+    """Tests for extract_id_from_file using the fast path."""
+
+    def test_m4a_comment_url(self, tmp_path: Path) -> None:
+        """Test that a YouTube URL in ©cmt yields the video ID."""
+        path = _m4a(
+            tmp_path / "song.m4a",
+            [_box(b"\xa9cmt", _data(b"https://youtu.be/dQw4w9WgXcQ"))],
+        )
+
+        assert extract_id_from_file(path, scan_all=False) == "dQw4w9WgXcQ"
+
+    def test_mp3_fast_path_matches_mutagen(self, tmp_path: Path) -> None:
+        """Test that the fast path and the mutagen fallback agree on an MP3."""
+        path = _mp3(tmp_path / "song.mp3", "dQw4w9WgXcQ")
+
+        assert extract_id_from_file(path, scan_all=False) == "dQw4w9WgXcQ"
+        assert extract_id_from_file(path, scan_all=True) == "dQw4w9WgXcQ"
@@ -0,0 +1,55 @@
+"""Unit tests for ytmusic_dl verify command."""
+
+from pathlib import Path
+
+from mutagen.id3 import ID3, TXXX
+
+from ytmusic_dl.commands.verify import scan_audio_files, scan_ids
+
+# A silent MPEG-1 Layer III frame, repeated so mutagen recognises the file as MP3
+MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+
+def _mp3(path: Path, video_id: str | None = None) -> Path:
+    """Write a tiny MP3, optionally tagged with a youtube_id TXXX frame."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(MP3_FRAME * 20)
+    if video_id:
+        tags = ID3()
+        tags.add(TXXX(encoding=3, desc="youtube_id", text=[video_id]))
+        tags.save(path)
+    return path
+
+
+class TestScanAudioFiles:
+    """Tests for scan_audio_files function."""
+
+    def test_single_walk_finds_nested_audio(self, tmp_path: Path) -> None:
+        """Test that mp3/m4a files are found at any depth, case-insensitively."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        for name in ["top.mp3", "a/song.M4A", "a/b/deep.mp3", "a/cover.jpg", "a/b/notes.txt"]:
+            (tmp_path / name).touch()
+
+        found = scan_audio_files(tmp_path)
+
+        assert found == sorted(
+            [tmp_path / "top.mp3", tmp_path / "a" / "song.M4A", tmp_path / "a" / "b" / "deep.mp3"]
+        )
+
+
+class TestScanIds:
+    """Tests for scan_ids function."""
+
+    def test_serial_and_parallel_agree(self, tmp_path: Path) -> None:
+        """Test that the process pool yields the same ordered results as the serial path."""
+        files = [_mp3(tmp_path / f"{n:02}.mp3", f"id{n:09}" if n % 3 else None) for n in range(12)]
+        (tmp_path / "broken.mp3").write_bytes(b"not audio")
+        files.append(tmp_path / "broken.mp3")
+
+        serial = list(scan_ids(files, scan_all=False, jobs=1))
+        parallel = list(scan_ids(files, scan_all=False, jobs=2, chunksize=4))
+
+        assert parallel == serial
+        assert serial[1] == (files[1], "id000000001")
+        assert serial[0] == (files[0], None)
+        assert serial[-1] == (files[-1], None)